@@ -949,6 +949,21 @@ async def lifespan(app: FastAPI):
         await vs_mod.close()
     except Exception:
         pass
+    try:
+        from .models import chatgpt as chatgpt_mod
+        await chatgpt_mod.close()
+    except Exception:
+        pass
+    try:
+        from . import ntfy as ntfy_mod
+        await ntfy_mod.close()
+    except Exception:
+        pass
+    try:
+        from . import outlook as outlook_mod
+        await outlook_mod.close()
+    except Exception:
+        pass
 
 
 app = FastAPI(title="Conduit", lifespan=lifespan)
@@ -1489,12 +1504,12 @@ async def api_health():
 
 @app.get("/api/conversations")
 async def api_conversations():
-    return await db.list_conversations()
+    return db.as_dicts(await db.list_conversations())
 
 
 @app.get("/api/conversations/{cid}/messages")
 async def api_messages(cid: str):
-    return await db.get_messages(cid)
+    return db.as_dicts(await db.get_messages(cid))
 
 
 @app.post("/api/conversations")
@@ -1955,8 +1970,8 @@ async def api_set_ntfy(body: dict, _admin=Depends(require_admin)):
 
 @app.get("/api/settings/usage")
 async def api_get_usage():
-    daily = await db.get_usage_by_provider(days=1)
-    weekly = await db.get_usage_by_provider(days=7)
+    daily = db.as_dicts(await db.get_usage_by_provider(days=1))
+    weekly = db.as_dicts(await db.get_usage_by_provider(days=7))
     opus_today = await db.get_daily_opus_tokens()
     return {
         "daily": daily,
@@ -55,6 +55,9 @@ DEDUP_THRESHOLD = memory_cfg.get("dedup_threshold", 0.9)
 BM25_ENABLED = memory_cfg.get("bm25_enabled", False)
 BM25_DB_PATH = memory_cfg.get("bm25_db_path", "~/conduit-data/memory_index.db")
 HYBRID_TOP_K = memory_cfg.get("hybrid_top_k", 10)
+EMBED_CONCURRENCY = memory_cfg.get("embed_concurrency", 5)
+EXTRACTION_MIN_USER_CHARS = memory_cfg.get("extraction_min_user_chars", 20)
+EXTRACTION_MIN_ASSISTANT_CHARS = memory_cfg.get("extraction_min_assistant_chars", 40)
 
 # Indexer
 indexer_cfg = _raw.get("indexer", {})
@@ -69,6 +72,7 @@ ACTIVE_HOURS = scheduler_cfg.get("active_hours", [7, 22])
 HEARTBEAT_INTERVAL = scheduler_cfg.get("heartbeat_interval_minutes", 15)
 IDLE_CHECKIN_MINUTES = scheduler_cfg.get("idle_checkin_minutes", 120)
 REMINDER_CHECK_MINUTES = scheduler_cfg.get("reminder_check_minutes", 5)
+PROVIDER_BACKOFF_SECONDS = scheduler_cfg.get("provider_backoff_seconds", 600)
 
 # Tools
 tools_cfg = _raw.get("tools", {})
@@ -202,9 +206,11 @@ def reload():
     global COMPLEXITY_THRESHOLD, LONG_CONTEXT_CHARS, HAIKU_BAND
     global MAX_MEMORIES, SUMMARY_THRESHOLD, EXTRACTION_ENABLED
     global EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, SEARCH_TOP_K, IMPORTANCE_FLOOR, DEDUP_THRESHOLD
-    global BM25_ENABLED, BM25_DB_PATH, HYBRID_TOP_K
+    global BM25_ENABLED, BM25_DB_PATH, HYBRID_TOP_K, EMBED_CONCURRENCY
+    global EXTRACTION_MIN_USER_CHARS, EXTRACTION_MIN_ASSISTANT_CHARS
     global INDEXER_ENABLED, INDEXER_OUTPUT_DIR, INDEXER_PROJECTS
     global TIMEZONE, ACTIVE_HOURS, HEARTBEAT_INTERVAL, IDLE_CHECKIN_MINUTES, REMINDER_CHECK_MINUTES
+    global PROVIDER_BACKOFF_SECONDS
     global TOOLS_ENABLED, MAX_AGENT_TURNS, COMMAND_TIMEOUT, ALLOWED_DIRECTORIES, AUTO_APPROVE_READS, AUTO_APPROVE_ALL
     global AGENTS_LIST, AGENTS_COMMS, BINDINGS_LIST
     global SKILL_GROCERY_ENABLED, SKILL_EXPENSES_ENABLED, SKILL_CALENDAR_ENABLED
@@ -265,6 +271,9 @@ def reload():
     BM25_ENABLED = mem.get("bm25_enabled", False)
     BM25_DB_PATH = mem.get("bm25_db_path", "~/conduit-data/memory_index.db")
     HYBRID_TOP_K = mem.get("hybrid_top_k", 10)
+    EMBED_CONCURRENCY = mem.get("embed_concurrency", 5)
+    EXTRACTION_MIN_USER_CHARS = mem.get("extraction_min_user_chars", 20)
+    EXTRACTION_MIN_ASSISTANT_CHARS = mem.get("extraction_min_assistant_chars", 40)
 
     ix = _raw.get("indexer", {})
     INDEXER_ENABLED = ix.get("enabled", False)
@@ -277,6 +286,7 @@ def reload():
     HEARTBEAT_INTERVAL = s.get("heartbeat_interval_minutes", 15)
     IDLE_CHECKIN_MINUTES = s.get("idle_checkin_minutes", 120)
     REMINDER_CHECK_MINUTES = s.get("reminder_check_minutes", 5)
+    PROVIDER_BACKOFF_SECONDS = s.get("provider_backoff_seconds", 600)
 
     t = _raw.get("tools", {})
     TOOLS_ENABLED = t.get("enabled", True)
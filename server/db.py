@@ -1,8 +1,8 @@
 """SQLite database via aiosqlite — schema + helpers."""
 
 import json
+import os
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
 
@@ -10,6 +10,9 @@ import aiosqlite
 
 DB_PATH = Path(__file__).parent / "conduit.db"
 
+# Bump whenever SCHEMA changes so init_db() re-applies it on existing databases
+SCHEMA_VERSION = "3"
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS conversations (
     id TEXT PRIMARY KEY,
@@ -47,6 +50,9 @@ CREATE TABLE IF NOT EXISTS model_usage (
     output_tokens INTEGER NOT NULL DEFAULT 0,
     created_at REAL NOT NULL
 );
+-- Covering index: usage-by-provider is an index-only range scan
+CREATE INDEX IF NOT EXISTS idx_usage_time_prov
+    ON model_usage(created_at, provider, input_tokens, output_tokens);
 
 CREATE TABLE IF NOT EXISTS kv (
     key TEXT PRIMARY KEY,
@@ -67,32 +73,83 @@ CREATE TABLE IF NOT EXISTS memories (
     access_count INTEGER NOT NULL DEFAULT 0
 );
 CREATE INDEX IF NOT EXISTS idx_memories_category ON memories(category);
-CREATE INDEX IF NOT EXISTS idx_memories_importance ON memories(importance DESC);
+DROP INDEX IF EXISTS idx_memories_importance;
+CREATE INDEX IF NOT EXISTS idx_memories_rank ON memories(importance DESC, created_at DESC);
 
 CREATE TABLE IF NOT EXISTS conversation_summaries (
     id TEXT PRIMARY KEY,
     conversation_id TEXT NOT NULL,
     summary TEXT NOT NULL,
     message_range TEXT,
-    created_at REAL NOT NULL
+    created_at REAL NOT NULL,
+    last_message_idx INTEGER
 );
 CREATE INDEX IF NOT EXISTS idx_summaries_conv ON conversation_summaries(conversation_id);
 """
 
+# Hot-path statements, shared so every call site passes the identical string
+_SQL_ADD_MESSAGE = (
+    "INSERT INTO messages (id, conversation_id, role, content, model, source, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_TOUCH_CONVERSATION = "UPDATE conversations SET updated_at = ? WHERE id = ?"
+_SQL_LOG_USAGE = (
+    "INSERT INTO model_usage (id, provider, model, input_tokens, output_tokens, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_KV_GET = "SELECT value FROM kv WHERE key = ?"
+_SQL_KV_SET = (
+    "INSERT INTO kv (key, value, updated_at) VALUES (?, ?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at"
+)
+
 
 async def init_db():
-    """Create tables if they don't exist."""
+    """Create tables if they don't exist.
+
+    Skips the schema script entirely when the stored schema_version is current.
+    """
     async with aiosqlite.connect(DB_PATH) as db:
+        try:
+            row = await db.execute_fetchall(_SQL_KV_GET, ("schema_version",))
+        except aiosqlite.OperationalError:
+            row = []  # Fresh database — kv table doesn't exist yet
+        if row and row[0][0] == SCHEMA_VERSION:
+            return
         await db.executescript(SCHEMA)
+        await _migrate(db)
+        await db.execute(_SQL_KV_SET, ("schema_version", SCHEMA_VERSION, _now()))
         await db.commit()
 
 
+async def _migrate(db: aiosqlite.Connection):
+    """Add columns that CREATE TABLE IF NOT EXISTS can't add to existing tables."""
+    cols = {r[1] for r in await db.execute_fetchall("PRAGMA table_info(conversation_summaries)")}
+    if "last_message_idx" not in cols:
+        await db.execute("ALTER TABLE conversation_summaries ADD COLUMN last_message_idx INTEGER")
+        # Backfill from the "start-end" text older rows carry
+        await db.execute(
+            "UPDATE conversation_summaries "
+            "SET last_message_idx = CAST(substr(message_range, instr(message_range, '-') + 1) AS INTEGER) "
+            "WHERE instr(message_range, '-') > 0"
+        )
+
+
 def _now() -> float:
     return time.time()
 
 
+def _today_start() -> float:
+    return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+
 def _id() -> str:
-    return uuid.uuid4().hex[:12]
+    return os.urandom(6).hex()
+
+
+def as_dicts(rows) -> list[dict]:
+    """Convert sqlite rows to plain dicts (for JSON responses)."""
+    return [dict(r) for r in rows]
 
 
 # --- Conversations ---
@@ -109,13 +166,19 @@ async def create_conversation(title: str = "New Chat") -> str:
     return cid
 
 
-async def list_conversations(limit: int = 50) -> list[dict]:
+async def list_conversations(limit: int = 50, since: float | None = None) -> list[aiosqlite.Row]:
+    """List conversations, most recently updated first (optionally only those updated since a timestamp)."""
     async with aiosqlite.connect(DB_PATH) as db:
         db.row_factory = aiosqlite.Row
-        rows = await db.execute_fetchall(
+        if since is not None:
+            return list(await db.execute_fetchall(
+                "SELECT * FROM conversations WHERE updated_at >= ? "
+                "ORDER BY updated_at DESC LIMIT ?",
+                (since, limit),
+            ))
+        return list(await db.execute_fetchall(
             "SELECT * FROM conversations ORDER BY updated_at DESC LIMIT ?", (limit,)
-        )
-        return [dict(r) for r in rows]
+        ))
 
 
 async def update_conversation_title(cid: str, title: str):
@@ -152,25 +215,45 @@ async def add_message(conversation_id: str, role: str, content: str,
     now = _now()
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute(
-            "INSERT INTO messages (id, conversation_id, role, content, model, source, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _SQL_ADD_MESSAGE,
             (mid, conversation_id, role, content, model, source, now),
         )
-        await db.execute(
-            "UPDATE conversations SET updated_at = ? WHERE id = ?", (now, conversation_id)
-        )
+        await db.execute(_SQL_TOUCH_CONVERSATION, (now, conversation_id))
         await db.commit()
     return mid
 
 
-async def get_messages(conversation_id: str, limit: int = 100) -> list[dict]:
+async def add_messages_bulk(conversation_id: str, rows: list[tuple]) -> list[str]:
+    """Insert many messages in a single transaction (e.g. replaying a conversation).
+
+    Each row is (role, content) or (role, content, model, source).
+    Returns the new message IDs in input order.
+    """
+    if not rows:
+        return []
+    now = _now()
+    ids = []
+    params = []
+    for i, row in enumerate(rows):
+        role, content, model, source = (tuple(row) + (None, None))[:4]
+        mid = _id()
+        ids.append(mid)
+        # Offset timestamps so ORDER BY created_at keeps the input order
+        params.append((mid, conversation_id, role, content, model, source, now + i * 1e-6))
+    async with aiosqlite.connect(DB_PATH) as db:
+        await db.executemany(_SQL_ADD_MESSAGE, params)
+        await db.execute(_SQL_TOUCH_CONVERSATION, (params[-1][-1], conversation_id))
+        await db.commit()
+    return ids
+
+
+async def get_messages(conversation_id: str, limit: int = 100) -> list[aiosqlite.Row]:
     async with aiosqlite.connect(DB_PATH) as db:
         db.row_factory = aiosqlite.Row
-        rows = await db.execute_fetchall(
+        return list(await db.execute_fetchall(
             "SELECT * FROM messages WHERE conversation_id = ? ORDER BY created_at LIMIT ?",
             (conversation_id, limit),
-        )
-        return [dict(r) for r in rows]
+        ))
 
 
 async def get_message_count(conversation_id: str) -> int:
@@ -187,8 +270,7 @@ async def get_message_count(conversation_id: str) -> int:
 async def log_usage(provider: str, model: str, input_tokens: int, output_tokens: int):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute(
-            "INSERT INTO model_usage (id, provider, model, input_tokens, output_tokens, created_at) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
+            _SQL_LOG_USAGE,
             (_id(), provider, model, input_tokens, output_tokens, _now()),
         )
         await db.commit()
@@ -196,9 +278,7 @@ async def log_usage(provider: str, model: str, input_tokens: int, output_tokens:
 
 async def get_daily_opus_tokens() -> int:
     """Sum today's Opus output tokens."""
-    today_start = datetime.now().replace(
-        hour=0, minute=0, second=0, microsecond=0
-    ).timestamp()
+    today_start = _today_start()
     async with aiosqlite.connect(DB_PATH) as db:
         row = await db.execute_fetchall(
             "SELECT COALESCE(SUM(output_tokens), 0) FROM model_usage "
@@ -210,9 +290,7 @@ async def get_daily_opus_tokens() -> int:
 
 async def get_daily_provider_tokens(provider: str) -> int:
     """Sum today's output tokens for a specific provider."""
-    today_start = datetime.now().replace(
-        hour=0, minute=0, second=0, microsecond=0
-    ).timestamp()
+    today_start = _today_start()
     async with aiosqlite.connect(DB_PATH) as db:
         row = await db.execute_fetchall(
             "SELECT COALESCE(SUM(output_tokens), 0) FROM model_usage "
@@ -222,7 +300,7 @@ async def get_daily_provider_tokens(provider: str) -> int:
         return row[0][0] if row else 0
 
 
-async def get_usage_by_provider(days: int = 7) -> list[dict]:
+async def get_usage_by_provider(days: int = 7) -> list[aiosqlite.Row]:
     """Get token usage grouped by provider for the last N days."""
     cutoff = _now() - (days * 86400)
     async with aiosqlite.connect(DB_PATH) as db:
@@ -235,7 +313,7 @@ async def get_usage_by_provider(days: int = 7) -> list[dict]:
             "GROUP BY provider, model ORDER BY total_output DESC",
             (cutoff,),
         )
-        return [dict(r) for r in rows]
+        return list(rows)
 
 
 # --- Scheduled Tasks ---
@@ -281,17 +359,14 @@ async def delete_scheduled_task(task_id: str):
 
 async def kv_get(key: str) -> str | None:
     async with aiosqlite.connect(DB_PATH) as db:
-        row = await db.execute_fetchall(
-            "SELECT value FROM kv WHERE key = ?", (key,)
-        )
+        row = await db.execute_fetchall(_SQL_KV_GET, (key,))
         return row[0][0] if row else None
 
 
 async def kv_set(key: str, value: str):
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute(
-            "INSERT INTO kv (key, value, updated_at) VALUES (?, ?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            _SQL_KV_SET,
             (key, value, _now()),
         )
         await db.commit()
@@ -320,35 +395,43 @@ async def count_memories_legacy() -> int:
 
 # --- Conversation Summaries ---
 
-async def add_conversation_summary(conversation_id: str, summary: str, message_range: str) -> str:
+async def add_conversation_summary(conversation_id: str, summary: str, message_range: str,
+                                   last_message_idx: int | None = None) -> str:
+    """Store a summary. last_message_idx is the index just past the last message it covers."""
     sid = _id()
     async with aiosqlite.connect(DB_PATH) as db:
         await db.execute(
-            "INSERT INTO conversation_summaries (id, conversation_id, summary, message_range, created_at) "
-            "VALUES (?, ?, ?, ?, ?)",
-            (sid, conversation_id, summary, message_range, _now()),
+            "INSERT INTO conversation_summaries "
+            "(id, conversation_id, summary, message_range, created_at, last_message_idx) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (sid, conversation_id, summary, message_range, _now(), last_message_idx),
         )
         await db.commit()
     return sid
 
 
-async def get_conversation_summaries(conversation_id: str) -> list[dict]:
+async def get_conversation_summaries(conversation_id: str) -> list[aiosqlite.Row]:
     async with aiosqlite.connect(DB_PATH) as db:
         db.row_factory = aiosqlite.Row
-        rows = await db.execute_fetchall(
+        return list(await db.execute_fetchall(
             "SELECT * FROM conversation_summaries WHERE conversation_id = ? ORDER BY created_at",
             (conversation_id,),
-        )
-        return [dict(r) for r in rows]
+        ))
+
+
+async def get_today_conversations_with_summaries(limit: int = 10) -> list[dict]:
+    """Like get_recent_conversations_with_summaries, limited to conversations updated today."""
+    return await get_recent_conversations_with_summaries(limit=limit, since=_today_start())
 
 
-async def get_recent_conversations_with_summaries(limit: int = 5) -> list[dict]:
+async def get_recent_conversations_with_summaries(limit: int = 5,
+                                                  since: float | None = None) -> list[dict]:
     """Get recent conversations with summaries or message snippets.
 
     Returns ALL recent conversations, not just those with summaries.
     For conversations without a summary, uses the last few messages as context.
     """
-    convs = await list_conversations(limit=limit)
+    convs = await list_conversations(limit=limit, since=since)
     result = []
     for c in convs:
         summaries = await get_conversation_summaries(c["id"])
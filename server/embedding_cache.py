@@ -0,0 +1,53 @@
+"""In-process LRU cache in front of embeddings — repeated texts skip the API call.
+
+Retrieval queries repeat a lot (follow-ups, retries, UI refreshes), so the
+per-turn query embeddings in memory.py go through here. Keys are the
+normalized text plus task type and model settings; entries expire after
+TTL_SECONDS.
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from . import config, embeddings
+
+MAX_ENTRIES = 512
+TTL_SECONDS = 300
+
+# key → (stored_at, read-only vector); most recently used last
+_cache: OrderedDict[tuple, tuple[float, np.ndarray]] = OrderedDict()
+
+
+def _key(text: str, task_type: str) -> tuple:
+    normalized = " ".join(text.split()).lower()
+    return (normalized, task_type, config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
+
+
+async def embed_text(text: str, task_type: str = "RETRIEVAL_DOCUMENT") -> np.ndarray:
+    """Cached embeddings.embed_text(). The returned array is shared and read-only."""
+    key = _key(text, task_type)
+    now = time.monotonic()
+    hit = _cache.get(key)
+    if hit and now - hit[0] < TTL_SECONDS:
+        _cache.move_to_end(key)
+        return hit[1]
+
+    vec = await embeddings.embed_text(text, task_type=task_type)
+    vec.setflags(write=False)
+    _cache[key] = (now, vec)
+    _cache.move_to_end(key)
+    while len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return vec
+
+
+async def embed_query(text: str) -> np.ndarray:
+    """Cached embeddings.embed_query()."""
+    return await embed_text(text, task_type="RETRIEVAL_QUERY")
+
+
+def clear():
+    """Drop all cached embeddings."""
+    _cache.clear()
@@ -1,8 +1,10 @@
 """Gemini embedding wrapper — async text-embedding-005 via Vertex AI."""
 
+import asyncio
 import logging
 import os
 
+import numpy as np
 from google import genai
 
 from . import config
@@ -28,8 +30,47 @@ def init():
              config.EMBEDDING_MODEL, config.EMBEDDING_DIMENSIONS)
 
 
-async def embed_text(text: str, task_type: str = "RETRIEVAL_DOCUMENT") -> list[float]:
-    """Embed a single text string. Returns 768-dim vector."""
+def _unit_vector(values) -> np.ndarray:
+    """Pack embedding values into a float32 array scaled to unit length."""
+    vec = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm:
+        vec /= norm
+    return vec
+
+
+def quantize_i8(vec) -> tuple[float, bytes]:
+    """Quantize a vector to int8 with a symmetric per-vector scale.
+
+    Returns (scale, packed int8 bytes) — a quarter of the float32 size.
+    """
+    v = np.asarray(vec, dtype=np.float32)
+    peak = float(np.max(np.abs(v))) if v.size else 0.0
+    if not peak:
+        return 0.0, bytes(v.size)
+    scale = peak / 127.0
+    q = np.rint(v / scale).astype(np.int8)
+    return scale, q.tobytes()
+
+
+def dequantize_i8(scale: float, data: bytes) -> np.ndarray:
+    """Expand a quantize_i8() result back to an approximate float32 vector."""
+    return np.frombuffer(data, dtype=np.int8).astype(np.float32) * scale
+
+
+def dot_i8(a: tuple[float, bytes], b: tuple[float, bytes]) -> float:
+    """Dot product of two quantize_i8() results.
+
+    Accumulates in int32 (a 768-dim int8 dot overflows int16) and applies
+    both scales once at the end.
+    """
+    qa = np.frombuffer(a[1], dtype=np.int8).astype(np.int32)
+    qb = np.frombuffer(b[1], dtype=np.int8).astype(np.int32)
+    return float(np.dot(qa, qb)) * a[0] * b[0]
+
+
+async def embed_text(text: str, task_type: str = "RETRIEVAL_DOCUMENT") -> np.ndarray:
+    """Embed a single text string. Returns a unit-length 768-dim float32 vector."""
     if not _client:
         raise RuntimeError("Embedding client not initialized")
     result = await _client.aio.models.embed_content(
@@ -37,26 +78,35 @@ async def embed_text(text: str, task_type: str = "RETRIEVAL_DOCUMENT") -> list[f
         contents=text,
         config={"task_type": task_type, "output_dimensionality": config.EMBEDDING_DIMENSIONS},
     )
-    return list(result.embeddings[0].values)
+    return _unit_vector(result.embeddings[0].values)
 
 
-async def embed_batch(texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT") -> list[list[float]]:
-    """Embed multiple texts. Returns list of 768-dim vectors."""
+async def embed_batch(texts: list[str], task_type: str = "RETRIEVAL_DOCUMENT") -> np.ndarray:
+    """Embed multiple texts. Returns an (N, 768) float32 array of unit vectors in input order.
+
+    Texts are sent in chunks of 20 (API limit); up to EMBED_CONCURRENCY
+    chunks are in flight at once.
+    """
     if not _client:
         raise RuntimeError("Embedding client not initialized")
-    results = []
-    # Process in chunks of 20 (API limit)
-    for i in range(0, len(texts), 20):
-        chunk = texts[i:i + 20]
-        result = await _client.aio.models.embed_content(
-            model=config.EMBEDDING_MODEL,
-            contents=chunk,
-            config={"task_type": task_type, "output_dimensionality": config.EMBEDDING_DIMENSIONS},
-        )
-        results.extend(list(e.values) for e in result.embeddings)
-    return results
-
-
-async def embed_query(text: str) -> list[float]:
+    chunks = [texts[i:i + 20] for i in range(0, len(texts), 20)]
+    sem = asyncio.Semaphore(max(1, config.EMBED_CONCURRENCY))
+
+    async def _embed_chunk(chunk: list[str]):
+        async with sem:
+            return await _client.aio.models.embed_content(
+                model=config.EMBEDDING_MODEL,
+                contents=chunk,
+                config={"task_type": task_type, "output_dimensionality": config.EMBEDDING_DIMENSIONS},
+            )
+
+    results = await asyncio.gather(*(_embed_chunk(c) for c in chunks))
+    vectors = [_unit_vector(e.values) for r in results for e in r.embeddings]
+    if not vectors:
+        return np.empty((0, config.EMBEDDING_DIMENSIONS), dtype=np.float32)
+    return np.stack(vectors)
+
+
+async def embed_query(text: str) -> np.ndarray:
     """Embed a query string for retrieval. Uses RETRIEVAL_QUERY task type."""
     return await embed_text(text, task_type="RETRIEVAL_QUERY")
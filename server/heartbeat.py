@@ -1,7 +1,9 @@
 """Heartbeat system — proactive check-ins via WebSocket + ntfy."""
 
+import asyncio
 import json
 import logging
+import time
 from datetime import datetime
 
 from . import config, db, ntfy, spectre, telegram as tg_module
@@ -11,10 +13,22 @@ log = logging.getLogger("conduit.heartbeat")
 
 # Track what we've sent today to avoid duplicates
 _sent_today: dict[str, str] = {}  # type → date string
+_state_loaded = False
+STATE_KEY = "heartbeat_state"
+
+# provider name → time of last failed generation, for backoff
+_provider_failed_at: dict[str, float] = {}
+
+# (minute bucket, date string) — local dates only change on minute boundaries
+_today_cache: tuple[float, str] = (-1.0, "")
 
 
 def _today() -> str:
-    return datetime.now().strftime("%Y-%m-%d")
+    global _today_cache
+    bucket = time.time() // 60
+    if _today_cache[0] != bucket:
+        _today_cache = (bucket, datetime.now().strftime("%Y-%m-%d"))
+    return _today_cache[1]
 
 
 def _in_active_hours() -> bool:
@@ -32,6 +46,75 @@ def _reset_daily():
         _sent_today = {"_date": today}
 
 
+async def _load_state():
+    """Hydrate _sent_today from the KV store once per process.
+
+    Keeps a restart from re-sending today's morning/evening heartbeats.
+    """
+    global _sent_today, _state_loaded
+    if _state_loaded:
+        return
+    _state_loaded = True
+    try:
+        raw = await db.kv_get(STATE_KEY)
+        if raw:
+            state = json.loads(raw)
+            if isinstance(state, dict):
+                _sent_today = state
+    except Exception as e:
+        log.debug("Failed to load heartbeat state: %s", e)
+
+
+async def _save_state():
+    """Persist _sent_today to the KV store."""
+    try:
+        await db.kv_set(STATE_KEY, json.dumps(_sent_today))
+    except Exception as e:
+        log.debug("Failed to save heartbeat state: %s", e)
+
+
+def _provider_ready(provider) -> bool:
+    """False while the provider is inside its backoff window after a failure."""
+    failed_at = _provider_failed_at.get(provider.name)
+    if failed_at is None:
+        return True
+    return time.time() - failed_at >= config.PROVIDER_BACKOFF_SECONDS
+
+
+async def _generate(provider, prompt: str) -> str:
+    """Run a heartbeat prompt, recording provider failures for backoff."""
+    from .app import render_system_prompt_async
+
+    system = await render_system_prompt_async()
+    try:
+        response, usage = await provider.generate(
+            [{"role": "user", "content": prompt}],
+            system=system,
+        )
+    except Exception:
+        _provider_failed_at[provider.name] = time.time()
+        raise
+    _provider_failed_at.pop(provider.name, None)
+    await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
+    return response
+
+
+def _ok(result, default, what: str):
+    """Unwrap an asyncio.gather(return_exceptions=True) result, logging failures."""
+    if isinstance(result, BaseException):
+        log.debug("Heartbeat context unavailable (%s): %s", what, result)
+        return default
+    return result
+
+
+async def _deliver(*pushes):
+    """Fan a notification out to every channel at once; one failure doesn't block the rest."""
+    results = await asyncio.gather(*pushes, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            log.warning("Heartbeat push failed: %s", result)
+
+
 async def _get_idle_minutes() -> float:
     """Get minutes since last user activity."""
     raw = await db.kv_get("last_user_activity")
@@ -51,6 +134,18 @@ async def check(manager: ConnectionManager):
     if not _in_active_hours():
         return
 
+    await _load_state()
+    before = dict(_sent_today)
+    try:
+        await _run_checks(manager)
+    finally:
+        # One KV write per tick, and only when something changed
+        if _sent_today != before:
+            await _save_state()
+
+
+async def _run_checks(manager: ConnectionManager):
+    """Scheduled heartbeats, threshold alerts, and idle check-ins."""
     _reset_daily()
     now = datetime.now()
     hour = now.hour
@@ -104,16 +199,28 @@ async def _morning_heartbeat(manager: ConnectionManager):
     """Morning check-in with context."""
     log.info("Sending morning heartbeat")
 
-    from .app import get_provider, render_system_prompt_async
+    from .app import get_provider
 
-    # Gather context
-    try:
-        from . import memory as memory_module
-        memories = await memory_module.get_all_memories()
-        memories = memories[:10]
-    except Exception:
-        memories = []
-    recent_convs = await db.get_recent_conversations_with_summaries(limit=3)
+    provider = get_provider()  # NIM — free
+    if not _provider_ready(provider):
+        log.info("Skipping heartbeat — %s failed recently", provider.name)
+        return
+
+    # Gather context — independent DB/network reads, fetched concurrently
+    from . import memory as memory_module
+    memories, recent_convs, raw, inv_summary, lm100_score = await asyncio.gather(
+        memory_module.get_all_memories(),
+        db.get_recent_conversations_with_summaries(limit=3),
+        db.kv_get("reminders"),
+        spectre.get_inventory_summary(),
+        spectre.get_site_score("lockhead_martin_bldg_100"),
+        return_exceptions=True,
+    )
+    memories = _ok(memories, [], "memories")[:10]
+    recent_convs = _ok(recent_convs, [], "recent conversations")
+    raw = _ok(raw, None, "reminders")
+    inv_summary = _ok(inv_summary, None, "Spectre inventory")
+    lm100_score = _ok(lm100_score, None, "Spectre site score")
 
     context_parts = []
     if memories:
@@ -125,8 +232,7 @@ async def _morning_heartbeat(manager: ConnectionManager):
         )
         context_parts.append(f"Recent conversations: {conv_text}")
 
-    # Get pending reminders
-    raw = await db.kv_get("reminders")
+    # Pending reminders
     if raw:
         reminders = json.loads(raw)
         active = [r for r in reminders if r["due"] > datetime.now().timestamp()]
@@ -134,9 +240,8 @@ async def _morning_heartbeat(manager: ConnectionManager):
             rem_text = ", ".join(r["text"] for r in active[:5])
             context_parts.append(f"Pending reminders: {rem_text}")
 
-    # Pull Spectre operational data (graceful skip if offline)
+    # Spectre operational data (graceful skip if offline)
     try:
-        inv_summary = await spectre.get_inventory_summary()
         if inv_summary:
             parts = []
             if "site_count" in inv_summary:
@@ -148,7 +253,6 @@ async def _morning_heartbeat(manager: ConnectionManager):
             if parts:
                 context_parts.append(f"Spectre inventory: {', '.join(parts)}")
 
-        lm100_score = await spectre.get_site_score("lockhead_martin_bldg_100")
         if lm100_score:
             parts = []
             if "score" in lm100_score:
@@ -173,26 +277,20 @@ async def _morning_heartbeat(manager: ConnectionManager):
         "Don't be generic — reference specific things you know."
     )
 
-    provider = get_provider()  # NIM — free
     try:
-        system = await render_system_prompt_async()
-        response, usage = await provider.generate(
-            [{"role": "user", "content": prompt}],
-            system=system,
-        )
-        await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
+        response = await _generate(provider, prompt)
 
         # Push to WS clients
-        await manager.push(content=response, title="Good Morning")
-
-        # Push to phone
-        await ntfy.push(
-            title="Good Morning",
-            body=response[:400],
-            tags=["sunrise"],
-            priority=3,
+        await _deliver(
+            manager.push(content=response, title="Good Morning"),
+            ntfy.push(
+                title="Good Morning",
+                body=response[:400],
+                tags=["sunrise"],
+                priority=3,
+            ),
+            tg_module.push(title="Good Morning", body=response[:4000]),
         )
-        await tg_module.push(title="Good Morning", body=response[:4000])
 
         log.info("Morning heartbeat sent")
     except Exception as e:
@@ -203,17 +301,15 @@ async def _evening_heartbeat(manager: ConnectionManager):
     """Evening recap of the day."""
     log.info("Sending evening heartbeat")
 
-    from .app import get_provider, render_system_prompt_async
+    from .app import get_provider
 
-    # Get today's conversations
-    recent_convs = await db.get_recent_conversations_with_summaries(limit=10)
-    today_str = _today()
+    provider = get_provider()  # NIM — free
+    if not _provider_ready(provider):
+        log.info("Skipping heartbeat — %s failed recently", provider.name)
+        return
 
-    today_convs = []
-    for c in recent_convs:
-        conv_date = datetime.fromtimestamp(c["updated_at"]).strftime("%Y-%m-%d")
-        if conv_date == today_str:
-            today_convs.append(c)
+    # Get today's conversations
+    today_convs = await db.get_today_conversations_with_summaries(limit=10)
 
     # Get usage stats
     usage_stats = await db.get_usage_by_provider(days=1)
@@ -242,23 +338,19 @@ async def _evening_heartbeat(manager: ConnectionManager):
         "Keep it concise (under 150 words)."
     )
 
-    provider = get_provider()  # NIM — free
     try:
-        system = await render_system_prompt_async()
-        response, usage = await provider.generate(
-            [{"role": "user", "content": prompt}],
-            system=system,
-        )
-        await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
-
-        await manager.push(content=response, title="Evening Recap")
-        await ntfy.push(
-            title="Evening Recap",
-            body=response[:400],
-            tags=["moon"],
-            priority=2,
+        response = await _generate(provider, prompt)
+
+        await _deliver(
+            manager.push(content=response, title="Evening Recap"),
+            ntfy.push(
+                title="Evening Recap",
+                body=response[:400],
+                tags=["moon"],
+                priority=2,
+            ),
+            tg_module.push(title="Evening Recap", body=response[:4000]),
         )
-        await tg_module.push(title="Evening Recap", body=response[:4000])
 
         log.info("Evening heartbeat sent")
     except Exception as e:
@@ -269,16 +361,22 @@ async def _idle_heartbeat(manager: ConnectionManager, idle_minutes: float):
     """Contextual check-in after user has been idle."""
     log.info("Sending idle check-in (%.0f min idle)", idle_minutes)
 
-    from .app import get_provider, render_system_prompt_async
+    from .app import get_provider
+
+    provider = get_provider()  # NIM — free
+    if not _provider_ready(provider):
+        log.info("Skipping heartbeat — %s failed recently", provider.name)
+        return
 
     # Get recent context
-    recent_convs = await db.get_recent_conversations_with_summaries(limit=3)
-    try:
-        from . import memory as memory_module
-        memories = await memory_module.get_all_memories()
-        memories = memories[:5]
-    except Exception:
-        memories = []
+    from . import memory as memory_module
+    recent_convs, memories = await asyncio.gather(
+        db.get_recent_conversations_with_summaries(limit=3),
+        memory_module.get_all_memories(),
+        return_exceptions=True,
+    )
+    recent_convs = _ok(recent_convs, [], "recent conversations")
+    memories = _ok(memories, [], "memories")[:5]
 
     context_parts = []
     if recent_convs:
@@ -301,23 +399,19 @@ async def _idle_heartbeat(manager: ConnectionManager, idle_minutes: float):
         "or memories if relevant. Be natural."
     )
 
-    provider = get_provider()  # NIM — free
     try:
-        system = await render_system_prompt_async()
-        response, usage = await provider.generate(
-            [{"role": "user", "content": prompt}],
-            system=system,
-        )
-        await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
-
-        await manager.push(content=response, title="Check-in")
-        await ntfy.push(
-            title="Conduit",
-            body=response[:300],
-            tags=["wave"],
-            priority=2,
+        response = await _generate(provider, prompt)
+
+        await _deliver(
+            manager.push(content=response, title="Check-in"),
+            ntfy.push(
+                title="Conduit",
+                body=response[:300],
+                tags=["wave"],
+                priority=2,
+            ),
+            tg_module.push(title="Check-in", body=response[:4000]),
         )
-        await tg_module.push(title="Check-in", body=response[:4000])
 
         log.info("Idle check-in sent")
     except Exception as e:
@@ -365,14 +459,16 @@ async def _check_thresholds(manager: ConnectionManager):
         if "status" in score_data:
             body += f" Status: {score_data['status']}."
 
-        await manager.push(content=f"**Health Alert**\n{body}", title="Health Alert")
-        await ntfy.push(
-            title="Health Alert",
-            body=body,
-            tags=["warning"],
-            priority=4,
+        await _deliver(
+            manager.push(content=f"**Health Alert**\n{body}", title="Health Alert"),
+            ntfy.push(
+                title="Health Alert",
+                body=body,
+                tags=["warning"],
+                priority=4,
+            ),
+            tg_module.push(title="Health Alert", body=body),
         )
-        await tg_module.push(title="Health Alert", body=body)
 
         await db.kv_set(cooldown_key, str(now))
         log.warning("Threshold alert: %s health score %s", site_name, score)
@@ -1,163 +1,378 @@
 """Project indexer — scans configured project directories and writes compact YAML indexes."""
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper
+
 from . import config
 
 log = logging.getLogger("conduit.indexer")
 
 # Directories to skip entirely
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", ".venv", "venv", "__pycache__", ".git", "dist", "build",
     ".next", ".svelte-kit", ".nuxt", ".cache", ".tox", ".mypy_cache",
     ".pytest_cache", ".ruff_cache", "egg-info", ".eggs", "htmlcov",
     "coverage", ".turbo", ".parcel-cache",
-}
+})
 
 # File extensions to skip
-SKIP_EXTENSIONS = {
+SKIP_EXTENSIONS = frozenset({
     ".pyc", ".pyo", ".so", ".o", ".a", ".dylib", ".dll", ".exe",
     ".whl", ".egg", ".tar", ".gz", ".zip", ".bz2", ".xz",
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg", ".webp",
     ".woff", ".woff2", ".ttf", ".eot",
     ".lock", ".map",
-}
+})
 
 # Code file extensions we extract descriptions from
-CODE_EXTENSIONS = {
+CODE_EXTENSIONS = frozenset({
     ".py", ".ts", ".tsx", ".js", ".jsx", ".svelte", ".vue",
     ".yaml", ".yml", ".toml", ".json", ".md", ".sh", ".bash",
     ".go", ".rs", ".rb", ".java", ".kt", ".swift", ".c", ".cpp", ".h",
-}
+})
+
+# Markdown's heading is at the top, so a short read is enough
+_DESC_READ_BYTES = {".md": 256}
+
+# Hidden files that are still worth listing
+_ALLOWED_HIDDEN = frozenset({".env.example", ".gitignore"})
+
+# Module docstring, optionally preceded by comment lines
+_PY_DOCSTRING_RE = re.compile(r'^(?:#.*\n)*\s*(?:"""(.*?)"""|\'\'\'(.*?)\'\'\')', re.DOTALL)
 
 MAX_DEPTH = 4
 LARGE_FILE_THRESHOLD = 10 * 1024  # 10KB
+# Threads reading file headers once the tree walk is done
+DESCRIPTION_WORKERS = 16
+
+
+def _head_lines(text: str, n: int):
+    """Yield up to the first n lines of text without splitting the whole buffer."""
+    pos = 0
+    while n:
+        nl = text.find("\n", pos)
+        if nl < 0:
+            yield text[pos:]
+            return
+        yield text[pos:nl]
+        pos = nl + 1
+        n -= 1
+
+
+def _hash_comment_desc(text: str, max_lines: int = 5) -> str:
+    for line in _head_lines(text, max_lines):
+        line = line.strip()
+        if line.startswith("#") and not line.startswith("#!"):
+            return line.lstrip("# ").strip()[:120]
+    return ""
+
+
+def _py_desc(text: str) -> str:
+    # Try module docstring
+    m = ('"""' in text or "'''" in text) and _PY_DOCSTRING_RE.match(text)
+    if m:
+        doc = (m.group(1) or m.group(2) or "").strip()
+        first_line = doc.partition("\n")[0].strip()
+        if first_line:
+            return first_line[:120]
+    # Fall back to first comment
+    return _hash_comment_desc(text, 10)
+
+
+def _js_desc(text: str) -> str:
+    for line in _head_lines(text, 10):
+        line = line.strip()
+        if line.startswith("//"):
+            return line.lstrip("/ ").strip()[:120]
+        if line.startswith("/*"):
+            comment = line.lstrip("/* ").rstrip("*/").strip()
+            if comment:
+                return comment[:120]
+    return ""
+
+
+def _md_desc(text: str) -> str:
+    for line in _head_lines(text, 5):
+        line = line.strip()
+        if line.startswith("#"):
+            return line.lstrip("# ").strip()[:120]
+    return ""
+
+
+_DESC_HANDLERS: dict[str, Callable[[str], str]] = {
+    ".py": _py_desc,
+    **dict.fromkeys((".ts", ".tsx", ".js", ".jsx", ".svelte", ".vue"), _js_desc),
+    **dict.fromkeys((".yaml", ".yml", ".toml", ".sh", ".bash"), _hash_comment_desc),
+    ".md": _md_desc,
+}
+# Code files _extract_description can actually describe; others in
+# CODE_EXTENSIONS (.json, .go, .rs, ...) would only be opened to yield ""
+_DESC_EXTENSIONS = frozenset(_DESC_HANDLERS)
 
 
-def _extract_description(filepath: Path) -> str:
+def _extract_description(filepath: str, size: int | None = None,
+                         max_bytes: int = 2048) -> str:
     """Extract a one-line description from a code file.
 
     For Python: first docstring or first comment.
     For JS/TS: first // or /* comment.
     For YAML/TOML: first # comment.
     For Markdown: first heading.
+
+    Pass size when it's already known from the directory scan; empty files
+    are skipped without being opened. At most max_bytes are read.
     """
+    handler = _DESC_HANDLERS.get(os.path.splitext(filepath)[1].lower())
+    if handler is None or size == 0:
+        return ""
     try:
-        text = filepath.read_text(errors="replace")[:2000]  # Only read first 2KB
+        # Only read the header, however large the file is
+        with open(filepath, "rb") as f:
+            text = f.read(max_bytes).decode("utf-8", errors="replace")
     except (PermissionError, OSError):
         return ""
+    return handler(text)
 
-    ext = filepath.suffix.lower()
-
-    if ext == ".py":
-        # Try module docstring
-        m = re.match(r'^(?:#.*\n)*\s*(?:"""(.*?)"""|\'\'\'(.*?)\'\'\')', text, re.DOTALL)
-        if m:
-            doc = (m.group(1) or m.group(2) or "").strip()
-            first_line = doc.split("\n")[0].strip()
-            if first_line:
-                return first_line[:120]
-        # Fall back to first comment
-        for line in text.split("\n")[:10]:
-            line = line.strip()
-            if line.startswith("#") and not line.startswith("#!"):
-                return line.lstrip("# ").strip()[:120]
-
-    elif ext in (".ts", ".tsx", ".js", ".jsx", ".svelte", ".vue"):
-        for line in text.split("\n")[:10]:
-            line = line.strip()
-            if line.startswith("//"):
-                return line.lstrip("/ ").strip()[:120]
-            if line.startswith("/*"):
-                comment = line.lstrip("/* ").rstrip("*/").strip()
-                if comment:
-                    return comment[:120]
-
-    elif ext in (".yaml", ".yml", ".toml", ".sh", ".bash"):
-        for line in text.split("\n")[:5]:
-            line = line.strip()
-            if line.startswith("#") and not line.startswith("#!"):
-                return line.lstrip("# ").strip()[:120]
-
-    elif ext == ".md":
-        for line in text.split("\n")[:5]:
-            line = line.strip()
-            if line.startswith("#"):
-                return line.lstrip("# ").strip()[:120]
 
-    return ""
+def _count_files(path: str) -> int:
+    """Count files below path, pruning skipped and hidden directories.
+
+    Raises OSError if path itself can't be read; unreadable subdirectories
+    are skipped.
+    """
+    count = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError:
+            if current == path:
+                raise
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    if e.name not in SKIP_DIRS and not e.name.startswith("."):
+                        stack.append(e.path)
+                elif e.is_file(follow_symlinks=False):
+                    count += 1
+    return count
+
+
+def _size_note(size: int | None) -> str:
+    """Human-readable size for files over LARGE_FILE_THRESHOLD, else ""."""
+    if size is None or size <= LARGE_FILE_THRESHOLD:
+        return ""
+    if size >= 1024 * 1024:
+        return f"{size / (1024*1024):.1f}MB"
+    return f"{size / 1024:.0f}KB"
 
 
-def _scan_directory(dirpath: Path, depth: int = 0) -> dict:
-    """Recursively scan a directory and build a structure tree.
+def _scan_directory(dirpath: str | Path, depth: int = 0,
+                    desc_cache: dict | None = None) -> dict:
+    """Scan a directory tree and build a structure tree.
 
     Returns a dict with keys being file/dir names and values being
     either a description string (for files) or a nested dict (for dirs).
+    Walks with an explicit stack rather than recursing.
+
+    desc_cache maps file path -> [mtime_ns, size, description] from a
+    previous scan. Files whose mtime and size still match reuse the cached
+    description without being opened. The dict is updated in place to
+    reflect this scan.
     """
-    result = {}
+    root: dict = {}
+    stack: list[tuple[str | Path, dict, int]] = [(dirpath, root, depth)]
+    # (parent, key, subtree) in creation order. Subtrees are linked into
+    # their parent up front to keep the sorted order, then the empty ones
+    # are pruned in reverse so emptiness propagates bottom-up.
+    subdirs: list[tuple[dict, str, dict]] = []
+    # Files awaiting a description:
+    # (parent, name, size note, path, size, max_bytes, mtime_ns)
+    pending: list[tuple[dict, str, str, str, int | None, int, int]] = []
+    old_cache = desc_cache or {}
+    new_cache: dict[str, list] = {}
+
+    while stack:
+        current, result, level = stack.pop()
+        try:
+            # DirEntry reuses d_type from the directory read, so is_dir/is_file
+            # don't cost an extra lstat per entry the way pathlib does
+            with os.scandir(current) as it:
+                entries = sorted(
+                    it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name.lower())
+                )
+        except (PermissionError, OSError):
+            continue
 
-    try:
-        entries = sorted(dirpath.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
-    except (PermissionError, OSError):
-        return result
+        for entry in entries:
+            name = entry.name
 
-    for entry in entries:
-        name = entry.name
+            # Skip hidden files/dirs (except specific ones)
+            if name[:1] == "." and name not in _ALLOWED_HIDDEN:
+                continue
 
-        # Skip hidden files/dirs (except specific ones)
-        if name.startswith(".") and name not in (".env.example", ".gitignore"):
-            continue
+            if entry.is_dir(follow_symlinks=False):
+                if name in SKIP_DIRS or name.endswith(".egg-info"):
+                    continue
 
-        if entry.is_dir():
-            if name in SKIP_DIRS or name.endswith(".egg-info"):
-                continue
+                if level >= MAX_DEPTH:
+                    # Just count files instead of descending
+                    try:
+                        count = _count_files(entry.path)
+                        result[name + "/"] = f"({count} files, depth limit)"
+                    except (PermissionError, OSError):
+                        result[name + "/"] = "(access denied)"
+                    continue
+
+                subtree: dict = {}
+                result[name + "/"] = subtree
+                subdirs.append((result, name + "/", subtree))
+                stack.append((entry.path, subtree, level + 1))
+
+            elif entry.is_file(follow_symlinks=False):
+                dot = name.rfind(".")
+                ext = name[dot:].lower() if dot > 0 else ""
+                if ext in SKIP_EXTENSIONS:
+                    continue
 
-            if depth >= MAX_DEPTH:
-                # Just count files instead of recursing
+                # One (cached) stat per listed file, shared by the description
+                # and the size note
                 try:
-                    count = sum(1 for _ in entry.rglob("*") if _.is_file())
-                    result[name + "/"] = f"({count} files, depth limit)"
-                except (PermissionError, OSError):
-                    result[name + "/"] = "(access denied)"
-                continue
+                    st = entry.stat(follow_symlinks=False)
+                    size, mtime = st.st_size, st.st_mtime_ns
+                except OSError:
+                    size = mtime = None
+
+                note = _size_note(size)
+                result[name] = note
+                if ext in _DESC_EXTENSIONS and size != 0:
+                    cached = old_cache.get(entry.path)
+                    if (mtime is not None and isinstance(cached, list) and len(cached) == 3
+                            and cached[:2] == [mtime, size]):
+                        new_cache[entry.path] = cached
+                        if cached[2]:
+                            result[name] = f"{cached[2]} | {note}" if note else cached[2]
+                    else:
+                        pending.append((result, name, note, entry.path, size,
+                                        _DESC_READ_BYTES.get(ext, 2048), mtime))
+
+    # Header reads are independent small I/O; overlap them instead of
+    # reading one file at a time during the walk
+    if pending:
+        with ThreadPoolExecutor(max_workers=DESCRIPTION_WORKERS) as pool:
+            descs = pool.map(lambda item: _extract_description(*item[3:6]), pending)
+            for (result, name, note, path, size, _, mtime), desc in zip(pending, descs):
+                if desc:
+                    result[name] = f"{desc} | {note}" if note else desc
+                if mtime is not None:
+                    new_cache[path] = [mtime, size, desc]
+
+    if desc_cache is not None:
+        desc_cache.clear()
+        desc_cache.update(new_cache)
+
+    for parent, key, subtree in reversed(subdirs):
+        if not subtree:
+            del parent[key]
+
+    return root
+
+
+# Strings that can be written as plain YAML scalars without being read back
+# as something else (bool/null/number) or tripping on indicators like ": "
+_YAML_PLAIN_RE = re.compile(r"[A-Za-z_][\w .,/()+|-]*")
+_YAML_RESERVED = frozenset({"yes", "no", "true", "false", "on", "off", "null"})
+# Non-printable or line-break characters that must be escaped inside quotes
+_YAML_ESCAPE_RE = re.compile(
+    "[^\x09\x0A\x0D\x20-\x7E\xA0-\u2027\u202A-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]"
+)
+
+
+def _yaml_scalar(value: str) -> str:
+    if (_YAML_PLAIN_RE.fullmatch(value) and value[-1] != " "
+            and value.lower() not in _YAML_RESERVED):
+        return value
+    # A JSON string is a valid YAML double-quoted scalar
+    return _YAML_ESCAPE_RE.sub(
+        lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False)
+    )
 
-            subtree = _scan_directory(entry, depth + 1)
-            if subtree:
-                result[name + "/"] = subtree
 
-        elif entry.is_file():
-            ext = entry.suffix.lower()
-            if ext in SKIP_EXTENSIONS:
-                continue
+def _emit_tree(tree: dict, out: list[str], indent: int = 0):
+    """Append block-style YAML lines for a tree of str keys to str | dict values.
 
-            info_parts = []
+    Raises TypeError on anything else so the caller can fall back to PyYAML.
+    """
+    pad = "  " * indent
+    for key, value in tree.items():
+        if not isinstance(key, str):
+            raise TypeError(f"unsupported key: {key!r}")
+        if isinstance(value, str):
+            out.append(f"{pad}{_yaml_scalar(key)}: {_yaml_scalar(value)}\n")
+        elif isinstance(value, dict):
+            if value:
+                out.append(f"{pad}{_yaml_scalar(key)}:\n")
+                _emit_tree(value, out, indent + 1)
+            else:
+                out.append(f"{pad}{_yaml_scalar(key)}: {{}}\n")
+        else:
+            raise TypeError(f"unsupported value for {key!r}: {type(value).__name__}")
+
+
+def _write_index(output_path: Path, index_data: dict):
+    # The index is a plain str/dict tree, so a direct emitter is much faster
+    # than PyYAML's generic representer; keep PyYAML for anything unexpected.
+    out: list[str] = []
+    try:
+        _emit_tree(index_data, out)
+    except TypeError:
+        with output_path.open("w", encoding="utf-8") as f:
+            yaml.dump(
+                index_data, f, Dumper=_Dumper,
+                default_flow_style=False, sort_keys=False, width=120,
+            )
+        return
+    output_path.write_text("".join(out), encoding="utf-8")
 
-            # Get description for code files
-            if ext in CODE_EXTENSIONS:
-                desc = _extract_description(entry)
-                if desc:
-                    info_parts.append(desc)
-
-            # Note large files
-            try:
-                size = entry.stat().st_size
-                if size > LARGE_FILE_THRESHOLD:
-                    if size >= 1024 * 1024:
-                        info_parts.append(f"{size / (1024*1024):.1f}MB")
-                    else:
-                        info_parts.append(f"{size / 1024:.0f}KB")
-            except OSError:
-                pass
 
-            result[name] = " | ".join(info_parts) if info_parts else ""
+def _structure_digest(path: str, structure: dict) -> str:
+    payload = json.dumps([path, structure], ensure_ascii=False).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-    return result
+
+def _load_state(state_path: Path) -> dict:
+    """Previous run's digest and description cache; empty if missing or corrupt."""
+    try:
+        with state_path.open("rb") as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state_path: Path, state: dict):
+    try:
+        with state_path.open("w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=True)
+    except (OSError, ValueError) as e:
+        log.warning("Failed to save index state %s: %s", state_path, e)
 
 
 async def index_project(name: str, path: str) -> str:
@@ -175,21 +390,31 @@ async def index_project(name: str, path: str) -> str:
 
     log.info("Indexing project '%s' at %s", name, project_path)
 
-    structure = _scan_directory(project_path)
-
-    index_data = {
-        "project": name,
-        "path": str(project_path),
-        "scanned": datetime.now().strftime("%Y-%m-%d %H:%M"),
-        "structure": structure,
-    }
-
     output_path = output_dir / f"{name}.yaml"
-    output_path.write_text(
-        yaml.dump(index_data, default_flow_style=False, sort_keys=False, width=120)
-    )
-
-    log.info("Index written: %s", output_path)
+    state_path = output_dir / f"{name}.index.json"
+    state = await asyncio.to_thread(_load_state, state_path)
+    desc_cache = state.get("files")
+    if not isinstance(desc_cache, dict):
+        desc_cache = {}
+    old_files = dict(desc_cache)
+
+    structure = await asyncio.to_thread(_scan_directory, project_path, 0, desc_cache)
+    digest = _structure_digest(str(project_path), structure)
+
+    if digest == state.get("digest") and output_path.exists():
+        log.info("Index unchanged: %s", output_path)
+    else:
+        index_data = {
+            "project": name,
+            "path": str(project_path),
+            "scanned": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "structure": structure,
+        }
+        await asyncio.to_thread(_write_index, output_path, index_data)
+        log.info("Index written: %s", output_path)
+
+    if digest != state.get("digest") or desc_cache != old_files:
+        await asyncio.to_thread(_save_state, state_path, {"digest": digest, "files": desc_cache})
     return str(output_path)
 
 
@@ -202,10 +427,16 @@ async def index_all():
 
     log.info("Starting project indexing for %d projects", len(projects))
 
-    for proj in projects:
-        try:
-            await index_project(proj["name"], proj["path"])
-        except Exception as e:
-            log.error("Failed to index project '%s': %s", proj.get("name", "?"), e)
+    async def _index(proj: dict) -> str:
+        return await index_project(proj["name"], proj["path"])
+
+    # Projects are independent; let their disk I/O overlap
+    results = await asyncio.gather(
+        *(_index(proj) for proj in projects),
+        return_exceptions=True,
+    )
+    for proj, result in zip(projects, results):
+        if isinstance(result, BaseException):
+            log.error("Failed to index project '%s': %s", proj.get("name", "?"), result)
 
     log.info("Project indexing complete")
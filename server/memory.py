@@ -7,14 +7,61 @@ SQLite still handles conversations, summaries, usage, and KV.
 import asyncio
 import json
 import logging
-import uuid
+import re
+import secrets
+import time
+from functools import partial
 
-from . import config, db, embeddings, vectorstore
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+from . import config, db, embedding_cache, embeddings, memory_index, vectorstore
 
 log = logging.getLogger("conduit.memory")
 
+# Outermost JSON array in a model reply (fences/commentary around it ignored)
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+# (vectorstore version, fetched_at, memories) for the context fallback
+_fallback_cache: tuple[int, float, list[dict]] | None = None
+# Recency weighting drifts slowly, so refetch at least this often
+FALLBACK_CACHE_TTL = 300
+
+# app.providers, bound on first use by _brain()
+_providers: dict | None = None
+
+# Cap on Firestore RPCs one operation fans out at once
+VECTORSTORE_CONCURRENCY = 16
+# Lower cap for scheduled decay/consolidation so a maintenance burst leaves
+# Firestore and the event loop free for live requests
+MAINTENANCE_CONCURRENCY = 4
+
+# Reciprocal Rank Fusion damping constant
+RRF_K = 60
+
 # Memory categories
-CATEGORIES = {"preference", "fact", "person", "task", "schedule", "topic"}
+CATEGORIES = frozenset({"preference", "fact", "person", "task", "schedule", "topic"})
+
+# Acknowledgements that never carry a durable fact
+_FILLER_MESSAGES = frozenset({
+    "ok", "okay", "k", "thanks", "thank you", "thx", "ty", "cool", "nice",
+    "got it", "yes", "yep", "no", "nope", "sure", "great", "sounds good",
+})
+
+# Section headings for the context block, in display order
+_CATEGORY_LABELS = (
+    ("preference", "Preferences"),
+    ("fact", "Facts"),
+    ("person", "People"),
+    ("task", "Tasks"),
+    ("schedule", "Schedule"),
+    ("topic", "Interests"),
+)
 
 # Extraction prompt — now includes existing memories for contradiction detection
 EXTRACTION_PROMPT = """Analyze this conversation exchange and extract any memorable facts worth remembering for future conversations.
@@ -55,6 +102,13 @@ Rules:
 
 Reply with ONLY the JSON array, no other text."""
 
+# EXTRACTION_PROMPT's constant segments around its three fields, split once
+# so each extraction is a single join instead of a .format() parse
+_head, _rest = EXTRACTION_PROMPT.split("{user_message}")
+_mid, _rest = _rest.split("{assistant_message}")
+_EXTRACTION_PARTS = (_head, _mid, *_rest.split("{existing_context}"))
+del _head, _mid, _rest
+
 SUMMARY_PROMPT = """Summarize this conversation concisely. Focus on:
 - Key topics discussed
 - Decisions made
@@ -89,24 +143,113 @@ Rules:
 Reply with ONLY the JSON array, no other text."""
 
 
+def _brain():
+    """The configured brain provider, or None.
+
+    app.providers is imported once (a function-level import avoids the
+    circular import) and kept; app rebuilds that dict in place, so the cached
+    reference stays live. BRAIN_PROVIDER is re-read each call so routing
+    changes apply without a reset.
+    """
+    global _providers
+    if _providers is None:
+        from .app import providers
+        _providers = providers
+    return _providers.get(config.BRAIN_PROVIDER)
+
+
+def _is_trivial_exchange(user_message: str, assistant_message: str) -> bool:
+    """True when an exchange is too slight to be worth an extraction round-trip.
+
+    Plain acknowledgements are always skipped. Otherwise both sides must be
+    short, since a brief user line ("My sister is Ana") can still be a fact.
+    """
+    user = user_message.strip()
+    if user.lower().rstrip("!. ") in _FILLER_MESSAGES:
+        return True
+    return (len(user) < config.EXTRACTION_MIN_USER_CHARS
+            and len(assistant_message.strip()) < config.EXTRACTION_MIN_ASSISTANT_CHARS)
+
+
+def _parse_json_array(response: str):
+    """Parse the JSON array out of a model reply.
+
+    Tolerates markdown fences and stray commentary around the array.
+    Raises json.JSONDecodeError when there is nothing parseable.
+    """
+    text = response.strip()
+    if text == "[]":
+        return []
+    m = _JSON_ARRAY_RE.search(text)
+    if not m:
+        raise json.JSONDecodeError("No JSON array in response", text, 0)
+    try:
+        return _loads(m.group(0))
+    except ValueError:
+        # Trailing text with brackets of its own — take the first array only
+        return json.JSONDecoder().raw_decode(text, m.start())[0]
+
+
+async def _fan_out(calls, limit: int = VECTORSTORE_CONCURRENCY) -> list:
+    """Run independent vectorstore writes concurrently.
+
+    calls are zero-argument callables returning awaitables (e.g. partials);
+    at most limit run at a time. Exceptions are returned, not raised.
+    """
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(call):
+        async with sem:
+            return await call()
+
+    return await asyncio.gather(*(_run(c) for c in calls), return_exceptions=True)
+
+
+async def _embed_all(texts: list) -> dict:
+    """Embed texts with one batched call, keyed by text.
+
+    Returns {} if the batch fails; _embedding_for then embeds per item.
+    """
+    unique = [t for t in dict.fromkeys(texts) if t and isinstance(t, str)]
+    if not unique:
+        return {}
+    try:
+        return dict(zip(unique, await embeddings.embed_batch(unique)))
+    except Exception as e:
+        log.warning("Batch embedding failed, falling back to per-item: %s", e)
+        return {}
+
+
+async def _embedding_for(text: str, vectors: dict):
+    vec = vectors.get(text)
+    return vec if vec is not None else await embeddings.embed_text(text)
+
+
 async def extract_memories(user_message: str, assistant_message: str,
                            conversation_id: str):
     """Extract memories from a conversation exchange using Haiku, then embed and store."""
     if not config.EXTRACTION_ENABLED:
         return
+    if _is_trivial_exchange(user_message, assistant_message):
+        log.debug("Skipping memory extraction for trivial exchange")
+        return
 
-    # Get the brain provider
-    from .app import providers
-    brain = providers.get(config.BRAIN_PROVIDER)
+    brain = _brain()
     if not brain:
         log.debug("Brain provider not available for memory extraction")
         return
 
+    # Only copy when truncation is actually needed; the embedding query is a
+    # prefix of the prompt excerpt, so it slices that rather than the original
+    um = user_message if len(user_message) <= 1000 else user_message[:1000]
+    am = assistant_message if len(assistant_message) <= 1000 else assistant_message[:1000]
+    embed_q = um if len(um) <= 500 else um[:500]
+
     # Fetch existing memories for contradiction detection
     existing_context = ""
     if vectorstore.is_available():
         try:
-            query_embedding = await embeddings.embed_text(user_message[:500])
+            query_embedding = await embedding_cache.embed_text(embed_q)
             similar = await vectorstore.vector_search(query_embedding, top_k=5)
             if similar:
                 lines = ["Existing memories (check for contradictions or updates):"]
@@ -116,11 +259,8 @@ async def extract_memories(user_message: str, assistant_message: str,
         except Exception as e:
             log.debug("Failed to fetch existing memories for extraction: %s", e)
 
-    prompt = EXTRACTION_PROMPT.format(
-        user_message=user_message[:1000],
-        assistant_message=assistant_message[:1000],
-        existing_context=existing_context,
-    )
+    p = _EXTRACTION_PARTS
+    prompt = "".join((p[0], um, p[1], am, p[2], existing_context, p[3]))
 
     try:
         response, usage = await brain.generate(
@@ -130,13 +270,7 @@ async def extract_memories(user_message: str, assistant_message: str,
         await db.log_usage(brain.name, brain.model, usage.input_tokens, usage.output_tokens)
 
         # Parse JSON response
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            text = text.rsplit("```", 1)[0]
-        text = text.strip()
-
-        memories = json.loads(text)
+        memories = _parse_json_array(response)
         if not isinstance(memories, list):
             return
 
@@ -144,6 +278,19 @@ async def extract_memories(user_message: str, assistant_message: str,
             log.debug("Vectorstore unavailable — skipping memory storage")
             return
 
+        # Embed every candidate that will need a vector in one batched call.
+        # Exact repeats of stored memories are reinforced without one.
+        exact_ids: dict[str, str | None] = {}
+        to_embed = []
+        for mem in memories[:3]:
+            content = mem.get("content", "").strip()
+            if not content or mem.get("category", "fact") not in CATEGORIES:
+                continue
+            exact_ids[content] = await memory_index.find_exact(content)
+            if mem.get("action") == "update" or not exact_ids[content]:
+                to_embed.append(content)
+        vectors = await _embed_all(to_embed)
+
         for mem in memories[:3]:
             category = mem.get("category", "fact")
             content = mem.get("content", "").strip()
@@ -165,7 +312,7 @@ async def extract_memories(user_message: str, assistant_message: str,
                 if action == "update":
                     update_id = mem.get("updates_id", "")
                     if update_id:
-                        embedding = await embeddings.embed_text(content)
+                        embedding = await _embedding_for(content, vectors)
                         await vectorstore.upsert_memory(
                             doc_id=update_id,
                             category=category,
@@ -177,11 +324,18 @@ async def extract_memories(user_message: str, assistant_message: str,
                         log.info("Memory updated: [%s] %s (importance: %d)", category, content, importance)
                         continue
 
-                # Embed the memory content
-                embedding = await embeddings.embed_text(content)
+                # Exact repeat of a stored memory — no need to embed and search
+                existing = None
+                exact_id = exact_ids.get(content)
+                if exact_id:
+                    existing = await vectorstore.get_by_id(exact_id)
+
+                if not existing:
+                    # Embed the memory content
+                    embedding = await _embedding_for(content, vectors)
 
-                # Semantic dedup check
-                existing = await vectorstore.find_similar(embedding, config.DEDUP_THRESHOLD)
+                    # Semantic dedup check
+                    existing = await vectorstore.find_similar(embedding, config.DEDUP_THRESHOLD)
                 if existing:
                     # Reinforce — bump access count and refresh timestamp,
                     # upgrade importance if new mention is higher
@@ -192,7 +346,7 @@ async def extract_memories(user_message: str, assistant_message: str,
                     continue
 
                 # New memory — store it
-                doc_id = uuid.uuid4().hex[:12]
+                doc_id = secrets.token_hex(6)
                 await vectorstore.upsert_memory(
                     doc_id=doc_id,
                     category=category,
@@ -212,6 +366,52 @@ async def extract_memories(user_message: str, assistant_message: str,
         log.error("Memory extraction failed: %s", e)
 
 
+async def _high_importance_fallback() -> list[dict]:
+    """High-importance memories for the context fallback.
+
+    The query doesn't depend on the user's message, so the result is reused
+    until the store is written to or FALLBACK_CACHE_TTL passes.
+    """
+    global _fallback_cache
+    version = vectorstore.version()
+    now = time.monotonic()
+    if (_fallback_cache and _fallback_cache[0] == version
+            and now - _fallback_cache[1] < FALLBACK_CACHE_TTL):
+        return _fallback_cache[2]
+    high = await vectorstore.get_high_importance_recent(
+        config.IMPORTANCE_FLOOR, limit=5,
+    )
+    if high:  # don't pin an empty result from a failed query
+        _fallback_cache = (version, now, high)
+    return high
+
+
+def _emit_context(grouped: dict[str, list[str]]):
+    """Yield the pieces of the memory context block, to be joined once."""
+    yield "Things I remember about you:"
+    for cat, label in _CATEGORY_LABELS:
+        items = grouped.get(cat)
+        if items:
+            yield f"\n\n{label}:"
+            for item in items:
+                yield "\n- "
+                yield item
+
+
+def _rrf_order(ids: list[str], *rankings: dict[str, int]) -> list[str]:
+    """Order ids by summed Reciprocal Rank Fusion score across rankings.
+
+    Ranks are laid out as parallel arrays (-1 where a ranking missed the id)
+    so scoring is one vectorized pass. Ties keep the input order.
+    """
+    n = len(ids)
+    scores = np.zeros(n)
+    for ranking in rankings:
+        ranks = np.fromiter((ranking.get(i, -1) for i in ids), dtype=np.float64, count=n)
+        scores += np.where(ranks >= 0, 1.0 / (RRF_K + ranks), 0.0)
+    return [ids[i] for i in np.argsort(-scores, kind="stable")]
+
+
 async def get_memory_context(query: str = "") -> str:
     """Build formatted memory context for system prompt injection.
 
@@ -231,7 +431,7 @@ async def get_memory_context(query: str = "") -> str:
         # Path 1: Semantic search
         if query:
             try:
-                query_embedding = await embeddings.embed_query(query)
+                query_embedding = await embedding_cache.embed_query(query)
                 results = await vectorstore.vector_search(query_embedding, config.SEARCH_TOP_K)
                 for rank, m in enumerate(results):
                     memories_by_id[m["id"]] = m
@@ -242,8 +442,7 @@ async def get_memory_context(query: str = "") -> str:
         # Path 2: BM25 keyword search (gated by config)
         if query and config.BM25_ENABLED:
             try:
-                from . import memory_index
-                bm25_results = memory_index.search(query, config.HYBRID_TOP_K)
+                bm25_results = await memory_index.search(query, config.HYBRID_TOP_K)
                 for rank, hit in enumerate(bm25_results):
                     doc_id = hit["doc_id"]
                     bm25_ranks[doc_id] = rank
@@ -255,63 +454,32 @@ async def get_memory_context(query: str = "") -> str:
             except Exception as e:
                 log.warning("BM25 search failed: %s", e)
 
-        # Merge via Reciprocal Rank Fusion
+        # Merge via Reciprocal Rank Fusion, keep top HYBRID_TOP_K
         if memories_by_id and (semantic_ranks or bm25_ranks):
-            rrf_scores: dict[str, float] = {}
-            for doc_id in memories_by_id:
-                score = 0.0
-                if doc_id in semantic_ranks:
-                    score += 1.0 / (60 + semantic_ranks[doc_id])
-                if doc_id in bm25_ranks:
-                    score += 1.0 / (60 + bm25_ranks[doc_id])
-                rrf_scores[doc_id] = score
-
-            # Sort by RRF score descending, take top HYBRID_TOP_K
-            sorted_ids = sorted(rrf_scores, key=lambda x: rrf_scores[x], reverse=True)
-            top_ids = sorted_ids[:config.HYBRID_TOP_K]
-            memories_by_id = {did: memories_by_id[did] for did in top_ids if did in memories_by_id}
+            top_ids = _rrf_order(list(memories_by_id), semantic_ranks, bm25_ranks)
+            memories_by_id = {did: memories_by_id[did] for did in top_ids[:config.HYBRID_TOP_K]}
 
         # Fall back to high-importance memories if hybrid returned < 3
         if len(memories_by_id) < 3:
-            high = await vectorstore.get_high_importance_recent(
-                config.IMPORTANCE_FLOOR, limit=5,
-            )
-            for m in high:
+            for m in await _high_importance_fallback():
                 memories_by_id.setdefault(m["id"], m)
 
         if not memories_by_id:
             return ""
 
         # Touch accessed memories in the background (fire-and-forget)
-        for doc_id in memories_by_id:
-            asyncio.create_task(vectorstore.touch(doc_id))
+        asyncio.create_task(_fan_out(
+            [partial(vectorstore.touch, doc_id) for doc_id in memories_by_id]
+        ))
 
-        # Group by category
+        # Group by category, keeping at most 10 per category
         grouped: dict[str, list[str]] = {}
         for m in memories_by_id.values():
-            cat = m.get("category", "fact")
-            if cat not in grouped:
-                grouped[cat] = []
-            grouped[cat].append(m["content"])
-
-        lines = ["Things I remember about you:"]
-        category_labels = {
-            "preference": "Preferences",
-            "fact": "Facts",
-            "person": "People",
-            "task": "Tasks",
-            "schedule": "Schedule",
-            "topic": "Interests",
-        }
-
-        for cat, label in category_labels.items():
-            items = grouped.get(cat, [])
-            if items:
-                lines.append(f"\n{label}:")
-                for item in items[:10]:
-                    lines.append(f"- {item}")
-
-        return "\n".join(lines)
+            items = grouped.setdefault(m.get("category", "fact"), [])
+            if len(items) < 10:
+                items.append(m["content"])
+
+        return "".join(_emit_context(grouped))
 
     except Exception as e:
         log.warning("Failed to get memory context: %s", e)
@@ -337,6 +505,7 @@ async def decay_memories():
 
     try:
         stale = await vectorstore.get_stale_memories(days=14, limit=50)
+        writes = []
         decayed = 0
         deleted = 0
 
@@ -345,13 +514,15 @@ async def decay_memories():
             new_importance = current_importance - 1
 
             if new_importance < 3:
-                await vectorstore.delete(mem["id"])
+                writes.append(partial(vectorstore.delete, mem["id"]))
                 deleted += 1
                 log.debug("Memory forgotten (decayed below 3): %s", mem["content"][:50])
             else:
-                await vectorstore.decay(mem["id"], new_importance)
+                writes.append(partial(vectorstore.decay, mem["id"], new_importance))
                 decayed += 1
 
+        await _fan_out(writes, MAINTENANCE_CONCURRENCY)
+
         if decayed or deleted:
             log.info("Memory decay: %d decayed, %d forgotten", decayed, deleted)
 
@@ -368,8 +539,7 @@ async def consolidate_memories():
     if not vectorstore.is_available():
         return
 
-    from .app import providers
-    brain = providers.get(config.BRAIN_PROVIDER)
+    brain = _brain()
     if not brain:
         log.debug("Brain provider not available for consolidation")
         return
@@ -380,19 +550,15 @@ async def consolidate_memories():
             return  # Not enough to consolidate
 
         # Format memories for the prompt
-        lines = []
-        for m in all_memories:
-            age_days = 0
-            if m.get("created_at"):
-                import time
-                age_days = int((time.time() - m["created_at"]) / 86400)
-            accesses = m.get("access_count", 0)
-            lines.append(
-                f'[id:{m["id"]}] [{m.get("category", "fact")}] '
-                f'importance:{m.get("importance", 5)} '
-                f'age:{age_days}d accesses:{accesses} '
-                f'"{m["content"]}"'
-            )
+        now = time.time()
+        lines = [
+            f'[id:{m["id"]}] [{m.get("category", "fact")}] '
+            f'importance:{m.get("importance", 5)} '
+            f'age:{int((now - m["created_at"]) / 86400) if m.get("created_at") else 0}d '
+            f'accesses:{m.get("access_count", 0)} '
+            f'"{m["content"]}"'
+            for m in all_memories
+        ]
 
         prompt = CONSOLIDATION_PROMPT.format(memories="\n".join(lines))
         response, usage = await brain.generate(
@@ -402,16 +568,17 @@ async def consolidate_memories():
         await db.log_usage(brain.name, brain.model, usage.input_tokens, usage.output_tokens)
 
         # Parse response
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            text = text.rsplit("```", 1)[0]
-        text = text.strip()
-
-        actions = json.loads(text)
+        actions = _parse_json_array(response)
         if not isinstance(actions, list):
             return
 
+        # Embed all merged/updated texts in one batched call
+        vectors = await _embed_all([
+            act.get("merged_content") if act.get("action") == "merge" else act.get("content")
+            for act in actions[:10]
+            if isinstance(act, dict) and act.get("action") in ("merge", "update")
+        ])
+
         applied = 0
         for act in actions[:10]:
             try:
@@ -431,11 +598,13 @@ async def consolidate_memories():
                     importance = act.get("importance", 5)
                     if len(ids) >= 2 and merged_content:
                         # Delete old entries
-                        for old_id in ids:
-                            await vectorstore.delete(old_id)
+                        await _fan_out(
+                            (partial(vectorstore.delete, old_id) for old_id in ids),
+                            MAINTENANCE_CONCURRENCY,
+                        )
                         # Create merged entry
-                        embedding = await embeddings.embed_text(merged_content)
-                        doc_id = uuid.uuid4().hex[:12]
+                        embedding = await _embedding_for(merged_content, vectors)
+                        doc_id = secrets.token_hex(6)
                         await vectorstore.upsert_memory(
                             doc_id=doc_id,
                             category=category,
@@ -451,7 +620,7 @@ async def consolidate_memories():
                     new_content = act.get("content", "")
                     importance = act.get("importance")
                     if doc_id and new_content:
-                        embedding = await embeddings.embed_text(new_content)
+                        embedding = await _embedding_for(new_content, vectors)
                         update_fields = {
                             "content": new_content,
                             "embedding": embedding,
@@ -477,20 +646,16 @@ async def summarize_conversation(conversation_id: str):
     """Summarize a conversation using NIM (free). Background task."""
     from .app import get_provider
 
-    messages = await db.get_messages(conversation_id, limit=100)
+    # Independent reads — fetch the messages and prior summaries together
+    messages, existing = await asyncio.gather(
+        db.get_messages(conversation_id, limit=100),
+        db.get_conversation_summaries(conversation_id),
+    )
     if len(messages) < config.SUMMARY_THRESHOLD:
         return
 
-    # Check if we already have a summary for this range
-    existing = await db.get_conversation_summaries(conversation_id)
-    last_summarized = 0
-    if existing:
-        last_range = existing[-1].get("message_range", "")
-        if "-" in last_range:
-            try:
-                last_summarized = int(last_range.split("-")[1])
-            except (ValueError, IndexError):
-                pass
+    # Resume after the range the last summary covered
+    last_summarized = (existing[-1]["last_message_idx"] or 0) if existing else 0
 
     # Only summarize new messages
     new_messages = messages[last_summarized:]
@@ -515,7 +680,9 @@ async def summarize_conversation(conversation_id: str):
         await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
 
         message_range = f"{last_summarized}-{len(messages)}"
-        await db.add_conversation_summary(conversation_id, response.strip(), message_range)
+        await db.add_conversation_summary(
+            conversation_id, response.strip(), message_range, last_message_idx=len(messages),
+        )
         log.info("Conversation %s summarized (messages %s)", conversation_id, message_range)
 
     except Exception as e:
@@ -524,35 +691,30 @@ async def summarize_conversation(conversation_id: str):
 
 async def get_conversation_context(conversation_id: str) -> list[dict]:
     """Build conversation context: summaries of old messages + recent messages."""
-    summaries = await db.get_conversation_summaries(conversation_id)
-    messages = await db.get_messages(conversation_id, limit=100)
+    summaries, messages = await asyncio.gather(
+        db.get_conversation_summaries(conversation_id),
+        db.get_messages(conversation_id, limit=100),
+    )
 
+    last_summarized = 0
     result = []
-
     if summaries:
         summary_text = "\n\n".join(
             f"[Earlier in conversation] {s['summary']}" for s in summaries
         )
-        result.append({
-            "role": "user",
-            "content": f"[Context from earlier in our conversation:\n{summary_text}]",
-        })
-        result.append({
-            "role": "assistant",
-            "content": "I remember our earlier discussion. How can I help?",
-        })
-
-    last_summarized = 0
-    if summaries:
-        last_range = summaries[-1].get("message_range", "")
-        if "-" in last_range:
-            try:
-                last_summarized = int(last_range.split("-")[1])
-            except (ValueError, IndexError):
-                pass
-
-    recent = messages[last_summarized:]
-    for m in recent:
-        result.append({"role": m["role"], "content": m["content"]})
-
+        result = [
+            {
+                "role": "user",
+                "content": f"[Context from earlier in our conversation:\n{summary_text}]",
+            },
+            {
+                "role": "assistant",
+                "content": "I remember our earlier discussion. How can I help?",
+            },
+        ]
+        last_summarized = summaries[-1]["last_message_idx"] or 0
+
+    result.extend(
+        {"role": m["role"], "content": m["content"]} for m in messages[last_summarized:]
+    )
     return result
@@ -5,9 +5,12 @@ Write-through: vectorstore calls upsert/delete here on every mutation.
 Startup: sync_from_firestore() rebuilds the full index from Firestore.
 """
 
+import asyncio
 import logging
 import os
 import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
 from . import config
 
@@ -15,6 +18,71 @@ log = logging.getLogger("conduit.memory_index")
 
 _conn: sqlite3.Connection | None = None
 
+# One worker thread owns every call on the connection, so SQLite access stays
+# serialized while the event loop keeps streaming during disk I/O
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="bm25")
+
+# Documents live once, in memory_docs; memory_fts is an external-content
+# FTS5 index over it kept in step by triggers, so text isn't stored twice
+# and doc_id lookups hit a real index instead of scanning the FTS table.
+_DOCS_DDL = (
+    """CREATE TABLE IF NOT EXISTS memory_docs (
+        id INTEGER PRIMARY KEY,
+        doc_id TEXT NOT NULL UNIQUE,
+        content TEXT NOT NULL,
+        category TEXT NOT NULL,
+        content_hash INTEGER NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_memory_docs_hash ON memory_docs(content_hash)",
+)
+
+# Index plus the triggers feeding it; kept separate so a bulk rebuild can
+# load memory_docs without them and build the index in one pass afterwards
+_FTS_DDL = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts USING fts5(
+        content, category,
+        content='memory_docs', content_rowid='id',
+        tokenize='porter unicode61'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS memory_docs_ai AFTER INSERT ON memory_docs BEGIN
+        INSERT INTO memory_fts (rowid, content, category)
+        VALUES (new.id, new.content, new.category);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memory_docs_ad AFTER DELETE ON memory_docs BEGIN
+        INSERT INTO memory_fts (memory_fts, rowid, content, category)
+        VALUES ('delete', old.id, old.content, old.category);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS memory_docs_au AFTER UPDATE ON memory_docs BEGIN
+        INSERT INTO memory_fts (memory_fts, rowid, content, category)
+        VALUES ('delete', old.id, old.content, old.category);
+        INSERT INTO memory_fts (rowid, content, category)
+        VALUES (new.id, new.content, new.category);
+    END""",
+)
+_FTS_DROP = (
+    "DROP TRIGGER IF EXISTS memory_docs_ai",
+    "DROP TRIGGER IF EXISTS memory_docs_ad",
+    "DROP TRIGGER IF EXISTS memory_docs_au",
+    "DROP TABLE IF EXISTS memory_fts",
+)
+
+# sqlite3 keeps compiled statements in a per-connection cache keyed by SQL
+# text, so reusing these constants skips re-preparing them
+_SQL_UPSERT = (
+    "INSERT INTO memory_docs (doc_id, content, category, content_hash) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT(doc_id) DO UPDATE SET content = excluded.content, "
+    "category = excluded.category, content_hash = excluded.content_hash"
+)
+_SQL_DELETE = "DELETE FROM memory_docs WHERE doc_id = ?"
+_SQL_BY_HASH = "SELECT doc_id, content FROM memory_docs WHERE content_hash = ?"
+_SQL_SEARCH = (
+    "SELECT d.doc_id, d.content, d.category, f.rank "
+    "FROM memory_fts f JOIN memory_docs d ON d.id = f.rowid "
+    "WHERE memory_fts MATCH ? "
+    "ORDER BY f.rank "
+    "LIMIT ?"
+)
+
 
 def _get_conn() -> sqlite3.Connection | None:
     """Lazy-init SQLite connection with WAL mode and FTS5 table."""
@@ -31,10 +99,25 @@ def _get_conn() -> sqlite3.Connection | None:
 
         _conn = sqlite3.connect(db_path, check_same_thread=False)
         _conn.execute("PRAGMA journal_mode=WAL")
-        _conn.execute(
-            "CREATE VIRTUAL TABLE IF NOT EXISTS memory_fts "
-            "USING fts5(doc_id, content, category, tokenize='porter unicode61')"
-        )
+        # NORMAL is durable enough under WAL and skips an fsync per commit
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute("PRAGMA temp_store=MEMORY")
+        _conn.execute("PRAGMA mmap_size=268435456")
+        _conn.execute("PRAGMA cache_size=-65536")
+
+        # Older indexes kept the text inside memory_fts itself; drop them.
+        # The startup sync_from_firestore() repopulates the new layout.
+        row = _conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'memory_fts'"
+        ).fetchone()
+        if row and "memory_docs" not in row[0]:
+            log.info("Rebuilding BM25 index with external-content layout")
+            _conn.executescript(
+                "DROP TABLE IF EXISTS memory_fts; DROP TABLE IF EXISTS memory_hash;"
+            )
+
+        for stmt in _DOCS_DDL + _FTS_DDL:
+            _conn.execute(stmt)
         _conn.commit()
         log.info("BM25 index opened: %s", db_path)
         return _conn
@@ -44,37 +127,50 @@ def _get_conn() -> sqlite3.Connection | None:
         return None
 
 
-def upsert(doc_id: str, content: str, category: str) -> None:
-    """Insert or replace a document in the FTS5 index."""
+def _content_key(content: str) -> tuple[int, str]:
+    key = content.strip().lower()
+    return zlib.crc32(key.encode("utf-8")), key
+
+
+def _upsert_sync(doc_id: str, content: str, category: str) -> None:
     conn = _get_conn()
     if not conn:
         return
     try:
-        # Delete-then-insert (FTS5 doesn't support UPDATE)
-        conn.execute("DELETE FROM memory_fts WHERE doc_id = ?", (doc_id,))
-        conn.execute(
-            "INSERT INTO memory_fts (doc_id, content, category) VALUES (?, ?, ?)",
-            (doc_id, content, category),
-        )
+        content_hash = _content_key(content)[0]
+        conn.execute(_SQL_UPSERT, (doc_id, content, category, content_hash))
         conn.commit()
     except Exception as e:
         log.warning("BM25 upsert failed for %s: %s", doc_id, e)
 
 
-def delete(doc_id: str) -> None:
-    """Remove a document from the FTS5 index."""
+def _delete_sync(doc_id: str) -> None:
     conn = _get_conn()
     if not conn:
         return
     try:
-        conn.execute("DELETE FROM memory_fts WHERE doc_id = ?", (doc_id,))
+        conn.execute(_SQL_DELETE, (doc_id,))
         conn.commit()
     except Exception as e:
         log.warning("BM25 delete failed for %s: %s", doc_id, e)
 
 
-def search(query: str, top_k: int | None = None) -> list[dict]:
-    """BM25-ranked keyword search. Returns [{doc_id, content, category, score}]."""
+def _find_exact_sync(content: str) -> str | None:
+    conn = _get_conn()
+    if not conn:
+        return None
+    try:
+        content_hash, key = _content_key(content)
+        for doc_id, stored in conn.execute(_SQL_BY_HASH, (content_hash,)):
+            if _content_key(stored)[1] == key:  # rule out CRC collisions
+                return doc_id
+        return None
+    except Exception as e:
+        log.debug("Exact match lookup failed: %s", e)
+        return None
+
+
+def _search_sync(query: str, top_k: int | None = None) -> list[dict]:
     conn = _get_conn()
     if not conn:
         return []
@@ -83,14 +179,7 @@ def search(query: str, top_k: int | None = None) -> list[dict]:
     try:
         # Wrap query in quotes for phrase matching, escape internal quotes
         safe_query = '"' + query.replace('"', '""') + '"'
-        cursor = conn.execute(
-            "SELECT doc_id, content, category, rank "
-            "FROM memory_fts "
-            "WHERE memory_fts MATCH ? "
-            "ORDER BY rank "
-            "LIMIT ?",
-            (safe_query, top_k),
-        )
+        cursor = conn.execute(_SQL_SEARCH, (safe_query, top_k))
         results = []
         for row in cursor:
             results.append({
@@ -105,11 +194,63 @@ def search(query: str, top_k: int | None = None) -> list[dict]:
         return []
 
 
-async def sync_from_firestore() -> None:
-    """Full rebuild of the FTS5 index from Firestore via vectorstore.get_all()."""
+def _rebuild_sync(rows: list[tuple[str, str, str]]) -> None:
     conn = _get_conn()
     if not conn:
         return
+    # One transaction: drop the index and its triggers, bulk-load the
+    # documents, then let FTS5 build and merge the index in a single pass
+    # instead of growing it a segment per inserted row.
+    conn.execute("BEGIN")
+    try:
+        for stmt in _FTS_DROP:
+            conn.execute(stmt)
+        conn.execute("DELETE FROM memory_docs")
+        conn.executemany(
+            _SQL_UPSERT,
+            [(doc_id, content, category, _content_key(content)[0])
+             for doc_id, content, category in rows],
+        )
+        for stmt in _FTS_DDL:
+            conn.execute(stmt)
+        conn.execute("INSERT INTO memory_fts (memory_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO memory_fts (memory_fts) VALUES ('optimize')")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    # Hand the rebuild's WAL pages back to the filesystem
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+async def _run(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, fn, *args)
+
+
+async def upsert(doc_id: str, content: str, category: str) -> None:
+    """Insert or replace a document in the FTS5 index."""
+    await _run(_upsert_sync, doc_id, content, category)
+
+
+async def delete(doc_id: str) -> None:
+    """Remove a document from the FTS5 index."""
+    await _run(_delete_sync, doc_id)
+
+
+async def find_exact(content: str) -> str | None:
+    """Return the doc_id of a memory with the same text (case-insensitive), if any."""
+    return await _run(_find_exact_sync, content)
+
+
+async def search(query: str, top_k: int | None = None) -> list[dict]:
+    """BM25-ranked keyword search. Returns [{doc_id, content, category, score}]."""
+    return await _run(_search_sync, query, top_k)
+
+
+async def sync_from_firestore() -> None:
+    """Full rebuild of the FTS5 index from Firestore via vectorstore.get_all()."""
+    if not config.BM25_ENABLED:
+        return
 
     try:
         from . import vectorstore
@@ -117,21 +258,13 @@ async def sync_from_firestore() -> None:
         all_memories = await vectorstore.get_all(limit=1000)
         log.info("BM25 sync: fetched %d memories from Firestore", len(all_memories))
 
-        # Clear existing index
-        conn.execute("DELETE FROM memory_fts")
-
-        # Re-insert all
-        for mem in all_memories:
-            doc_id = mem.get("id", "")
-            content = mem.get("content", "")
-            category = mem.get("category", "fact")
-            if doc_id and content:
-                conn.execute(
-                    "INSERT INTO memory_fts (doc_id, content, category) VALUES (?, ?, ?)",
-                    (doc_id, content, category),
-                )
+        rows = [
+            (mem["id"], mem["content"], mem.get("category", "fact"))
+            for mem in all_memories
+            if mem.get("id") and mem.get("content")
+        ]
 
-        conn.commit()
+        await _run(_rebuild_sync, rows)
         log.info("BM25 sync complete: %d documents indexed", len(all_memories))
 
     except Exception as e:
@@ -6,6 +6,12 @@ from collections.abc import AsyncIterator
 
 import anthropic
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from .base import BaseProvider, StreamChunk, StreamDone, StreamToolCall, ToolCall, Usage
 
 log = logging.getLogger("conduit.anthropic")
@@ -39,7 +45,9 @@ class AnthropicProvider(BaseProvider):
         # Accumulate tool use blocks from events
         current_tool_id = None
         current_tool_name = None
-        current_tool_json = ""
+        # Argument JSON arrives in fragments; a bytearray appends in place and
+        # both decoders take it directly
+        current_tool_json = bytearray()
         tool_calls: list[ToolCall] = []
 
         async with self.client.messages.stream(**kwargs) as stream:
@@ -50,20 +58,20 @@ class AnthropicProvider(BaseProvider):
                     if block.type == "tool_use":
                         current_tool_id = block.id
                         current_tool_name = block.name
-                        current_tool_json = ""
+                        current_tool_json.clear()
 
                 elif event.type == "content_block_delta":
                     delta = event.delta
                     if delta.type == "text_delta":
                         yield StreamChunk(text=delta.text)
                     elif delta.type == "input_json_delta":
-                        current_tool_json += delta.partial_json
+                        current_tool_json += delta.partial_json.encode()
 
                 elif event.type == "content_block_stop":
                     if current_tool_id:
                         try:
-                            args = json.loads(current_tool_json) if current_tool_json else {}
-                        except json.JSONDecodeError:
+                            args = _loads(current_tool_json) if current_tool_json else {}
+                        except ValueError:  # both decoders' errors subclass it
                             args = {}
                         tool_calls.append(ToolCall(
                             id=current_tool_id,
@@ -72,7 +80,7 @@ class AnthropicProvider(BaseProvider):
                         ))
                         current_tool_id = None
                         current_tool_name = None
-                        current_tool_json = ""
+                        current_tool_json.clear()
 
             # Get final message for usage
             msg = await stream.get_final_message()
@@ -5,25 +5,27 @@ from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 
 
-@dataclass
+# Stream items are created per token and only read by consumers, so they are
+# slotted and frozen. Usage stays mutable: the agent loop sums turns into it.
+@dataclass(slots=True)
 class Usage:
     input_tokens: int = 0
     output_tokens: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamChunk:
     """A single piece of streamed text."""
     text: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamDone:
     """Signals end of stream, carries usage info."""
     usage: Usage
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """A single tool call request from the model."""
     id: str
@@ -31,7 +33,7 @@ class ToolCall:
     arguments: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamToolCall:
     """Yielded when the model wants to call tools instead of (or after) text."""
     tool_calls: list[ToolCall] = field(default_factory=list)
@@ -5,18 +5,122 @@ Endpoint: https://chatgpt.com/backend-api/codex/responses
 Models: gpt-5.1-codex-mini, gpt-5.1-codex-max
 """
 
+import importlib.util
 import json
 import logging
 from collections.abc import AsyncIterator
 
 import httpx
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 from .base import BaseProvider, StreamChunk, StreamDone, StreamToolCall, ToolCall, Usage
 
 log = logging.getLogger("conduit.chatgpt")
 
 RESPONSES_URL = "https://chatgpt.com/backend-api/codex/responses"
 
+# Stream events the provider acts on, mapped to a small kind code so every
+# event costs one dict lookup; anything else (argument deltas, part/item
+# bookkeeping) is skipped on the spot
+_TEXT_DELTA, _ITEM_DONE, _COMPLETED, _FAILED = range(1, 5)
+_EVENT_KINDS = {
+    "response.output_text.delta": _TEXT_DELTA,
+    "response.output_item.done": _ITEM_DONE,
+    "response.completed": _COMPLETED,
+    "response.done": _COMPLETED,
+    "response.failed": _FAILED,
+    "response.incomplete": _FAILED,
+}
+# The quoted type names as bytes. A payload containing none of them cannot be
+# an event we act on, so it is dropped without being parsed. Matching the
+# quoted value alone is insensitive to key spacing, and a stray hit in
+# free text only costs a parse, since the type is checked again after it.
+_EVENT_NEEDLES = tuple(f'"{etype}"'.encode() for etype in _EVENT_KINDS)
+
+# Shared across turns so each request reuses a warm TLS connection
+_client: httpx.AsyncClient | None = None
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_logged_http_version = False
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=15, read=90, write=15, pool=15),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20,
+                                keepalive_expiry=60.0),
+            http2=_HTTP2,
+        )
+    return _client
+
+
+async def close():
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+_DATA_PREFIX = b"data: "
+_DATA_PREFIX_LEN = len(_DATA_PREFIX)
+
+
+async def _iter_sse_payloads(resp: httpx.Response) -> AsyncIterator[bytes]:
+    """Yield the raw payload of each SSE ``data:`` line, stopping at [DONE].
+
+    Splits lines on bytes, so event:/blank/keep-alive lines are skipped
+    without ever being decoded to str. Payloads are sliced through a
+    memoryview so each one is copied out of the buffer exactly once.
+    """
+    tail = bytearray()
+    async for chunk in resp.aiter_bytes():
+        tail += chunk
+        start = 0
+        # The view must be released before the buffer is resized below
+        with memoryview(tail) as view:
+            while (idx := tail.find(b"\n", start)) != -1:
+                if tail.startswith(_DATA_PREFIX, start):
+                    end = idx - 1 if idx > start and tail[idx - 1] == 0x0D else idx
+                    payload = view[start + _DATA_PREFIX_LEN:end].tobytes()
+                    if payload == b"[DONE]":
+                        return
+                    yield payload
+                start = idx + 1
+        del tail[:start]
+    if tail.startswith(_DATA_PREFIX):
+        payload = bytes(tail[_DATA_PREFIX_LEN:]).rstrip(b"\r")
+        if payload != b"[DONE]":
+            yield payload
+
+
+def _to_api_tools(tools: list) -> list:
+    """Convert OpenAI function-calling tools to the Responses API format."""
+    api_tools = []
+    for t in tools:
+        if t.get("type") == "function":
+            func = t["function"]
+            api_tools.append({
+                "type": "function",
+                "name": func["name"],
+                "description": func.get("description", ""),
+                "parameters": func.get("parameters", {}),
+            })
+        else:
+            api_tools.append(t)
+    return api_tools
+
 
 class ChatGPTProvider(BaseProvider):
     """ChatGPT Codex Responses API provider authenticated via ChatGPT Plus OAuth."""
@@ -24,6 +128,9 @@ class ChatGPTProvider(BaseProvider):
     def __init__(self, name: str, model: str):
         self.name = name
         self.model = model
+        # (tools list as passed in, its Responses API form); holding the list
+        # itself keeps the identity check sound
+        self._tools_cache: tuple[list, list] | None = None
 
     @property
     def supports_tools(self) -> bool:
@@ -31,6 +138,7 @@ class ChatGPTProvider(BaseProvider):
 
     async def stream(self, messages: list[dict], system: str = "",
                      tools: list | None = None) -> AsyncIterator[StreamChunk | StreamDone | StreamToolCall]:
+        global _logged_http_version
         from ..chatgpt_auth import get_access_token_async
 
         token = await get_access_token_async()
@@ -48,7 +156,7 @@ class ChatGPTProvider(BaseProvider):
                 api_input.append({
                     "type": "function_call_output",
                     "call_id": msg.get("tool_call_id", ""),
-                    "output": content if isinstance(content, str) else json.dumps(content),
+                    "output": content if isinstance(content, str) else _dumps(content),
                 })
                 continue
 
@@ -85,20 +193,11 @@ class ChatGPTProvider(BaseProvider):
         }
 
         if tools:
-            # Convert OpenAI function-calling tools format to Responses API format
-            api_tools = []
-            for t in tools:
-                if t.get("type") == "function":
-                    func = t["function"]
-                    api_tools.append({
-                        "type": "function",
-                        "name": func["name"],
-                        "description": func.get("description", ""),
-                        "parameters": func.get("parameters", {}),
-                    })
-                else:
-                    api_tools.append(t)
-            body["tools"] = api_tools
+            # The agent loop passes the same list every turn; convert it once
+            cached = self._tools_cache
+            if cached is None or cached[0] is not tools:
+                cached = self._tools_cache = (tools, _to_api_tools(tools))
+            body["tools"] = cached[1]
 
         headers = {
             "Authorization": f"Bearer {token}",
@@ -109,72 +208,66 @@ class ChatGPTProvider(BaseProvider):
         tool_calls: list[ToolCall] = []
         text_parts: list[str] = []
 
-        async with httpx.AsyncClient(timeout=httpx.Timeout(
-            connect=15, read=90, write=15, pool=15
-        )) as client:
-            async with client.stream("POST", RESPONSES_URL, json=body, headers=headers) as resp:
-                if resp.status_code != 200:
-                    error_body = await resp.aread()
-                    try:
-                        err = json.loads(error_body).get("error", {}).get("message", error_body.decode())
-                    except Exception:
-                        err = error_body.decode()[:200]
-                    raise RuntimeError(f"ChatGPT API error ({resp.status_code}): {err}")
-
-                async for line in resp.aiter_lines():
-                    if not line.startswith("data: "):
-                        continue
-                    payload = line[6:]
-                    if payload == "[DONE]":
-                        break
-
-                    try:
-                        event = json.loads(payload)
-                    except json.JSONDecodeError:
-                        continue
-
-                    etype = event.get("type", "")
-
-                    # Text output delta
-                    if etype == "response.output_text.delta":
-                        delta = event.get("delta", "")
-                        if delta:
-                            yield StreamChunk(text=delta)
-                            text_parts.append(delta)
-
-                    # Function call arguments delta
-                    elif etype == "response.function_call_arguments.delta":
-                        pass  # Accumulated on .done
-
-                    # Function call completed
-                    elif etype == "response.output_item.done":
-                        item = event.get("item", {})
-                        if item.get("type") == "function_call":
-                            try:
-                                args = json.loads(item.get("arguments", "{}"))
-                            except json.JSONDecodeError:
-                                args = {}
-                            # Use `id` (fc_ prefix) not `call_id` (call_ prefix) —
-                            # the Responses API requires IDs starting with 'fc'
-                            tool_calls.append(ToolCall(
-                                id=item.get("id", item.get("call_id", "")),
-                                name=item.get("name", ""),
-                                arguments=args,
-                            ))
-
-                    # Terminal events — extract usage and stop reading
-                    elif etype in ("response.completed", "response.done"):
-                        resp_obj = event.get("response", {})
-                        usage_data = resp_obj.get("usage", {})
-                        usage = Usage(
-                            input_tokens=usage_data.get("input_tokens", 0),
-                            output_tokens=usage_data.get("output_tokens", 0),
-                        )
-                        break
-
-                    elif etype in ("response.failed", "response.incomplete"):
-                        log.warning("ChatGPT stream ended with %s: %s", etype, event)
-                        break
+        client = _get_client()
+        async with client.stream("POST", RESPONSES_URL, json=body, headers=headers) as resp:
+            if not _logged_http_version:
+                log.debug("ChatGPT stream negotiated %s", resp.http_version)
+                _logged_http_version = True
+            if resp.status_code != 200:
+                error_body = await resp.aread()
+                try:
+                    err = _loads(error_body).get("error", {}).get("message", error_body.decode())
+                except Exception:
+                    err = error_body.decode()[:200]
+                raise RuntimeError(f"ChatGPT API error ({resp.status_code}): {err}")
+
+            async for payload in _iter_sse_payloads(resp):
+                if not any(needle in payload for needle in _EVENT_NEEDLES):
+                    continue
+                try:
+                    event = _loads(payload)
+                except ValueError:
+                    continue
+
+                etype = event.get("type", "")
+                kind = _EVENT_KINDS.get(etype)
+                if kind is None:
+                    continue  # Function call arguments arrive whole on .output_item.done
+
+                if kind == _TEXT_DELTA:
+                    delta = event.get("delta", "")
+                    if delta:
+                        yield StreamChunk(text=delta)
+                        text_parts.append(delta)
+
+                elif kind == _ITEM_DONE:
+                    item = event.get("item", {})
+                    if item.get("type") == "function_call":
+                        try:
+                            args = _loads(item.get("arguments", "{}"))
+                        except ValueError:
+                            args = {}
+                        # Use `id` (fc_ prefix) not `call_id` (call_ prefix) —
+                        # the Responses API requires IDs starting with 'fc'
+                        tool_calls.append(ToolCall(
+                            id=item.get("id", item.get("call_id", "")),
+                            name=item.get("name", ""),
+                            arguments=args,
+                        ))
+
+                # Terminal events — extract usage and stop reading
+                elif kind == _COMPLETED:
+                    resp_obj = event.get("response", {})
+                    usage_data = resp_obj.get("usage", {})
+                    usage = Usage(
+                        input_tokens=usage_data.get("input_tokens", 0),
+                        output_tokens=usage_data.get("output_tokens", 0),
+                    )
+                    break
+
+                else:
+                    log.warning("ChatGPT stream ended with %s: %s", etype, event)
+                    break
 
         if tool_calls:
             yield StreamToolCall(tool_calls=tool_calls)
@@ -190,7 +283,7 @@ class ChatGPTProvider(BaseProvider):
                 "type": "function",
                 "function": {
                     "name": tc.name,
-                    "arguments": json.dumps(tc.arguments),
+                    "arguments": _dumps(tc.arguments),
                 },
             }
             for tc in tool_calls
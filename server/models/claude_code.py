@@ -6,10 +6,22 @@ import logging
 import os
 import shutil
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 from .base import BaseProvider, StreamChunk, StreamDone, Usage
 
 log = logging.getLogger("conduit.claude_code")
 
+# Text deltas are coalesced into one WebSocket frame; a batch is flushed
+# after this many deltas, before any tool/result event, or once stdout
+# has been quiet for CHUNK_FLUSH_SECONDS
+CHUNK_BATCH_MAX = 8
+CHUNK_FLUSH_SECONDS = 0.01
+
 
 class ClaudeCodeProvider(BaseProvider):
     """Provider that pipes prompts through the Claude Code CLI.
@@ -80,21 +92,45 @@ class ClaudeCodeProvider(BaseProvider):
         new_session_id: str | None = None
         cost_usd = 0.0
         prev_text_len = 0  # Track text sent so far for delta computation
+        pending: list[str] = []  # Deltas not yet sent to the client
+
+        async def flush():
+            if pending:
+                await manager.send_chunk(ws, "".join(pending))
+                pending.clear()
 
         try:
             async with asyncio.timeout(self.timeout):
-                async for raw_line in proc.stdout:
-                    line = raw_line.decode().strip()
+                while True:
+                    try:
+                        if pending:
+                            line = await asyncio.wait_for(
+                                proc.stdout.readuntil(b"\n"), CHUNK_FLUSH_SECONDS,
+                            )
+                        else:
+                            line = await proc.stdout.readuntil(b"\n")
+                    except TimeoutError:
+                        # Nothing more buffered — don't hold text back
+                        await flush()
+                        continue
+                    except asyncio.IncompleteReadError as e:
+                        line = e.partial  # Last line without a newline, or EOF
+                        if not line:
+                            break
+                    # Parsed straight from bytes; lines are never decoded to str
+                    line = line.strip()
                     if not line:
                         continue
 
                     try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        log.debug("Non-JSON line: %s", line[:100])
+                        event = _loads(line)
+                    except ValueError:
+                        log.debug("Non-JSON line: %r", line[:100])
                         continue
 
                     etype = event.get("type")
+                    if etype != "assistant":
+                        await flush()
 
                     if etype == "system":
                         if event.get("subtype") == "init":
@@ -113,14 +149,17 @@ class ClaudeCodeProvider(BaseProvider):
                                 # Compute delta from previously sent text
                                 if len(text) > prev_text_len:
                                     delta = text[prev_text_len:]
-                                    await manager.send_chunk(ws, delta)
+                                    pending.append(delta)
                                     full_text_parts.append(delta)
                                     prev_text_len = len(text)
+                                    if len(pending) >= CHUNK_BATCH_MAX:
+                                        await flush()
 
                             elif btype == "tool_use":
                                 tool_id = block.get("id", "")
                                 tool_name = block.get("name", "unknown")
                                 tool_input = block.get("input", {})
+                                await flush()
                                 await manager.send_tool_start(
                                     ws, tool_id, tool_name, tool_input
                                 )
@@ -161,10 +200,13 @@ class ClaudeCodeProvider(BaseProvider):
                         if not new_session_id:
                             new_session_id = event.get("session_id")
 
+                await flush()
+
         except TimeoutError:
             log.warning("Claude Code timed out after %ds", self.timeout)
             proc.kill()
             await proc.wait()
+            await flush()
             await manager.send_error(ws, f"Claude Code timed out after {self.timeout}s")
         except asyncio.CancelledError:
             log.info("Claude Code cancelled — killing subprocess")
@@ -13,6 +13,76 @@ from .base import BaseProvider, StreamChunk, StreamDone, StreamToolCall, ToolCal
 log = logging.getLogger("conduit.gemini")
 
 
+# Bound once; message conversion builds these per message
+_Content = types.Content
+_Part = types.Part
+
+
+def _to_contents(messages: list[dict]) -> list[types.Content]:
+    """Convert chat messages to Gemini Content objects."""
+    # Hot path: plain-text conversation with no tool traffic
+    if not any(m.get("role") == "tool" or isinstance(m.get("content"), list) for m in messages):
+        return [
+            _Content(role="user" if m["role"] == "user" else "model",
+                     parts=[_Part(text=m["content"])])
+            for m in messages
+            if m.get("content")
+        ]
+    return _convert_contents(messages)
+
+
+def _convert_contents(messages: list[dict]) -> list[types.Content]:
+    """General conversion: content blocks and tool results included."""
+    contents = []
+    for msg in messages:
+        role = "user" if msg["role"] == "user" else "model"
+
+        # Handle Anthropic-style content blocks (list of dicts)
+        if isinstance(msg.get("content"), list):
+            parts = []
+            for block in msg["content"]:
+                if isinstance(block, dict):
+                    if block.get("type") == "text":
+                        parts.append(_Part(text=block["text"]))
+                    elif block.get("type") == "tool_use":
+                        parts.append(_Part(
+                            function_call=types.FunctionCall(
+                                name=block["name"],
+                                args=block.get("input", {}),
+                            )
+                        ))
+                    elif block.get("type") == "tool_result":
+                        parts.append(_Part(
+                            function_response=types.FunctionResponse(
+                                name=block.get("name", "tool"),
+                                response={"result": block.get("content", "")},
+                            )
+                        ))
+                else:
+                    parts.append(_Part(text=str(block)))
+            if parts:
+                contents.append(_Content(role=role, parts=parts))
+        elif msg.get("role") == "tool":
+            # OpenAI-format tool result — convert to Gemini function_response
+            contents.append(_Content(
+                role="user",
+                parts=[_Part(
+                    function_response=types.FunctionResponse(
+                        name=msg.get("name", "tool"),
+                        response={"result": msg.get("content", "")},
+                    )
+                )],
+            ))
+        else:
+            content_str = msg.get("content") or ""
+            if content_str:
+                contents.append(_Content(
+                    role=role,
+                    parts=[_Part(text=content_str)],
+                ))
+    return contents
+
+
 class GeminiProvider(BaseProvider):
 
     def __init__(self, name: str, model: str,
@@ -38,53 +108,7 @@ class GeminiProvider(BaseProvider):
 
     async def stream(self, messages: list[dict], system: str = "",
                      tools: list | None = None) -> AsyncIterator[StreamChunk | StreamDone | StreamToolCall]:
-        contents = []
-        for msg in messages:
-            role = "user" if msg["role"] == "user" else "model"
-
-            # Handle Anthropic-style content blocks (list of dicts)
-            if isinstance(msg.get("content"), list):
-                parts = []
-                for block in msg["content"]:
-                    if isinstance(block, dict):
-                        if block.get("type") == "text":
-                            parts.append(types.Part(text=block["text"]))
-                        elif block.get("type") == "tool_use":
-                            parts.append(types.Part(
-                                function_call=types.FunctionCall(
-                                    name=block["name"],
-                                    args=block.get("input", {}),
-                                )
-                            ))
-                        elif block.get("type") == "tool_result":
-                            parts.append(types.Part(
-                                function_response=types.FunctionResponse(
-                                    name=block.get("name", "tool"),
-                                    response={"result": block.get("content", "")},
-                                )
-                            ))
-                    else:
-                        parts.append(types.Part(text=str(block)))
-                if parts:
-                    contents.append(types.Content(role=role, parts=parts))
-            elif msg.get("role") == "tool":
-                # OpenAI-format tool result — convert to Gemini function_response
-                contents.append(types.Content(
-                    role="user",
-                    parts=[types.Part(
-                        function_response=types.FunctionResponse(
-                            name=msg.get("name", "tool"),
-                            response={"result": msg.get("content", "")},
-                        )
-                    )],
-                ))
-            else:
-                content_str = msg.get("content") or ""
-                if content_str:
-                    contents.append(types.Content(
-                        role=role,
-                        parts=[types.Part(text=content_str)],
-                    ))
+        contents = _to_contents(messages)
 
         cfg = types.GenerateContentConfig(
             max_output_tokens=4096,
@@ -114,25 +138,26 @@ class GeminiProvider(BaseProvider):
         tool_calls: list[ToolCall] = []
 
         async for chunk in response:
-            if chunk.usage_metadata:
-                input_tokens = chunk.usage_metadata.prompt_token_count or 0
-                output_tokens = chunk.usage_metadata.candidates_token_count or 0
-
-            if chunk.candidates:
-                for candidate in chunk.candidates:
-                    if candidate.content and candidate.content.parts:
-                        for part in candidate.content.parts:
-                            if part.text:
-                                yield StreamChunk(text=part.text)
-                            elif part.function_call:
-                                # Gemini doesn't have tool call IDs — generate synthetic ones
-                                tc_id = f"gemini_{uuid.uuid4().hex[:8]}"
-                                args = dict(part.function_call.args) if part.function_call.args else {}
-                                tool_calls.append(ToolCall(
-                                    id=tc_id,
-                                    name=part.function_call.name,
-                                    arguments=args,
-                                ))
+            meta = chunk.usage_metadata
+            if meta:
+                input_tokens = meta.prompt_token_count or 0
+                output_tokens = meta.candidates_token_count or 0
+
+            for candidate in chunk.candidates or ():
+                content = candidate.content
+                for part in (content and content.parts) or ():
+                    if part.text:
+                        yield StreamChunk(text=part.text)
+                    elif fc := part.function_call:
+                        # Gemini doesn't have tool call IDs — generate synthetic ones
+                        tc_id = f"gemini_{uuid.uuid4().hex[:8]}"
+                        # google-genai already decodes args into a
+                        # fresh dict per chunk; no copy needed
+                        tool_calls.append(ToolCall(
+                            id=tc_id,
+                            name=fc.name,
+                            arguments=fc.args or {},
+                        ))
 
         if tool_calls:
             yield StreamToolCall(tool_calls=tool_calls)
@@ -2,15 +2,30 @@
 
 import json
 import logging
+from collections import defaultdict
 from collections.abc import AsyncIterator
 
 import openai
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 from .base import BaseProvider, StreamChunk, StreamDone, StreamToolCall, ToolCall, Usage
 
 log = logging.getLogger("conduit.openai_compat")
 
 
+def _new_tool_call() -> dict:
+    return {"id": "", "name": "", "arguments": bytearray()}
+
+
 class OpenAICompatProvider(BaseProvider):
 
     def __init__(self, name: str, base_url: str, api_key: str, model: str):
@@ -36,13 +51,16 @@ class OpenAICompatProvider(BaseProvider):
             stream_options={"include_usage": True},
         )
         if tools:
-            kwargs["tools"] = tools
+            # extra_body is merged into the request JSON as-is; passing the
+            # already OpenAI-shaped schemas there skips the SDK's recursive
+            # typed transform of the whole tool catalog on every turn
+            kwargs["extra_body"] = {"tools": tools}
 
         response = await self.client.chat.completions.create(**kwargs)
 
         usage = Usage()
-        # Accumulate tool call deltas: {index: {"id": ..., "name": ..., "arguments": ...}}
-        tc_accum: dict[int, dict] = {}
+        # Accumulate tool call deltas: {index: {"id": ..., "name": ..., "arguments": bytearray}}
+        tc_accum: defaultdict[int, dict] = defaultdict(_new_tool_call)
 
         async for chunk in response:
             # Usage info (usually on the final chunk)
@@ -64,16 +82,14 @@ class OpenAICompatProvider(BaseProvider):
             # Accumulate tool calls
             if delta.tool_calls:
                 for tc_delta in delta.tool_calls:
-                    idx = tc_delta.index
-                    if idx not in tc_accum:
-                        tc_accum[idx] = {"id": "", "name": "", "arguments": ""}
+                    acc = tc_accum[tc_delta.index]
                     if tc_delta.id:
-                        tc_accum[idx]["id"] = tc_delta.id
-                    if tc_delta.function:
-                        if tc_delta.function.name:
-                            tc_accum[idx]["name"] = tc_delta.function.name
-                        if tc_delta.function.arguments:
-                            tc_accum[idx]["arguments"] += tc_delta.function.arguments
+                        acc["id"] = tc_delta.id
+                    if fn := tc_delta.function:
+                        if fn.name:
+                            acc["name"] = fn.name
+                        if fn.arguments:
+                            acc["arguments"] += fn.arguments.encode()
 
         # If we accumulated tool calls, yield them before done
         if tc_accum:
@@ -81,9 +97,9 @@ class OpenAICompatProvider(BaseProvider):
             for idx in sorted(tc_accum):
                 tc = tc_accum[idx]
                 try:
-                    args = json.loads(tc["arguments"]) if tc["arguments"] else {}
-                except json.JSONDecodeError:
-                    log.warning("Failed to parse tool call arguments: %s", tc["arguments"])
+                    args = _loads(tc["arguments"]) if tc["arguments"] else {}
+                except ValueError:
+                    log.warning("Failed to parse tool call arguments: %r", bytes(tc["arguments"]))
                     args = {}
                 calls.append(ToolCall(id=tc["id"], name=tc["name"], arguments=args))
             yield StreamToolCall(tool_calls=calls)
@@ -103,7 +119,7 @@ class OpenAICompatProvider(BaseProvider):
                 "type": "function",
                 "function": {
                     "name": tc.name,
-                    "arguments": json.dumps(tc.arguments),
+                    "arguments": _dumps(tc.arguments),
                 },
             }
             for tc in tool_calls
@@ -1,5 +1,6 @@
 """ntfy push notification client — sends to self-hosted ntfy server."""
 
+import asyncio
 import logging
 
 import httpx
@@ -8,25 +9,52 @@ from . import config
 
 log = logging.getLogger("conduit.ntfy")
 
+# Shared across pushes so each one reuses a kept-alive connection. The server
+# URL stays per-request because it can change on config reload.
+_client: httpx.AsyncClient | None = None
 
-async def push(
-    title: str,
-    body: str,
-    tags: list[str] | None = None,
-    priority: int = 3,
-    click_url: str | None = None,
-):
-    """Send a push notification via ntfy.
+# Fire-and-forget pushes wait here for a single background sender
+QUEUE_MAX = 100
+DRAIN_TIMEOUT = 5.0
+_queue: asyncio.Queue | None = None
+_worker_task: asyncio.Task | None = None
 
-    Args:
-        title: Notification title.
-        body: Notification body text.
-        tags: Optional ntfy tags (emoji shortcodes).
-        priority: 1-5, default 3 (normal).
-        click_url: URL to open when notification is tapped.
-    """
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=5, keepalive_expiry=30.0),
+        )
+    return _client
+
+
+async def close():
+    """Flush queued pushes (bounded by DRAIN_TIMEOUT), then close the HTTP client."""
+    global _client, _queue, _worker_task
+    if _worker_task is not None:
+        try:
+            await asyncio.wait_for(_queue.join(), DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            log.warning("ntfy: dropping %d queued pushes on shutdown", _queue.qsize())
+        _worker_task.cancel()
+        _worker_task = None
+        _queue = None
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _build_request(
+    title: str,
+    tags: list[str] | None,
+    priority: int,
+    click_url: str | None,
+) -> tuple[str, dict] | None:
+    """Resolve the topic URL and headers, or None if ntfy is off/unconfigured."""
     if not config.NTFY_ENABLED:
-        return
+        return None
 
     server = config.NTFY_SERVER
     topic = config.NTFY_TOPIC
@@ -34,7 +62,7 @@ async def push(
 
     if not server or not topic:
         log.warning("ntfy not configured (missing server or topic)")
-        return
+        return None
 
     url = f"{server.rstrip('/')}/{topic}"
 
@@ -48,13 +76,72 @@ async def push(
         headers["Tags"] = ",".join(tags)
     if click_url:
         headers["Click"] = click_url
+    return url, headers
 
+
+async def _send(url: str, body: str, headers: dict):
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(url, content=body, headers=headers)
-            if resp.status_code == 200:
-                log.info("ntfy push sent: %s", title)
-            else:
-                log.warning("ntfy push failed (%d): %s", resp.status_code, resp.text)
+        resp = await _get_client().post(url, content=body, headers=headers)
+        if resp.status_code == 200:
+            log.info("ntfy push sent: %s", headers["Title"])
+        else:
+            log.warning("ntfy push failed (%d): %s", resp.status_code, resp.text)
     except Exception as e:
         log.error("ntfy push error: %s", e)
+
+
+async def push(
+    title: str,
+    body: str,
+    tags: list[str] | None = None,
+    priority: int = 3,
+    click_url: str | None = None,
+):
+    """Send a push notification via ntfy.
+
+    Args:
+        title: Notification title.
+        body: Notification body text.
+        tags: Optional ntfy tags (emoji shortcodes).
+        priority: 1-5, default 3 (normal).
+        click_url: URL to open when notification is tapped.
+    """
+    request = _build_request(title, tags, priority, click_url)
+    if request:
+        url, headers = request
+        await _send(url, body, headers)
+
+
+async def _worker():
+    while True:
+        url, body, headers = await _queue.get()
+        try:
+            await _send(url, body, headers)
+        finally:
+            _queue.task_done()
+
+
+def push_nowait(
+    title: str,
+    body: str,
+    tags: list[str] | None = None,
+    priority: int = 3,
+    click_url: str | None = None,
+):
+    """Queue a notification for the background sender and return immediately.
+
+    Same arguments as push(). Must be called from the event loop. When the
+    queue is full the notification is dropped with a warning.
+    """
+    global _queue, _worker_task
+    request = _build_request(title, tags, priority, click_url)
+    if not request:
+        return
+    if _worker_task is None or _worker_task.done():
+        _queue = asyncio.Queue(maxsize=QUEUE_MAX)
+        _worker_task = asyncio.create_task(_worker())
+    url, headers = request
+    try:
+        _queue.put_nowait((url, body, headers))
+    except asyncio.QueueFull:
+        log.warning("ntfy queue full, dropping push: %s", title)
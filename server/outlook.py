@@ -1,14 +1,24 @@
 """Outlook email client — MSAL auth + Microsoft Graph API."""
 
+import importlib.util
 import json
 import logging
+import time
+from collections.abc import AsyncIterator
 from pathlib import Path
+from urllib.parse import quote, urlencode
 
 import httpx
 import msal
 
 from . import config
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 log = logging.getLogger("conduit.outlook")
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
@@ -18,6 +28,39 @@ SCOPES = ["Mail.Read", "User.Read"]
 _TOKEN_CACHE_PATH = Path(__file__).parent / ".outlook_token_cache.bin"
 _app: msal.PublicClientApplication | None = None
 _cache: msal.SerializableTokenCache | None = None
+_access_token: str | None = None  # Last token handed out by MSAL
+_access_token_exp: float = 0  # Expiry timestamp for _access_token
+
+# Shared across Graph calls so back-to-back requests reuse one connection;
+# with HTTP/2 (Graph supports it) concurrent calls multiplex over it as well
+_graph_client: httpx.AsyncClient | None = None
+# httpx only speaks HTTP/2 when the optional h2 package is installed
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Where get_inbox_delta resumes: the last @odata.deltaLink, or a nextLink if
+# the previous call stopped mid-sync. In-memory only; a restart re-syncs.
+_inbox_delta_link: str | None = None
+DELTA_PAGE_SIZE = 50
+
+
+def _get_graph_client() -> httpx.AsyncClient:
+    global _graph_client
+    if _graph_client is None or _graph_client.is_closed:
+        _graph_client = httpx.AsyncClient(
+            base_url=GRAPH_BASE,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0),
+            http2=_HTTP2,
+        )
+    return _graph_client
+
+
+async def close():
+    """Close the shared Graph HTTP client."""
+    global _graph_client
+    if _graph_client is not None:
+        await _graph_client.aclose()
+        _graph_client = None
 
 
 def _get_app() -> msal.PublicClientApplication | None:
@@ -51,6 +94,12 @@ def _save_cache():
 
 def get_access_token() -> str | None:
     """Acquire token silently from cache. Returns None if re-auth needed."""
+    global _access_token, _access_token_exp
+
+    # Every Graph call asks for a token; skip MSAL while the last one is fresh
+    if _access_token and time.time() < _access_token_exp:
+        return _access_token
+
     app = _get_app()
     if not app:
         return None
@@ -63,7 +112,9 @@ def get_access_token() -> str | None:
     _save_cache()
 
     if result and "access_token" in result:
-        return result["access_token"]
+        _access_token = result["access_token"]
+        _access_token_exp = time.time() + int(result.get("expires_in", 3600)) - 60  # 60s buffer
+        return _access_token
 
     return None
 
@@ -73,13 +124,7 @@ def is_configured() -> bool:
     return bool(config.OUTLOOK_CLIENT_ID)
 
 
-async def get_inbox(count: int = 10, unread_only: bool = False) -> list[dict]:
-    """Fetch inbox messages from Microsoft Graph."""
-    token = get_access_token()
-    if not token:
-        return []
-
-    url = f"{GRAPH_BASE}/me/mailFolders/inbox/messages"
+def _inbox_params(count: int, unread_only: bool) -> dict[str, str]:
     params = {
         "$top": str(count),
         "$select": "id,subject,from,receivedDateTime,isRead,bodyPreview",
@@ -87,74 +132,123 @@ async def get_inbox(count: int = 10, unread_only: bool = False) -> list[dict]:
     }
     if unread_only:
         params["$filter"] = "isRead eq false"
+    return params
+
+
+async def get_inbox(count: int = 10, unread_only: bool = False) -> list[dict]:
+    """Fetch inbox messages from Microsoft Graph."""
+    token = get_access_token()
+    if not token:
+        return []
+
+    url = "/me/mailFolders/inbox/messages"
+    params = _inbox_params(count, unread_only)
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(
-                url, params=params,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            resp.raise_for_status()
+        resp = await _get_graph_client().get(
+            url, params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        resp.raise_for_status()
     except Exception as e:
         log.error("Graph API inbox error: %s", e)
         return []
 
-    data = resp.json()
+    data = _loads(resp.content)
     return data.get("value", [])
 
 
+def _search_params(query: str, count: int) -> dict[str, str]:
+    return {
+        "$search": f'"{query}"',
+        "$top": str(count),
+        "$select": "id,subject,from,receivedDateTime,isRead,bodyPreview",
+    }
+
+
 async def search_messages(query: str, count: int = 10) -> list[dict]:
     """Search messages using Microsoft Graph $search."""
     token = get_access_token()
     if not token:
         return []
 
-    url = f"{GRAPH_BASE}/me/messages"
-    params = {
-        "$search": f'"{query}"',
-        "$top": str(count),
-        "$select": "id,subject,from,receivedDateTime,isRead,bodyPreview",
-    }
+    url = "/me/messages"
+    params = _search_params(query, count)
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(
-                url, params=params,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "ConsistencyLevel": "eventual",
-                },
-            )
-            resp.raise_for_status()
+        resp = await _get_graph_client().get(
+            url, params=params,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "ConsistencyLevel": "eventual",
+            },
+        )
+        resp.raise_for_status()
     except Exception as e:
         log.error("Graph API search error: %s", e)
         return []
 
-    data = resp.json()
+    data = _loads(resp.content)
     return data.get("value", [])
 
 
+async def search_messages_iter(query: str, limit: int = 100, page_size: int = 25) -> AsyncIterator[dict]:
+    """Yield up to *limit* search results, fetching them page by page.
+
+    Follows @odata.nextLink, so only one page is held at a time and the
+    first results are available after the first page rather than after
+    the whole result set.
+    """
+    token = get_access_token()
+    if not token:
+        return
+
+    url = "/me/messages"
+    params = _search_params(query, min(page_size, limit))
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "ConsistencyLevel": "eventual",
+    }
+    client = _get_graph_client()
+    remaining = limit
+
+    while url and remaining > 0:
+        try:
+            resp = await client.get(url, params=params, headers=headers)
+            resp.raise_for_status()
+        except Exception as e:
+            log.error("Graph API search error: %s", e)
+            return
+
+        data = _loads(resp.content)
+        for msg in data.get("value", [])[:remaining]:
+            yield msg
+            remaining -= 1
+        # nextLink is absolute and already carries the query
+        url = data.get("@odata.nextLink")
+        params = None
+
+
 async def get_message(message_id: str) -> dict | None:
     """Fetch a single message with full body."""
     token = get_access_token()
     if not token:
         return None
 
-    url = f"{GRAPH_BASE}/me/messages/{message_id}"
+    url = f"/me/messages/{message_id}"
     params = {"$select": "id,subject,from,toRecipients,receivedDateTime,body,isRead"}
 
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            resp = await client.get(
-                url, params=params,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            resp.raise_for_status()
+        resp = await _get_graph_client().get(
+            url, params=params,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        resp.raise_for_status()
     except Exception as e:
         log.error("Graph API message error: %s", e)
         return None
 
-    return resp.json()
+    return _loads(resp.content)
 
 
 async def get_unread_count() -> int:
@@ -163,19 +257,116 @@ async def get_unread_count() -> int:
     if not token:
         return 0
 
-    url = f"{GRAPH_BASE}/me/mailFolders/inbox"
-    params = {"$select": "unreadItemCount"}
+    # $count returns a bare integer, so there's no folder resource to load
+    # server-side and no JSON to parse here
+    url = "/me/mailFolders/inbox/messages/$count"
+    params = {"$filter": "isRead eq false"}
 
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(
-                url, params=params,
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            resp.raise_for_status()
+        resp = await _get_graph_client().get(
+            url, params=params, timeout=10,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "ConsistencyLevel": "eventual",
+            },
+        )
+        resp.raise_for_status()
+        # Graph may prefix the plain-text count with a UTF-8 BOM
+        return int(resp.content.removeprefix(b"\xef\xbb\xbf"))
     except Exception as e:
         log.error("Graph API unread count error: %s", e)
         return 0
 
-    data = resp.json()
-    return data.get("unreadItemCount", 0)
+
+async def graph_batch(requests: list[dict]) -> dict[str, dict]:
+    """Send up to 20 Graph subrequests in a single /$batch round trip.
+
+    Each request is {"id", "method", "url"} with url relative to GRAPH_BASE.
+    Returns the subresponses keyed by id; empty if the batch itself failed.
+    """
+    token = get_access_token()
+    if not token:
+        return {}
+
+    try:
+        resp = await _get_graph_client().post(
+            "/$batch", json={"requests": requests},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        resp.raise_for_status()
+    except Exception as e:
+        log.error("Graph API batch error: %s", e)
+        return {}
+
+    responses = {}
+    for sub in _loads(resp.content).get("responses", []):
+        if sub.get("status") != 200:
+            log.error("Graph API batch request %s failed (%s): %s",
+                      sub.get("id"), sub.get("status"), sub.get("body"))
+            continue
+        responses[sub.get("id")] = sub.get("body") or {}
+    return responses
+
+
+async def get_inbox_and_unread(count: int = 10, unread_only: bool = False) -> tuple[list[dict], int]:
+    """Fetch inbox messages and the unread count in one Graph round trip."""
+    query = urlencode(_inbox_params(count, unread_only), quote_via=quote, safe="$,")
+    responses = await graph_batch([
+        {"id": "inbox", "method": "GET", "url": f"/me/mailFolders/inbox/messages?{query}"},
+        {"id": "unread", "method": "GET", "url": "/me/mailFolders/inbox?$select=unreadItemCount"},
+    ])
+    messages = responses.get("inbox", {}).get("value", [])
+    unread = responses.get("unread", {}).get("unreadItemCount", 0)
+    return messages, unread
+
+
+async def get_inbox_delta(max_pages: int = 10) -> list[dict]:
+    """Fetch inbox messages added, changed or removed since the previous call.
+
+    The first call walks the delta feed from the start, returning the current
+    inbox, and keeps the resulting deltaLink; later calls only return what
+    changed. Removed messages come back as {"id", "@removed"}. Stops after
+    *max_pages* pages and resumes from there on the next call.
+    """
+    global _inbox_delta_link
+    token = get_access_token()
+    if not token:
+        return []
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Prefer": f"odata.maxpagesize={DELTA_PAGE_SIZE}",
+    }
+    # Delta/next links are absolute and already carry the original query
+    url = _inbox_delta_link or "/me/mailFolders/inbox/messages/delta"
+    params = None if _inbox_delta_link else {
+        "$select": "id,subject,from,receivedDateTime,isRead,bodyPreview",
+    }
+
+    changes: list[dict] = []
+    client = _get_graph_client()
+    for _ in range(max_pages):
+        try:
+            resp = await client.get(url, params=params, headers=headers)
+            if resp.status_code == 410:
+                # Sync state expired server-side; start over on the next call
+                log.warning("Graph inbox delta token expired, resyncing")
+                _inbox_delta_link = None
+                return changes
+            resp.raise_for_status()
+        except Exception as e:
+            log.error("Graph API inbox delta error: %s", e)
+            return changes
+
+        data = _loads(resp.content)
+        changes.extend(data.get("value", []))
+        params = None
+        if "@odata.deltaLink" in data:
+            _inbox_delta_link = data["@odata.deltaLink"]
+            break
+        url = data.get("@odata.nextLink")
+        if not url:
+            break
+        _inbox_delta_link = url
+
+    return changes
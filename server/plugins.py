@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
 import json
 import logging
+import os
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -12,21 +14,32 @@ from typing import Any, Callable, Awaitable
 
 from server.tools.definitions import ToolDefinition
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Global hook event bus: event_name -> list of async handler callables
+# Global hook event bus: event_name -> tuple of async handler callables.
+# Tuples are rebuilt on registration (startup only) so dispatch iterates an
+# immutable sequence and a concurrent load can't mutate it mid-dispatch.
 # ---------------------------------------------------------------------------
-_hooks: dict[str, list[Callable[..., Awaitable[dict | None]]]] = {}
+_hooks: dict[str, tuple[Callable[..., Awaitable[dict | None]], ...]] = {}
 
 # Registry of loaded plugin metadata (for introspection / status endpoints)
 _loaded_plugins: list[dict] = []
 
+# Parsed plugin.json by path, with the mtime it was parsed at
+_manifest_cache: dict[str, tuple[int, dict]] = {}
+
 
 # ---------------------------------------------------------------------------
 # PluginAPI — the interface handed to each plugin's register() function
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class PluginAPI:
     """API surface exposed to plugins during registration."""
 
@@ -72,7 +85,8 @@ class PluginAPI:
 
     def log(self, msg: str, level: str = "info") -> None:
         """Convenience logger for plugins."""
-        getattr(logger, level, logger.info)(f"[plugin:{self.id}] {msg}")
+        # Lazy %-args: the logger skips formatting when the level is disabled
+        getattr(logger, level, logger.info)("[plugin:%s] %s", self.id, msg)
 
 
 # ---------------------------------------------------------------------------
@@ -89,21 +103,33 @@ def discover_plugins(plugins_dir: str) -> list[dict]:
         logger.debug("Plugins directory does not exist: %s", plugins_dir)
         return []
 
+    # scandir hands back d_type with each entry, so the directory check
+    # costs no extra stat per child
+    with os.scandir(base) as it:
+        children = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
     found: list[dict] = []
-    for child in sorted(base.iterdir()):
-        if not child.is_dir():
-            continue
-        manifest_path = child / "plugin.json"
-        if not manifest_path.exists():
+    for child in children:
+        manifest_path = os.path.join(child.path, "plugin.json")
+        try:
+            mtime = os.stat(manifest_path).st_mtime_ns
+        except OSError:
             logger.debug("Skipping %s — no plugin.json", child.name)
             continue
-        try:
-            manifest = json.loads(manifest_path.read_text())
-            manifest["_path"] = str(child)
-            found.append(manifest)
-            logger.info("Discovered plugin: %s (%s)", manifest.get("id", child.name), child)
-        except (json.JSONDecodeError, OSError) as exc:
-            logger.warning("Invalid plugin.json in %s: %s", child.name, exc)
+        cached = _manifest_cache.get(manifest_path)
+        if cached is not None and cached[0] == mtime:
+            manifest = dict(cached[1])
+        else:
+            try:
+                with open(manifest_path, "rb") as f:
+                    manifest = _loads(f.read())
+            except (json.JSONDecodeError, OSError) as exc:
+                logger.warning("Invalid plugin.json in %s: %s", child.name, exc)
+                continue
+            _manifest_cache[manifest_path] = (mtime, dict(manifest))
+        manifest["_path"] = child.path
+        found.append(manifest)
+        logger.info("Discovered plugin: %s (%s)", manifest.get("id", child.name), child.path)
     return found
 
 
@@ -113,23 +139,31 @@ def discover_plugins(plugins_dir: str) -> list[dict]:
 def load_plugin(
     plugin_path: Path,
     config: dict[str, Any] | None = None,
+    *,
+    manifest: dict | None = None,
 ) -> tuple[list[ToolDefinition], list[tuple[str, Callable]], list[dict]] | None:
     """Import the plugin at *plugin_path* and invoke its ``register(api)`` entry point.
 
+    Pass *manifest* when it has already been parsed (as ``discover_plugins``
+    does) to skip re-reading plugin.json.
+
     Returns ``(tools, hooks, skills)`` on success, or ``None`` on failure.
     """
-    manifest_path = plugin_path / "plugin.json"
     init_path = plugin_path / "__init__.py"
 
-    if not manifest_path.exists() or not init_path.exists():
+    if not init_path.exists():
         logger.warning("Plugin at %s missing plugin.json or __init__.py", plugin_path)
         return None
 
-    try:
-        manifest = json.loads(manifest_path.read_text())
-    except (json.JSONDecodeError, OSError) as exc:
-        logger.warning("Cannot read plugin.json at %s: %s", plugin_path, exc)
-        return None
+    if manifest is None:
+        try:
+            manifest = _loads((plugin_path / "plugin.json").read_bytes())
+        except FileNotFoundError:
+            logger.warning("Plugin at %s missing plugin.json or __init__.py", plugin_path)
+            return None
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Cannot read plugin.json at %s: %s", plugin_path, exc)
+            return None
 
     plugin_id = manifest.get("id", plugin_path.name)
     module_name = f"_conduit_plugin_{plugin_id.replace('-', '_')}"
@@ -195,32 +229,44 @@ def load_all_plugins(
     all_skills: list[dict] = []
     configs = plugin_configs or {}
 
-    for manifest in manifests:
-        plugin_id = manifest.get("id", "unknown")
-        plugin_path = Path(manifest["_path"])
-        config = configs.get(plugin_id, {})
-
-        result = load_plugin(plugin_path, config=config)
-        if result is None:
-            continue
+    # Put the shared parent on sys.path once for the whole batch instead of
+    # around every plugin; load_plugin sees it present and leaves it alone
+    parent_dir = str(Path(plugins_dir))
+    path_added = parent_dir not in sys.path
+    if path_added:
+        sys.path.insert(0, parent_dir)
+    importlib.invalidate_caches()
 
-        tools, hooks, skills = result
-        all_tools.extend(tools)
-        all_skills.extend(skills)
-
-        # Wire hooks into the global event bus
-        for event, handler in hooks:
-            _hooks.setdefault(event, []).append(handler)
-
-        _loaded_plugins.append({
-            "id": plugin_id,
-            "name": manifest.get("name", plugin_id),
-            "version": manifest.get("version", "0.0.0"),
-            "description": manifest.get("description", ""),
-            "tools": [t.name for t in tools],
-            "hooks": [e for e, _ in hooks],
-            "skills": [s["name"] for s in skills],
-        })
+    try:
+        for manifest in manifests:
+            plugin_id = manifest.get("id", "unknown")
+            plugin_path = Path(manifest["_path"])
+            config = configs.get(plugin_id, {})
+
+            result = load_plugin(plugin_path, config=config, manifest=manifest)
+            if result is None:
+                continue
+
+            tools, hooks, skills = result
+            all_tools.extend(tools)
+            all_skills.extend(skills)
+
+            # Wire hooks into the global event bus
+            for event, handler in hooks:
+                _hooks[event] = (*_hooks.get(event, ()), handler)
+
+            _loaded_plugins.append({
+                "id": plugin_id,
+                "name": manifest.get("name", plugin_id),
+                "version": manifest.get("version", "0.0.0"),
+                "description": manifest.get("description", ""),
+                "tools": [t.name for t in tools],
+                "hooks": [e for e, _ in hooks],
+                "skills": [s["name"] for s in skills],
+            })
+    finally:
+        if path_added and parent_dir in sys.path:
+            sys.path.remove(parent_dir)
 
     logger.info(
         "Plugin loading complete: %d plugins, %d tools, %d skills, %d hook events",
@@ -235,25 +281,38 @@ def load_all_plugins(
 # ---------------------------------------------------------------------------
 # Hook dispatch — run all handlers for a given event
 # ---------------------------------------------------------------------------
+async def _call_handler(handler: Callable, kwargs: dict[str, Any]) -> dict | None:
+    # Calling inside a coroutine keeps a handler that raises before its first
+    # await (or isn't async at all) from escaping gather's error capture
+    return await handler(**kwargs)
+
+
 async def dispatch_hook(event: str, **kwargs: Any) -> dict | None:
-    """Run all registered handlers for *event*, passing **kwargs to each.
+    """Run all registered handlers for *event* concurrently, passing **kwargs to each.
 
     Handlers may return a dict of overrides.  Dicts are merged left-to-right
-    so the last handler wins on key conflicts.  Returns the merged dict, or
-    ``None`` if no handler returned anything.
+    in registration order so the last handler wins on key conflicts.  Returns
+    the merged dict, or ``None`` if no handler returned anything.
     """
     handlers = _hooks.get(event)
     if not handlers:
         return None
 
+    results = await asyncio.gather(
+        *(_call_handler(handler, kwargs) for handler in handlers), return_exceptions=True,
+    )
+
     merged: dict[str, Any] = {}
-    for handler in handlers:
-        try:
-            result = await handler(**kwargs)
-            if isinstance(result, dict):
-                merged.update(result)
-        except Exception as exc:
-            logger.warning("Hook handler error for %s: %s", event, exc, exc_info=True)
+    for result in results:
+        if isinstance(result, dict):
+            merged.update(result)
+        elif isinstance(result, BaseException):
+            # A noisy plugin can fail on every message; only pay for
+            # traceback formatting when debugging
+            logger.warning(
+                "Hook handler error for %s: %r", event, result,
+                exc_info=result if logger.isEnabledFor(logging.DEBUG) else None,
+            )
 
     return merged if merged else None
 
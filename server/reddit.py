@@ -2,6 +2,7 @@
 
 import json
 import logging
+import re
 from pathlib import Path
 
 import httpx
@@ -13,6 +14,9 @@ log = logging.getLogger("conduit.reddit")
 _USER_AGENT = "conduit-worker/1.0 (by u/kitchenjesus)"
 _BASE_URL = "https://www.reddit.com/user"
 
+# Opening fence line (with any language tag) and closing fence of a reply
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|```\Z")
+
 
 async def fetch_activity(username: str, limit: int = 100) -> list[dict]:
     """Fetch public Reddit activity for a user.
@@ -126,12 +130,7 @@ Return ONLY valid JSON, no markdown fences."""
         )
 
         # Parse the JSON response (strip markdown fences if present)
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
+        text = _FENCE_RE.sub("", response.strip()).strip()
 
         digest = json.loads(text)
     except Exception as e:
@@ -231,17 +231,16 @@ async def _check_email():
         if not outlook.is_configured() or not outlook.get_access_token():
             return
 
-        current_count = await outlook.get_unread_count()
+        # Count and newest unread come back in one batched Graph call
+        messages, current_count = await outlook.get_inbox_and_unread(count=5, unread_only=True)
         last_raw = await db.kv_get("outlook_last_unread_count")
         last_count = int(last_raw) if last_raw else 0
 
         if current_count > last_count:
             new_count = current_count - last_count
-            # Fetch the newest unread messages
-            messages = await outlook.get_inbox(count=min(new_count, 5), unread_only=True)
 
             lines = [f"You have {new_count} new email{'s' if new_count > 1 else ''}:"]
-            for msg in messages:
+            for msg in messages[:new_count]:
                 fr = msg.get("from", {}).get("emailAddress", {})
                 sender = fr.get("name", fr.get("address", "unknown"))
                 subject = msg.get("subject", "(no subject)")
@@ -0,0 +1,135 @@
+"""Tests for the ChatGPT provider's SSE framing."""
+
+import pytest
+
+from server.models import chatgpt
+
+
+class _FakeResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def aiter_bytes(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+async def _collect(chunks):
+    return [p async for p in chatgpt._iter_sse_payloads(_FakeResponse(chunks))]
+
+
+@pytest.mark.asyncio
+async def test_sse_payloads_split_across_chunks():
+    chunks = [
+        b"event: response.output_text.delta\ndata: {\"a\"",
+        b": 1}\r\n\n: keep-alive\n\ndata: {\"b\": 2}\n",
+        b"data: [DONE]\ndata: {\"after\": 1}\n",
+    ]
+    assert await _collect(chunks) == [b'{"a": 1}', b'{"b": 2}']
+
+
+@pytest.mark.asyncio
+async def test_sse_payload_without_trailing_newline():
+    assert await _collect([b"data: {\"x\": 1}\n", b"data: {\"y\"", b": 2}"]) == [
+        b'{"x": 1}', b'{"y": 2}',
+    ]
+
+
+def test_tool_call_arguments_round_trip():
+    import json
+
+    from server.models.base import ToolCall
+
+    provider = chatgpt.ChatGPTProvider("chatgpt", "gpt-5.1-codex-mini")
+    msg = provider.format_tool_calls_message("", [ToolCall(id="fc_1", name="grep", arguments={"q": "café"})])
+    assert json.loads(msg["tool_calls"][0]["function"]["arguments"]) == {"q": "café"}
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_and_recreated_after_close(monkeypatch):
+    monkeypatch.setattr(chatgpt, "_client", None)
+    first = chatgpt._get_client()
+    assert chatgpt._get_client() is first
+    await chatgpt.close()
+    assert first.is_closed
+    second = chatgpt._get_client()
+    assert second is not first
+    await chatgpt.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_dispatches_events(monkeypatch):
+    import httpx
+
+    from server import chatgpt_auth
+    from server.models.base import StreamChunk, StreamDone, StreamToolCall
+
+    sse = (
+        b'event: response.created\ndata: {"type": "response.created"}\n\n'
+        b'data: {"type": "response.output_text.delta", "delta": "Hi "}\n\n'
+        b'data: {"type": "response.function_call_arguments.delta", "delta": "{\\"q"}\n\n'
+        b'data: {"type": "response.output_text.delta", "delta": "there"}\n\n'
+        b'data: {"type": "response.output_item.done", "item": {"type": "function_call", '
+        b'"id": "fc_1", "name": "grep", "arguments": "{\\"q\\": \\"x\\"}"}}\n\n'
+        b'data: {"type": "response.completed", "response": {"usage": '
+        b'{"input_tokens": 7, "output_tokens": 3}}}\n\n'
+        b'data: {"type": "response.output_text.delta", "delta": "ignored"}\n\n'
+    )
+
+    async def token():
+        return "tok"
+
+    monkeypatch.setattr(chatgpt_auth, "get_access_token_async", token)
+    monkeypatch.setattr(chatgpt, "_client", httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=sse)),
+    ))
+    parsed = []
+    real_loads = chatgpt._loads
+    monkeypatch.setattr(chatgpt, "_loads", lambda data: parsed.append(data) or real_loads(data))
+    provider = chatgpt.ChatGPTProvider("chatgpt", "gpt-5.1-codex-mini")
+    items = [i async for i in provider.stream([{"role": "user", "content": "hi"}])]
+    await chatgpt.close()
+
+    # Events the provider ignores never reach the JSON parser
+    assert not any(b"response.created" in p or b"arguments.delta" in p
+                   for p in parsed if isinstance(p, bytes))
+
+    assert [i.text for i in items if isinstance(i, StreamChunk)] == ["Hi ", "there"]
+    (calls,) = [i for i in items if isinstance(i, StreamToolCall)]
+    assert calls.tool_calls[0].arguments == {"q": "x"}
+    assert items[-1] == StreamDone(usage=chatgpt.Usage(input_tokens=7, output_tokens=3))
+
+
+@pytest.mark.asyncio
+async def test_tools_converted_once_per_list(monkeypatch):
+    import json
+
+    import httpx
+
+    from server import chatgpt_auth
+
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, content=b"data: [DONE]\n\n")
+
+    async def token():
+        return "tok"
+
+    converted = []
+    real = chatgpt._to_api_tools
+    monkeypatch.setattr(chatgpt, "_to_api_tools", lambda tools: converted.append(1) or real(tools))
+    monkeypatch.setattr(chatgpt_auth, "get_access_token_async", token)
+    monkeypatch.setattr(chatgpt, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    provider = chatgpt.ChatGPTProvider("chatgpt", "gpt-5.1-codex-mini")
+    tools = [{"type": "function", "function": {"name": "grep", "parameters": {"type": "object"}}}]
+    for _ in range(3):
+        [i async for i in provider.stream([{"role": "user", "content": "hi"}], tools=tools)]
+    [i async for i in provider.stream([{"role": "user", "content": "hi"}], tools=list(tools))]
+    await chatgpt.close()
+
+    assert len(converted) == 2
+    assert bodies[0]["tools"] == [{"type": "function", "name": "grep", "description": "",
+                                   "parameters": {"type": "object"}}]
@@ -0,0 +1,75 @@
+"""Tests for the Claude Code CLI provider's stream-json handling."""
+
+import json
+import stat
+
+import pytest
+
+from server.models import claude_code
+
+
+class _FakeManager:
+    def __init__(self):
+        self.chunks = []
+        self.tools = []
+
+    async def send_chunk(self, ws, text):
+        self.chunks.append(text)
+
+    async def send_tool_start(self, ws, tool_id, name, args):
+        self.tools.append(("start", name))
+
+    async def send_tool_done(self, ws, tool_id, name, result="", error=""):
+        self.tools.append(("done", name))
+
+    async def send_error(self, ws, message):
+        raise AssertionError(message)
+
+
+def _fake_cli(tmp_path, monkeypatch, events, trailing_newline=True):
+    out = "\n".join(json.dumps(e) for e in events)
+    script = tmp_path / "claude"
+    script.write_text(
+        "#!/bin/sh\ncat <<'EOF'\n" + out + "\n\nnot json\nEOF\n"
+        + ("" if trailing_newline else "printf '%s' '" + json.dumps({"type": "result", "total_cost_usd": 0.5}) + "'\n")
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(claude_code.shutil, "which", lambda name: str(script))
+
+
+@pytest.mark.asyncio
+async def test_run_streams_text_deltas_and_result(tmp_path, monkeypatch):
+    _fake_cli(tmp_path, monkeypatch, [
+        {"type": "system", "subtype": "init", "session_id": "s1"},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hel"}]}},
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "Hello"}]}},
+        {"type": "assistant", "message": {"content": [{"type": "tool_use", "id": "t1", "name": "Read"}]}},
+        {"type": "tool_result", "tool_use_id": "t1", "name": "Read", "content": "ok"},
+    ], trailing_newline=False)
+    manager = _FakeManager()
+    provider = claude_code.ClaudeCodeProvider("cc", working_dir=str(tmp_path))
+
+    text, usage, session_id, cost = await provider.run("hi", None, ws=None, manager=manager)
+
+    assert text == "Hello"
+    assert manager.chunks == ["Hello"]  # both deltas coalesced into one frame
+    assert manager.tools == [("start", "Read"), ("done", "Read")]
+    assert session_id == "s1"
+    assert cost == 0.5
+
+
+@pytest.mark.asyncio
+async def test_run_caps_batched_deltas(tmp_path, monkeypatch):
+    events = [
+        {"type": "assistant", "message": {"content": [{"type": "text", "text": "x" * n}]}}
+        for n in range(1, 11)
+    ]
+    _fake_cli(tmp_path, monkeypatch, events)
+    manager = _FakeManager()
+    provider = claude_code.ClaudeCodeProvider("cc", working_dir=str(tmp_path))
+
+    text, *_ = await provider.run("hi", None, ws=None, manager=manager)
+
+    assert text == "x" * 10
+    assert "".join(manager.chunks) == text
+    assert manager.chunks[0] == "x" * claude_code.CHUNK_BATCH_MAX
@@ -0,0 +1,118 @@
+"""Tests for the SQLite helpers in server.db."""
+
+import asyncio
+
+import aiosqlite
+import pytest
+
+
+@pytest.fixture
+def tmp_db(monkeypatch, tmp_path):
+    from server import db
+
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "conduit.db")
+    asyncio.run(db.init_db())
+    return db
+
+
+@pytest.mark.asyncio
+async def test_add_messages_bulk_preserves_order(tmp_db):
+    db = tmp_db
+    cid = await db.create_conversation("Replay")
+    ids = await db.add_messages_bulk(cid, [
+        ("user", "first"),
+        ("assistant", "second", "nim", None),
+        ("user", "third"),
+    ])
+    assert len(ids) == 3
+
+    messages = await db.get_messages(cid)
+    assert [m["content"] for m in messages] == ["first", "second", "third"]
+    assert [m["id"] for m in messages] == ids
+    assert messages[1]["model"] == "nim"
+
+    conv = await db.get_conversation(cid)
+    assert conv["updated_at"] >= messages[-1]["created_at"]
+
+
+@pytest.mark.asyncio
+async def test_add_messages_bulk_empty(tmp_db):
+    db = tmp_db
+    cid = await db.create_conversation()
+    assert await db.add_messages_bulk(cid, []) == []
+    assert await db.get_message_count(cid) == 0
+
+
+@pytest.mark.asyncio
+async def test_today_conversations_filters_in_sql(tmp_db):
+    db = tmp_db
+    old = await db.create_conversation("Yesterday")
+    await db.add_message(old, "user", "old news")
+    new = await db.create_conversation("Today")
+    await db.add_message(new, "user", "fresh")
+
+    async with aiosqlite.connect(db.DB_PATH) as conn:
+        await conn.execute(
+            "UPDATE conversations SET updated_at = ? WHERE id = ?",
+            (db._today_start() - 3600, old),
+        )
+        await conn.commit()
+
+    today = await db.get_today_conversations_with_summaries(limit=10)
+    assert [c["title"] for c in today] == ["Today"]
+    recent = await db.get_recent_conversations_with_summaries(limit=10)
+    assert {c["title"] for c in recent} == {"Today", "Yesterday"}
+
+
+@pytest.mark.asyncio
+async def test_init_db_records_schema_version(tmp_db):
+    db = tmp_db
+    assert await db.kv_get("schema_version") == db.SCHEMA_VERSION
+    # Warm start is a no-op and leaves existing data intact
+    await db.kv_set("k", "v")
+    await db.init_db()
+    assert await db.kv_get("k") == "v"
+
+
+@pytest.mark.asyncio
+async def test_init_db_reapplies_schema_on_version_change(tmp_db, monkeypatch):
+    db = tmp_db
+    monkeypatch.setattr(db, "SCHEMA_VERSION", "test-next")
+    await db.init_db()
+    assert await db.kv_get("schema_version") == "test-next"
+
+
+@pytest.mark.asyncio
+async def test_usage_query_uses_covering_index(tmp_db):
+    db = tmp_db
+    async with aiosqlite.connect(db.DB_PATH) as conn:
+        rows = await conn.execute_fetchall(
+            "EXPLAIN QUERY PLAN SELECT provider, SUM(input_tokens), SUM(output_tokens), COUNT(*) "
+            "FROM model_usage WHERE created_at >= ? GROUP BY provider",
+            (0,),
+        )
+    plan = " ".join(r[-1] for r in rows)
+    assert "COVERING INDEX idx_usage_time_prov" in plan
+
+
+@pytest.mark.asyncio
+async def test_init_db_backfills_last_message_idx(monkeypatch, tmp_path):
+    from server import db
+
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "legacy.db")
+    async with aiosqlite.connect(db.DB_PATH) as conn:
+        await conn.executescript(
+            "CREATE TABLE conversation_summaries (id TEXT PRIMARY KEY, conversation_id TEXT NOT NULL, "
+            "summary TEXT NOT NULL, message_range TEXT, created_at REAL NOT NULL);"
+            "INSERT INTO conversation_summaries VALUES ('s1', 'c1', 'old', '10-42', 0);"
+            "INSERT INTO conversation_summaries VALUES ('s2', 'c2', 'odd', NULL, 0);"
+        )
+        await conn.commit()
+
+    await db.init_db()
+    rows = {r["id"]: r["last_message_idx"] for r in await db.get_conversation_summaries("c1")}
+    rows.update({r["id"]: r["last_message_idx"] for r in await db.get_conversation_summaries("c2")})
+    assert rows == {"s1": 42, "s2": None}
+
+    await db.add_conversation_summary("c1", "new", "42-60", last_message_idx=60)
+    assert (await db.get_conversation_summaries("c1"))[-1]["last_message_idx"] == 60
@@ -0,0 +1,55 @@
+"""Tests for the in-process embedding cache."""
+
+import numpy as np
+import pytest
+
+from server import embedding_cache, embeddings
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    seen = []
+
+    async def embed_text(text, task_type="RETRIEVAL_DOCUMENT"):
+        seen.append((text, task_type))
+        return np.array([float(len(seen))], dtype=np.float32)
+
+    monkeypatch.setattr(embeddings, "embed_text", embed_text)
+    monkeypatch.setattr(embedding_cache, "_cache", type(embedding_cache._cache)())
+    return seen
+
+
+@pytest.mark.asyncio
+async def test_normalized_repeat_is_a_hit(calls):
+    a = await embedding_cache.embed_query("What's on my  calendar?")
+    b = await embedding_cache.embed_query("  what's on my calendar? ")
+    assert a is b
+    assert calls == [("What's on my  calendar?", "RETRIEVAL_QUERY")]
+    assert not a.flags.writeable
+
+    # Task type is part of the key
+    await embedding_cache.embed_text("What's on my calendar?")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire(calls, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(embedding_cache.time, "monotonic", lambda: clock[0])
+    await embedding_cache.embed_query("hello")
+    clock[0] += embedding_cache.TTL_SECONDS + 1
+    await embedding_cache.embed_query("hello")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_evicted(calls, monkeypatch):
+    monkeypatch.setattr(embedding_cache, "MAX_ENTRIES", 2)
+    await embedding_cache.embed_query("a")
+    await embedding_cache.embed_query("b")
+    await embedding_cache.embed_query("a")  # refresh a
+    await embedding_cache.embed_query("c")  # evicts b
+    await embedding_cache.embed_query("a")
+    assert len(calls) == 3
+    await embedding_cache.embed_query("b")
+    assert len(calls) == 4
@@ -0,0 +1,32 @@
+"""Tests for embedding vector helpers."""
+
+import numpy as np
+
+
+def test_quantize_i8_round_trip():
+    from server.embeddings import dequantize_i8, quantize_i8
+
+    rng = np.random.default_rng(0)
+    vec = rng.standard_normal(768).astype(np.float32)
+    scale, data = quantize_i8(vec)
+    assert len(data) == 768
+    restored = dequantize_i8(scale, data)
+    assert np.max(np.abs(restored - vec)) <= scale / 2 + 1e-6
+
+
+def test_quantize_i8_zero_vector():
+    from server.embeddings import quantize_i8
+
+    scale, data = quantize_i8(np.zeros(8, dtype=np.float32))
+    assert scale == 0.0
+    assert data == bytes(8)
+
+
+def test_dot_i8_matches_float_dot():
+    from server.embeddings import _unit_vector, dot_i8, quantize_i8
+
+    rng = np.random.default_rng(1)
+    a = _unit_vector(rng.standard_normal(768))
+    b = _unit_vector(a + 0.5 * rng.standard_normal(768))
+    approx = dot_i8(quantize_i8(a), quantize_i8(b))
+    assert abs(approx - float(np.dot(a, b))) < 0.01
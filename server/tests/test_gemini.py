@@ -0,0 +1,66 @@
+"""Tests for the Gemini provider."""
+
+import pytest
+
+from server.models import gemini
+
+
+def test_plain_text_fast_path_matches_general_conversion():
+    messages = [
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": ""},
+        {"role": "assistant", "content": "Hello!"},
+    ]
+    assert gemini._to_contents(messages) == gemini._convert_contents(messages)
+    assert [c.role for c in gemini._to_contents(messages)] == ["user", "model"]
+
+
+def test_tool_traffic_uses_general_conversion():
+    messages = [
+        {"role": "user", "content": "Weather?"},
+        {"role": "assistant", "content": [{"type": "tool_use", "name": "weather", "input": {}}]},
+        {"role": "tool", "name": "weather", "content": "Sunny"},
+    ]
+    contents = gemini._to_contents(messages)
+    assert contents[1].parts[0].function_call.name == "weather"
+    assert contents[2].parts[0].function_response.response == {"result": "Sunny"}
+
+
+@pytest.mark.asyncio
+async def test_stream_reads_text_tool_calls_and_usage():
+    from types import SimpleNamespace
+
+    from google.genai import types
+
+    from server.models.base import StreamChunk, StreamDone, StreamToolCall
+
+    chunks = [
+        types.GenerateContentResponse(candidates=[types.Candidate(content=types.Content(
+            role="model", parts=[types.Part(text="Checking")]))]),
+        types.GenerateContentResponse(candidates=[types.Candidate(content=None)]),
+        types.GenerateContentResponse(
+            candidates=[types.Candidate(content=types.Content(role="model", parts=[
+                types.Part(function_call=types.FunctionCall(name="weather", args={"city": "Oslo"})),
+            ]))],
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=11, candidates_token_count=4),
+        ),
+    ]
+
+    async def fake_stream(**kwargs):
+        async def gen():
+            for c in chunks:
+                yield c
+        return gen()
+
+    provider = gemini.GeminiProvider.__new__(gemini.GeminiProvider)
+    provider.name, provider.model = "gemini", "flash"
+    provider.client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(
+        generate_content_stream=fake_stream)))
+
+    items = [i async for i in provider.stream([{"role": "user", "content": "Weather?"}])]
+    assert items[0] == StreamChunk(text="Checking")
+    assert isinstance(items[1], StreamToolCall)
+    assert items[1].tool_calls[0].arguments == {"city": "Oslo"}
+    assert items[2].usage.input_tokens == 11 and items[2].usage.output_tokens == 4
+    assert isinstance(items[2], StreamDone)
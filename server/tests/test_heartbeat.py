@@ -0,0 +1,61 @@
+"""Tests for heartbeat state handling."""
+
+import asyncio
+import json
+
+import pytest
+
+
+@pytest.fixture
+def heartbeat_db(monkeypatch, tmp_path):
+    from server import db, heartbeat
+
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "conduit.db")
+    asyncio.run(db.init_db())
+    monkeypatch.setattr(heartbeat, "_sent_today", {})
+    monkeypatch.setattr(heartbeat, "_state_loaded", False)
+    return heartbeat
+
+
+@pytest.mark.asyncio
+async def test_state_survives_restart(heartbeat_db):
+    from server import db
+
+    hb = heartbeat_db
+    saved = {"_date": "2026-02-16", "morning": "2026-02-16"}
+    await db.kv_set(hb.STATE_KEY, json.dumps(saved))
+
+    await hb._load_state()
+    assert hb._sent_today == saved
+
+    hb._sent_today["evening"] = "2026-02-16"
+    await hb._save_state()
+    assert json.loads(await db.kv_get(hb.STATE_KEY))["evening"] == "2026-02-16"
+
+
+@pytest.mark.asyncio
+async def test_load_state_runs_once(heartbeat_db):
+    from server import db
+
+    hb = heartbeat_db
+    await hb._load_state()
+    await db.kv_set(hb.STATE_KEY, json.dumps({"morning": "x"}))
+    await hb._load_state()
+    assert hb._sent_today == {}
+
+
+def test_provider_ready_backoff(monkeypatch):
+    from server import config, heartbeat
+
+    class FakeProvider:
+        name = "nim"
+
+    monkeypatch.setattr(heartbeat, "_provider_failed_at", {})
+    monkeypatch.setattr(config, "PROVIDER_BACKOFF_SECONDS", 600)
+    assert heartbeat._provider_ready(FakeProvider())
+
+    heartbeat._provider_failed_at["nim"] = heartbeat.time.time() - 60
+    assert not heartbeat._provider_ready(FakeProvider())
+
+    heartbeat._provider_failed_at["nim"] = heartbeat.time.time() - 601
+    assert heartbeat._provider_ready(FakeProvider())
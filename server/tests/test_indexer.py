@@ -0,0 +1,192 @@
+"""Tests for the project indexer."""
+
+import pytest
+import yaml
+
+from server import config, indexer
+
+
+def _make_tree(root):
+    (root / "pkg").mkdir()
+    (root / "pkg" / "mod.py").write_text('"""Module docstring."""\n')
+    (root / "app.ts").write_text("// Entry point\n")
+    (root / "README.md").write_text("# Project title\n")
+    (root / "logo.png").write_bytes(b"\x89PNG")
+    (root / ".hidden").write_text("x")
+    (root / ".gitignore").write_text("*.pyc\n")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("// dep\n")
+    (root / "big.txt").write_text("x" * (indexer.LARGE_FILE_THRESHOLD + 1024))
+
+
+def test_scan_directory_structure(tmp_path):
+    _make_tree(tmp_path)
+    tree = indexer._scan_directory(tmp_path)
+
+    assert list(tree)[0] == "pkg/"  # directories sort first
+    assert tree["pkg/"] == {"mod.py": "Module docstring."}
+    assert tree["app.ts"] == "Entry point"
+    assert tree["README.md"] == "Project title"
+    assert tree[".gitignore"] == ""
+    assert tree["big.txt"] == "11KB"
+    assert "logo.png" not in tree
+    assert ".hidden" not in tree
+    assert "node_modules/" not in tree
+
+
+def test_scan_directory_skips_symlinked_dirs(tmp_path):
+    (tmp_path / "real").mkdir()
+    (tmp_path / "real" / "a.py").write_text("# a\n")
+    (tmp_path / "link").symlink_to(tmp_path / "real", target_is_directory=True)
+    tree = indexer._scan_directory(tmp_path)
+    assert tree["real/"] == {"a.py": "a"}
+    assert "link/" not in tree
+
+
+def test_count_files_prunes_skip_dirs(tmp_path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "one.py").write_text("")
+    (tmp_path / "a" / "b" / "two.py").write_text("")
+    (tmp_path / "a" / "node_modules").mkdir()
+    (tmp_path / "a" / "node_modules" / "dep.js").write_text("")
+    (tmp_path / "a" / ".git").mkdir()
+    (tmp_path / "a" / ".git" / "HEAD").write_text("")
+    assert indexer._count_files(str(tmp_path / "a")) == 2
+
+
+def test_head_lines_matches_split():
+    text = "a\nb\n\nc"
+    for n in range(6):
+        assert list(indexer._head_lines(text, n)) == text.split("\n")[:n]
+
+
+def test_python_description_fallbacks(tmp_path):
+    with_comment = tmp_path / "c.py"
+    with_comment.write_text("#!/usr/bin/env python\n# Tool entry\nimport os\n")
+    assert indexer._extract_description(str(with_comment)) == "Tool entry"
+
+    licensed = tmp_path / "d.py"
+    licensed.write_text("# Copyright\n'''Single-quoted doc.\n\nMore.'''\n")
+    assert indexer._extract_description(str(licensed)) == "Single-quoted doc."
+
+
+@pytest.mark.asyncio
+async def test_index_all_writes_each_project(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "main.py").write_text(f'"""{name} entry."""\n')
+    out = tmp_path / "out"
+    monkeypatch.setattr(config, "INDEXER_OUTPUT_DIR", str(out))
+    monkeypatch.setattr(config, "INDEXER_PROJECTS", [
+        {"name": "one", "path": str(tmp_path / "one")},
+        {"name": "two", "path": str(tmp_path / "two")},
+        {"path": "missing-name"},
+    ])
+
+    await indexer.index_all()
+
+    for name in ("one", "two"):
+        data = yaml.safe_load((out / f"{name}.yaml").read_text())
+        assert data["project"] == name
+        assert data["structure"] == {"main.py": f"{name} entry."}
+
+
+def test_write_index_round_trips_awkward_names(tmp_path):
+    data = {
+        "project": "demo",
+        "path": "/srv/my project",
+        "scanned": "2024-01-01 10:00",
+        "structure": {
+            "pkg/": {"mod.py": "Doc: with colon", "true": "", "123": "Off", "empty/": {}},
+            ".gitignore": "",
+            "a #b": "x #y",
+            "trail ": " lead",
+            "ünï.md": "ünï \u0085 \x7f \t",
+            "-x": "|y",
+            "null": "~",
+            "quote'd": '"q"',
+            "big.bin": "Binary blob | 1.2MB",
+        },
+    }
+    out = tmp_path / "demo.yaml"
+    indexer._write_index(out, data)
+    assert yaml.safe_load(out.read_text(encoding="utf-8")) == data
+    assert "big.bin: Binary blob | 1.2MB\n" in out.read_text(encoding="utf-8")
+
+
+def test_write_index_falls_back_to_pyyaml(tmp_path):
+    data = {"project": "demo", "structure": {"count": 3}}
+    out = tmp_path / "demo.yaml"
+    indexer._write_index(out, data)
+    assert yaml.safe_load(out.read_text()) == data
+
+
+def test_scan_directory_prunes_empty_subtrees(tmp_path):
+    (tmp_path / "empty" / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "only_skipped" / "node_modules").mkdir(parents=True)
+    (tmp_path / "only_skipped" / "x.pyc").write_bytes(b"")
+    (tmp_path / "keep" / "inner").mkdir(parents=True)
+    (tmp_path / "keep" / "inner" / "a.sh").write_text("# hi\n")
+    (tmp_path / "keep" / "b.txt").write_text("")
+    tree = indexer._scan_directory(tmp_path)
+    assert tree == {"keep/": {"inner/": {"a.sh": "hi"}, "b.txt": ""}}
+    assert list(tree["keep/"]) == ["inner/", "b.txt"]
+
+
+def test_scan_directory_depth_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(indexer, "MAX_DEPTH", 1)
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "c" / "f.py").write_text("")
+    (tmp_path / "a" / "b" / "g.py").write_text("")
+    tree = indexer._scan_directory(tmp_path)
+    assert tree == {"a/": {"b/": "(2 files, depth limit)"}}
+
+
+def test_only_describable_files_are_read(tmp_path, monkeypatch):
+    (tmp_path / "data.json").write_text('{"a": 1}')
+    (tmp_path / "main.go").write_text("// Package main\n")
+    (tmp_path / "empty.py").write_text("")
+    (tmp_path / "notes.md").write_text("# Notes\n")
+    read = []
+    real = indexer._extract_description
+
+    def spy(path, size=None, max_bytes=2048):
+        read.append((path.rsplit("/", 1)[-1], max_bytes))
+        return real(path, size, max_bytes)
+
+    monkeypatch.setattr(indexer, "_extract_description", spy)
+    tree = indexer._scan_directory(tmp_path)
+    assert tree == {"data.json": "", "empty.py": "", "main.go": "", "notes.md": "Notes"}
+    assert read == [("notes.md", 256)]
+    assert indexer._DESC_EXTENSIONS <= indexer.CODE_EXTENSIONS
+
+
+@pytest.mark.asyncio
+async def test_index_project_is_incremental(tmp_path, monkeypatch):
+    proj = tmp_path / "proj"
+    proj.mkdir()
+    (proj / "a.py").write_text('"""Alpha."""\n')
+    (proj / "b.py").write_text('"""Beta."""\n')
+    out = tmp_path / "out"
+    monkeypatch.setattr(config, "INDEXER_OUTPUT_DIR", str(out))
+
+    reads, writes = [], []
+    real_extract, real_write = indexer._extract_description, indexer._write_index
+    monkeypatch.setattr(indexer, "_extract_description",
+                        lambda path, *a: reads.append(path) or real_extract(path, *a))
+    monkeypatch.setattr(indexer, "_write_index",
+                        lambda *a: writes.append(1) or real_write(*a))
+
+    await indexer.index_project("proj", str(proj))
+    assert len(reads) == 2 and len(writes) == 1
+
+    # Nothing changed: no header reads, no rewrite
+    await indexer.index_project("proj", str(proj))
+    assert len(reads) == 2 and len(writes) == 1
+
+    (proj / "b.py").write_text('"""Beta, revised."""\n')
+    await indexer.index_project("proj", str(proj))
+    assert reads[2:] == [str(proj / "b.py")]
+    assert len(writes) == 2
+    data = yaml.safe_load((out / "proj.yaml").read_text())
+    assert data["structure"] == {"a.py": "Alpha.", "b.py": "Beta, revised."}
@@ -0,0 +1,171 @@
+"""Tests for memory context assembly."""
+
+import asyncio
+import json
+
+import pytest
+
+from server import memory, vectorstore
+
+
+@pytest.fixture
+def fake_store(monkeypatch):
+    calls = []
+
+    async def get_high_importance_recent(floor=None, limit=5):
+        calls.append(limit)
+        return [
+            {"id": "a", "category": "fact", "content": "Works nights"},
+            {"id": "b", "category": "preference", "content": "Likes tea"},
+        ]
+
+    async def touch(doc_id):
+        pass
+
+    monkeypatch.setattr(vectorstore, "is_available", lambda: True)
+    monkeypatch.setattr(vectorstore, "get_high_importance_recent", get_high_importance_recent)
+    monkeypatch.setattr(vectorstore, "touch", touch)
+    monkeypatch.setattr(memory, "_fallback_cache", None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_memory_context_format(fake_store):
+    ctx = await memory.get_memory_context()
+    assert ctx == (
+        "Things I remember about you:\n"
+        "\nPreferences:\n- Likes tea\n"
+        "\nFacts:\n- Works nights"
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_cached_until_store_changes(fake_store, monkeypatch):
+    await memory.get_memory_context()
+    await memory.get_memory_context()
+    assert len(fake_store) == 1
+
+    monkeypatch.setattr(vectorstore, "_version", vectorstore.version() + 1)
+    await memory.get_memory_context()
+    assert len(fake_store) == 2
+
+
+@pytest.mark.parametrize("reply, expected", [
+    ("[]", []),
+    ('[{"content": "a"}]', [{"content": "a"}]),
+    ('```json\n[{"content": "a"}]\n```', [{"content": "a"}]),
+    ('Here you go:\n[1, 2]\nHope that helps!', [1, 2]),
+    ("[1, 2]\nNote: see [docs]", [1, 2]),
+])
+def test_parse_json_array_tolerates_wrapping(reply, expected):
+    assert memory._parse_json_array(reply) == expected
+
+
+def test_parse_json_array_without_array():
+    with pytest.raises(json.JSONDecodeError):
+        memory._parse_json_array("Nothing worth remembering.")
+
+
+def test_extraction_parts_match_format():
+    p = memory._EXTRACTION_PARTS
+    assert len(p) == 4
+    assert "".join((p[0], "U {x}", p[1], "A", p[2], "CTX", p[3])) == memory.EXTRACTION_PROMPT.format(
+        user_message="U {x}", assistant_message="A", existing_context="CTX",
+    )
+
+
+def test_brain_follows_routing_changes(monkeypatch):
+    from server import config
+
+    registry = {"haiku": "H", "nim": "N"}
+    monkeypatch.setattr(memory, "_providers", registry)
+    monkeypatch.setattr(config, "BRAIN_PROVIDER", "haiku")
+    assert memory._brain() == "H"
+    monkeypatch.setattr(config, "BRAIN_PROVIDER", "nim")
+    assert memory._brain() == "N"
+    registry.clear()
+    assert memory._brain() is None
+
+
+@pytest.mark.parametrize("user, assistant, expected", [
+    ("thanks!", "You're welcome — anything else I can help with today?", True),
+    (" Ok. ", "Done.", True),
+    ("sure", "x" * 200, True),
+    ("hmm", "Alright.", True),
+    ("My sister is Ana", "Got it, I'll remember that your sister is Ana.", False),
+    ("hmm", "Your dentist appointment moved to Thursday at 3pm.", False),
+])
+def test_is_trivial_exchange(user, assistant, expected):
+    assert memory._is_trivial_exchange(user, assistant) is expected
+
+
+def test_rrf_order_boosts_shared_hits_and_keeps_ties_stable():
+    ids = ["a", "b", "c", "d"]
+    semantic = {"a": 0, "b": 1, "c": 2}
+    bm25 = {"c": 0, "d": 1}
+    # c appears in both rankings, so it outranks every single-list hit
+    assert memory._rrf_order(ids, semantic, bm25) == ["c", "a", "b", "d"]
+    assert memory._rrf_order(["x", "y"], {}, {}) == ["x", "y"]
+
+
+@pytest.mark.asyncio
+async def test_conversation_context_skips_summarized_messages(monkeypatch, tmp_path):
+    from server import db
+
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "conduit.db")
+    await db.init_db()
+    cid = await db.create_conversation()
+    await db.add_messages_bulk(cid, [("user", f"m{i}") for i in range(5)])
+    await db.add_conversation_summary(cid, "talked about m0-m2", "0-3", last_message_idx=3)
+
+    ctx = await memory.get_conversation_context(cid)
+    assert "talked about m0-m2" in ctx[0]["content"]
+    assert ctx[1]["role"] == "assistant"
+    assert [m["content"] for m in ctx[2:]] == ["m3", "m4"]
+
+
+@pytest.mark.asyncio
+async def test_embed_all_batches_once_and_falls_back(monkeypatch):
+    from server import embeddings
+
+    batches, singles = [], []
+
+    async def embed_batch(texts):
+        batches.append(list(texts))
+        return [f"vec:{t}" for t in texts]
+
+    async def embed_text(text):
+        singles.append(text)
+        return f"single:{text}"
+
+    monkeypatch.setattr(embeddings, "embed_batch", embed_batch)
+    monkeypatch.setattr(embeddings, "embed_text", embed_text)
+
+    vectors = await memory._embed_all(["a", "b", "a", None, ""])
+    assert batches == [["a", "b"]]
+    assert await memory._embedding_for("b", vectors) == "vec:b"
+    assert await memory._embedding_for("c", vectors) == "single:c"
+
+    async def broken(texts):
+        raise RuntimeError("quota")
+
+    monkeypatch.setattr(embeddings, "embed_batch", broken)
+    assert await memory._embed_all(["x"]) == {}
+    assert await memory._embedding_for("x", {}) == "single:x"
+
+
+@pytest.mark.asyncio
+async def test_fan_out_respects_limit():
+    active = peak = 0
+
+    async def call():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return "ok"
+
+    results = await memory._fan_out([call] * 10, memory.MAINTENANCE_CONCURRENCY)
+    assert results == ["ok"] * 10
+    assert peak == memory.MAINTENANCE_CONCURRENCY
@@ -0,0 +1,125 @@
+"""Tests for the local BM25 memory index."""
+
+import pytest
+
+from server import config, memory_index
+
+
+@pytest.fixture
+def index(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "BM25_ENABLED", True)
+    monkeypatch.setattr(config, "BM25_DB_PATH", str(tmp_path / "idx" / "memory_index.db"))
+    monkeypatch.setattr(memory_index, "_conn", None)
+    yield memory_index
+    memory_index.close()
+
+
+@pytest.mark.asyncio
+async def test_find_exact_ignores_case_and_whitespace(index):
+    await index.upsert("m1", "Prefers dark roast coffee", "preference")
+    assert await index.find_exact("  prefers DARK roast coffee ") == "m1"
+    assert await index.find_exact("Prefers light roast coffee") is None
+
+    await index.upsert("m1", "Prefers light roast coffee", "preference")
+    assert await index.find_exact("Prefers dark roast coffee") is None
+    assert await index.find_exact("prefers light roast coffee") == "m1"
+
+    await index.delete("m1")
+    assert await index.find_exact("Prefers light roast coffee") is None
+
+
+@pytest.mark.asyncio
+async def test_search_still_ranks(index):
+    await index.upsert("m1", "Works at the north warehouse", "fact")
+    await index.upsert("m2", "Likes hiking on weekends", "preference")
+    hits = await index.search("warehouse")
+    assert [h["doc_id"] for h in hits] == ["m1"]
+
+
+@pytest.mark.asyncio
+async def test_sync_from_firestore_rebuilds(index, monkeypatch):
+    from server import vectorstore
+
+    await index.upsert("stale", "Old memory about parking", "fact")
+
+    async def get_all(limit=500):
+        return [
+            {"id": "m1", "content": "Parks in lot C", "category": "fact"},
+            {"id": "m2", "content": "Drinks oolong", "category": "preference"},
+            {"id": "", "content": "no id"},
+        ]
+
+    monkeypatch.setattr(vectorstore, "get_all", get_all)
+    await index.sync_from_firestore()
+
+    assert [h["doc_id"] for h in await index.search("parks")] == ["m1"]
+    assert await index.find_exact("old memory about parking") is None
+    assert await index.find_exact("drinks oolong") == "m2"
+
+
+@pytest.mark.asyncio
+async def test_update_reindexes_external_content(index):
+    await index.upsert("m1", "Commutes by bicycle", "fact")
+    await index.upsert("m1", "Commutes by train", "fact")
+    assert await index.search("bicycle") == []
+    assert [h["content"] for h in await index.search("train")] == ["Commutes by train"]
+    await index.delete("m1")
+    assert await index.search("train") == []
+
+
+@pytest.mark.asyncio
+async def test_legacy_fts_layout_is_replaced(monkeypatch, tmp_path):
+    import sqlite3
+
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE VIRTUAL TABLE memory_fts USING fts5(doc_id, content, category)")
+    conn.execute("INSERT INTO memory_fts VALUES ('m1', 'legacy row', 'fact')")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setattr(config, "BM25_ENABLED", True)
+    monkeypatch.setattr(config, "BM25_DB_PATH", str(path))
+    monkeypatch.setattr(memory_index, "_conn", None)
+    try:
+        assert await memory_index.search("legacy") == []
+        await memory_index.upsert("m2", "fresh row", "fact")
+        assert [h["doc_id"] for h in await memory_index.search("fresh")] == ["m2"]
+    finally:
+        memory_index.close()
+
+
+@pytest.mark.asyncio
+async def test_calls_run_off_the_event_loop(index, monkeypatch):
+    import threading
+
+    seen = []
+    real = index._get_conn
+
+    def spy():
+        seen.append(threading.current_thread().name)
+        return real()
+
+    monkeypatch.setattr(index, "_get_conn", spy)
+    await index.upsert("m1", "Rides the ferry", "fact")
+    await index.search("ferry")
+    assert seen and all(name.startswith("bm25") for name in seen)
+
+
+@pytest.mark.asyncio
+async def test_writes_after_sync_still_reach_the_index(index, monkeypatch):
+    from server import vectorstore
+
+    async def get_all(limit=500):
+        return [{"id": "m1", "content": "Plays chess on Sundays", "category": "fact"}]
+
+    monkeypatch.setattr(vectorstore, "get_all", get_all)
+    await index.sync_from_firestore()
+    await index.sync_from_firestore()  # rebuilding twice is safe
+
+    await index.upsert("m1", "Plays go on Sundays", "fact")
+    await index.upsert("m2", "Collects chess sets", "fact")
+    assert [h["doc_id"] for h in await index.search("chess")] == ["m2"]
+    await index.delete("m2")
+    assert await index.search("chess") == []
+    index._conn.execute("INSERT INTO memory_fts (memory_fts) VALUES ('integrity-check')")
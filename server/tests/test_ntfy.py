@@ -0,0 +1,59 @@
+"""Tests for the ntfy push client."""
+
+import httpx
+import pytest
+
+from server import config, ntfy
+
+
+@pytest.fixture
+def ntfy_server(monkeypatch):
+    monkeypatch.setattr(config, "NTFY_ENABLED", True)
+    monkeypatch.setattr(config, "NTFY_SERVER", "https://ntfy.example/")
+    monkeypatch.setattr(config, "NTFY_TOPIC", "conduit")
+    monkeypatch.setattr(config, "NTFY_TOKEN", "tok")
+    sent = []
+
+    def handler(request):
+        sent.append(request)
+        return httpx.Response(200)
+
+    monkeypatch.setattr(ntfy, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_push_reuses_shared_client(ntfy_server):
+    client = ntfy._client
+    await ntfy.push("One", "first", tags=["bell"])
+    await ntfy.push("Two", "second", priority=5)
+    assert ntfy._get_client() is client
+
+    assert [str(r.url) for r in ntfy_server] == ["https://ntfy.example/conduit"] * 2
+    assert ntfy_server[0].headers["Tags"] == "bell"
+    assert ntfy_server[0].headers["Authorization"] == "Bearer tok"
+    assert ntfy_server[1].headers["Priority"] == "5"
+    assert ntfy_server[1].content == b"second"
+
+    await ntfy.close()
+    assert client.is_closed and ntfy._client is None
+
+
+@pytest.mark.asyncio
+async def test_push_nowait_sends_in_background(ntfy_server):
+    ntfy.push_nowait("Queued", "later", tags=["bell"])
+    ntfy.push_nowait("Queued 2", "later too")
+    assert ntfy_server == []  # nothing sent until the worker runs
+
+    await ntfy.close()  # drains the queue before closing
+    assert [r.headers["Title"] for r in ntfy_server] == ["Queued", "Queued 2"]
+    assert ntfy._worker_task is None
+
+
+@pytest.mark.asyncio
+async def test_push_nowait_drops_when_full(ntfy_server, monkeypatch):
+    monkeypatch.setattr(ntfy, "QUEUE_MAX", 1)
+    for i in range(3):
+        ntfy.push_nowait(f"n{i}", "body")
+    await ntfy.close()
+    assert [r.headers["Title"] for r in ntfy_server] == ["n0"]
@@ -0,0 +1,69 @@
+"""Tests for the OpenAI-compatible provider's request shape."""
+
+import json
+
+import httpx
+import openai
+import pytest
+
+from server.models.base import StreamDone
+from server.models.openai_compat import OpenAICompatProvider
+
+
+@pytest.mark.asyncio
+async def test_tools_reach_request_body():
+    sent = {}
+
+    def handler(request):
+        sent.update(json.loads(request.content))
+        return httpx.Response(200, text="data: [DONE]\n\n",
+                              headers={"content-type": "text/event-stream"})
+
+    provider = OpenAICompatProvider("nim", "http://test/v1", "key", "m")
+    provider.client = openai.AsyncOpenAI(
+        base_url="http://test/v1", api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    tools = [{"type": "function", "function": {"name": "grep", "description": "Search",
+                                               "parameters": {"type": "object", "properties": {}}}}]
+    items = [item async for item in provider.stream([{"role": "user", "content": "hi"}], tools=tools)]
+
+    assert sent["tools"] == tools
+    assert sent["stream"] is True
+    assert isinstance(items[-1], StreamDone)
+
+
+@pytest.mark.asyncio
+async def test_tool_call_deltas_are_accumulated():
+    def event(tool_calls=None, content=None):
+        delta = {"role": "assistant"}
+        if content:
+            delta["content"] = content
+        if tool_calls:
+            delta["tool_calls"] = tool_calls
+        return "data: " + json.dumps({
+            "id": "c", "object": "chat.completion.chunk", "created": 0, "model": "m",
+            "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+        }) + "\n\n"
+
+    sse = (
+        event(content="Looking")
+        + event([{"index": 0, "id": "call_1", "function": {"name": "grep", "arguments": '{"q": '}}])
+        + event([{"index": 1, "id": "call_2", "function": {"name": "ls", "arguments": ""}}])
+        + event([{"index": 0, "function": {"arguments": '"café"}'}}])
+        + "data: [DONE]\n\n"
+    )
+    provider = OpenAICompatProvider("nim", "http://test/v1", "key", "m")
+    provider.client = openai.AsyncOpenAI(
+        base_url="http://test/v1", api_key="key",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, text=sse, headers={"content-type": "text/event-stream"}),
+        )),
+    )
+    items = [item async for item in provider.stream([{"role": "user", "content": "hi"}])]
+
+    calls = items[-2].tool_calls
+    assert [(c.id, c.name, c.arguments) for c in calls] == [
+        ("call_1", "grep", {"q": "café"}),
+        ("call_2", "ls", {}),
+    ]
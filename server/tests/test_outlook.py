@@ -0,0 +1,175 @@
+"""Tests for the Outlook Graph client."""
+
+import httpx
+import pytest
+
+from server import outlook
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Route Graph calls to canned JSON by path; returns (routes, requests seen)."""
+    routes: dict[str, dict | str] = {}
+    seen: list[httpx.Request] = []
+
+    def handler(request):
+        seen.append(request)
+        body = routes.get(request.url.path, {})
+        if isinstance(body, str):
+            return httpx.Response(200, text=body)
+        return httpx.Response(200, json=body)
+
+    monkeypatch.setattr(outlook, "get_access_token", lambda: "tok")
+    monkeypatch.setattr(outlook, "_graph_client", httpx.AsyncClient(
+        base_url=outlook.GRAPH_BASE, transport=httpx.MockTransport(handler),
+    ))
+    return routes, seen
+
+
+@pytest.mark.asyncio
+async def test_graph_calls_share_one_client(graph):
+    routes, seen = graph
+    routes["/v1.0/me/mailFolders/inbox/messages"] = {"value": [{"id": "m1"}]}
+    routes["/v1.0/me/mailFolders/inbox/messages/$count"] = "\ufeff4"
+    client = outlook._graph_client
+
+    assert await outlook.get_inbox(count=3, unread_only=True) == [{"id": "m1"}]
+    assert await outlook.get_unread_count() == 4
+    assert outlook._get_graph_client() is client
+
+    inbox = seen[0]
+    assert str(inbox.url).startswith("https://graph.microsoft.com/v1.0/me/mailFolders/inbox/messages?")
+    assert inbox.url.params["$top"] == "3"
+    assert inbox.url.params["$filter"] == "isRead eq false"
+    assert inbox.headers["Authorization"] == "Bearer tok"
+
+    count = seen[1]
+    assert count.url.params["$filter"] == "isRead eq false"
+    assert count.headers["ConsistencyLevel"] == "eventual"
+
+    await outlook.close()
+    assert client.is_closed and outlook._graph_client is None
+
+
+@pytest.mark.asyncio
+async def test_inbox_and_unread_in_one_batch(graph):
+    import json
+
+    routes, seen = graph
+    routes["/v1.0/$batch"] = {"responses": [
+        {"id": "unread", "status": 200, "body": {"unreadItemCount": 2}},
+        {"id": "inbox", "status": 200, "body": {"value": [{"id": "m1"}, {"id": "m2"}]}},
+    ]}
+
+    messages, unread = await outlook.get_inbox_and_unread(count=5, unread_only=True)
+    assert (messages, unread) == ([{"id": "m1"}, {"id": "m2"}], 2)
+
+    (batch,) = seen
+    assert batch.method == "POST"
+    subs = {r["id"]: r for r in json.loads(batch.content)["requests"]}
+    assert subs["unread"]["url"] == "/me/mailFolders/inbox?$select=unreadItemCount"
+    assert subs["inbox"]["url"].startswith("/me/mailFolders/inbox/messages?$top=5&")
+    assert "$filter=isRead%20eq%20false" in subs["inbox"]["url"]
+
+
+@pytest.mark.asyncio
+async def test_batch_drops_failed_subrequests(graph):
+    routes, _ = graph
+    routes["/v1.0/$batch"] = {"responses": [
+        {"id": "inbox", "status": 429, "body": {"error": {"code": "TooManyRequests"}}},
+        {"id": "unread", "status": 200, "body": {"unreadItemCount": 7}},
+    ]}
+    assert await outlook.get_inbox_and_unread() == ([], 7)
+
+
+def test_access_token_reused_until_expiry(monkeypatch):
+    calls = []
+
+    class FakeApp:
+        def get_accounts(self):
+            return [{"username": "me"}]
+
+        def acquire_token_silent(self, scopes, account):
+            calls.append(scopes)
+            return {"access_token": f"tok{len(calls)}", "expires_in": 3600}
+
+    now = [1000.0]
+    monkeypatch.setattr(outlook.time, "time", lambda: now[0])
+    monkeypatch.setattr(outlook, "_get_app", lambda: FakeApp())
+    monkeypatch.setattr(outlook, "_access_token", None)
+    monkeypatch.setattr(outlook, "_access_token_exp", 0)
+
+    assert outlook.get_access_token() == "tok1"
+    assert outlook.get_access_token() == "tok1"
+    assert len(calls) == 1
+
+    now[0] += 3600 - 30  # inside the refresh buffer
+    assert outlook.get_access_token() == "tok2"
+    assert len(calls) == 2
+
+
+
+@pytest.mark.asyncio
+async def test_inbox_delta_follows_and_keeps_links(monkeypatch):
+    base = outlook.GRAPH_BASE + "/me/mailFolders/inbox/messages/delta"
+    pages = iter([
+        {"value": [{"id": "m1"}], "@odata.nextLink": base + "?$skiptoken=p2"},
+        {"value": [{"id": "m2"}], "@odata.deltaLink": base + "?$deltatoken=d1"},
+        {"value": [{"id": "m1", "@removed": {"reason": "deleted"}}],
+         "@odata.deltaLink": base + "?$deltatoken=d2"},
+    ])
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=next(pages))
+
+    monkeypatch.setattr(outlook, "get_access_token", lambda: "tok")
+    monkeypatch.setattr(outlook, "_inbox_delta_link", None)
+    monkeypatch.setattr(outlook, "_graph_client", httpx.AsyncClient(
+        base_url=outlook.GRAPH_BASE, transport=httpx.MockTransport(handler),
+    ))
+
+    # First call walks to the deltaLink and returns the current inbox
+    assert await outlook.get_inbox_delta() == [{"id": "m1"}, {"id": "m2"}]
+    assert "$select" in seen[0].url.params
+    assert seen[0].headers["Prefer"] == "odata.maxpagesize=50"
+    assert dict(seen[1].url.params) == {"$skiptoken": "p2"}
+    assert outlook._inbox_delta_link == base + "?$deltatoken=d1"
+
+    # Later calls only see what changed
+    assert await outlook.get_inbox_delta() == [{"id": "m1", "@removed": {"reason": "deleted"}}]
+    assert dict(seen[2].url.params) == {"$deltatoken": "d1"}
+    assert outlook._inbox_delta_link == base + "?$deltatoken=d2"
+    await outlook.close()
+
+
+@pytest.mark.asyncio
+async def test_search_messages_iter_pages_lazily(monkeypatch):
+    base = outlook.GRAPH_BASE + "/me/messages"
+    pages = iter([
+        {"value": [{"id": "a"}, {"id": "b"}], "@odata.nextLink": base + "?$skiptoken=2"},
+        {"value": [{"id": "c"}, {"id": "d"}], "@odata.nextLink": base + "?$skiptoken=3"},
+    ])
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json=next(pages))
+
+    monkeypatch.setattr(outlook, "get_access_token", lambda: "tok")
+    monkeypatch.setattr(outlook, "_graph_client", httpx.AsyncClient(
+        base_url=outlook.GRAPH_BASE, transport=httpx.MockTransport(handler),
+    ))
+
+    results = outlook.search_messages_iter("invoice", limit=3, page_size=2)
+    assert (await anext(results))["id"] == "a"
+    assert len(seen) == 1  # later pages aren't fetched until needed
+    assert [m["id"] async for m in results] == ["b", "c"]
+
+    assert len(seen) == 2  # stopped at the limit without chasing the next link
+    assert seen[0].url.params["$search"] == '"invoice"'
+    assert seen[0].url.params["$top"] == "2"
+    assert seen[0].headers["ConsistencyLevel"] == "eventual"
+    assert dict(seen[1].url.params) == {"$skiptoken": "2"}
+    await outlook.close()
@@ -159,3 +159,165 @@ async def test_dispatch_hook_no_handlers():
     _hooks.clear()
     result = await dispatch_hook("nonexistent_event")
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_dispatch_hook_runs_handlers_concurrently():
+    """Handlers overlap, errors are isolated, and later handlers still win merges."""
+    import asyncio
+
+    from server.plugins import dispatch_hook, _hooks
+
+    started = []
+
+    async def slow(**kwargs):
+        started.append("slow")
+        await asyncio.sleep(0.05)
+        started.append("slow done")
+        return {"system_prompt": "slow", "a": 1}
+
+    async def broken(**kwargs):
+        raise RuntimeError("boom")
+
+    def not_async(**kwargs):
+        return {"ignored": True}
+
+    async def fast(**kwargs):
+        started.append("fast")
+        return {"system_prompt": "fast"}
+
+    _hooks.clear()
+    _hooks["before_agent_start"] = [slow, broken, not_async, fast]
+    result = await asyncio.wait_for(dispatch_hook("before_agent_start"), 1)
+    _hooks.clear()
+
+    assert started == ["slow", "fast", "slow done"]
+    assert result == {"system_prompt": "fast", "a": 1}
+
+
+def test_load_all_plugins_builds_hook_tuples(tmp_plugins_dir, sample_plugin_manifest, monkeypatch):
+    """Hooks from several plugins land on the bus as one tuple, in load order."""
+    from server import plugins
+
+    monkeypatch.setattr(plugins, "_hooks", {})
+    monkeypatch.setattr(plugins, "_loaded_plugins", [])
+    init_code = (
+        "async def on_start(**kw):\n    return {'by': __name__}\n\n"
+        "def register(api):\n    api.register_hook('before_agent_start', on_start)\n"
+    )
+    for pid in ("alpha", "beta"):
+        _make_plugin(tmp_plugins_dir, pid, {**sample_plugin_manifest, "id": pid}, init_code)
+
+    plugins.load_all_plugins(str(tmp_plugins_dir))
+    handlers = plugins._hooks["before_agent_start"]
+    assert isinstance(handlers, tuple)
+    assert [h.__module__ for h in handlers] == ["_conduit_plugin_alpha", "_conduit_plugin_beta"]
+
+
+def test_discover_plugins_reuses_parsed_manifests(tmp_plugins_dir, sample_plugin_manifest, monkeypatch):
+    """Unchanged manifests are served from cache; an mtime bump re-parses."""
+    import os
+
+    from server import plugins
+
+    monkeypatch.setattr(plugins, "_manifest_cache", {})
+    _make_plugin(tmp_plugins_dir, "test-plugin", sample_plugin_manifest, "def register(api): pass")
+    (tmp_plugins_dir / "stray.txt").write_text("not a plugin")
+
+    parses = []
+    real_loads = plugins._loads
+    monkeypatch.setattr(plugins, "_loads", lambda data: parses.append(1) or real_loads(data))
+
+    first = plugins.discover_plugins(str(tmp_plugins_dir))
+    first[0]["version"] = "mutated by caller"
+    second = plugins.discover_plugins(str(tmp_plugins_dir))
+    assert len(parses) == 1
+    assert second[0]["version"] == "1.0.0"
+    assert second[0]["_path"] == str(tmp_plugins_dir / "test-plugin")
+
+    manifest_path = tmp_plugins_dir / "test-plugin" / "plugin.json"
+    manifest_path.write_text(json.dumps({**sample_plugin_manifest, "version": "2.0.0"}))
+    st = manifest_path.stat()
+    os.utime(manifest_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert plugins.discover_plugins(str(tmp_plugins_dir))[0]["version"] == "2.0.0"
+    assert len(parses) == 2
+
+
+def test_load_all_plugins_touches_sys_path_once(tmp_plugins_dir, sample_plugin_manifest, monkeypatch):
+    """The plugins dir goes on sys.path once for the batch and is removed after."""
+    import sys
+
+    from server import plugins
+
+    class _Path(list):
+        inserts = 0
+
+        def insert(self, i, item):
+            _Path.inserts += 1
+            super().insert(i, item)
+
+    monkeypatch.setattr(sys, "path", _Path(sys.path))
+    monkeypatch.setattr(plugins, "_hooks", {})
+    monkeypatch.setattr(plugins, "_loaded_plugins", [])
+    init_code = "import sys\nSEEN = list(sys.path)\n\ndef register(api):\n    pass\n"
+    for pid in ("one", "two", "three"):
+        _make_plugin(tmp_plugins_dir, pid, {**sample_plugin_manifest, "id": pid}, init_code)
+
+    plugins.load_all_plugins(str(tmp_plugins_dir))
+    assert _Path.inserts == 1
+    assert str(tmp_plugins_dir) in sys.modules["_conduit_plugin_three"].SEEN
+    assert str(tmp_plugins_dir) not in sys.path
+    assert len(plugins.get_loaded_plugins()) == 3
+
+
+def test_load_plugin_uses_given_manifest(tmp_plugins_dir, sample_plugin_manifest):
+    """A pre-parsed manifest is used as-is; plugin.json is only needed without one."""
+    from server.plugins import load_plugin
+
+    _make_plugin(tmp_plugins_dir, "test-plugin", sample_plugin_manifest,
+                 "def register(api):\n    api.register_skill(api.id, 'd', 'b')\n")
+    (tmp_plugins_dir / "test-plugin" / "plugin.json").unlink()
+
+    assert load_plugin(tmp_plugins_dir / "test-plugin") is None
+    result = load_plugin(tmp_plugins_dir / "test-plugin", manifest={"id": "preparsed"})
+    assert result is not None
+    assert result[2][0]["name"] == "preparsed"
+
+
+def test_plugin_api_log_formats_lazily(caplog):
+    """PluginAPI.log prefixes the plugin id and leaves formatting to logging."""
+    import logging
+
+    from server.plugins import PluginAPI
+
+    api = PluginAPI(id="test", config={})
+    with caplog.at_level(logging.INFO, logger="server.plugins"):
+        api.log("hello %s")
+        api.log("hidden", level="debug")
+    (record,) = caplog.records
+    assert record.getMessage() == "[plugin:test] hello %s"
+    assert record.args == ("test", "hello %s")
+
+
+@pytest.mark.asyncio
+async def test_dispatch_hook_traceback_only_at_debug(caplog):
+    """Handler errors log a one-liner; the traceback is attached at DEBUG only."""
+    import logging
+
+    from server.plugins import dispatch_hook, _hooks
+
+    async def broken(**kwargs):
+        raise ValueError("bad input")
+
+    _hooks.clear()
+    _hooks["on_message"] = (broken,)
+    with caplog.at_level(logging.INFO, logger="server.plugins"):
+        await dispatch_hook("on_message")
+    with caplog.at_level(logging.DEBUG, logger="server.plugins"):
+        await dispatch_hook("on_message")
+    _hooks.clear()
+
+    quiet, verbose = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert quiet.getMessage() == "Hook handler error for on_message: ValueError('bad input')"
+    assert quiet.exc_info is None
+    assert verbose.exc_info[0] is ValueError
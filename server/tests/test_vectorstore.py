@@ -0,0 +1,66 @@
+"""Tests for vectorstore caching that doesn't need a live Firestore."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from server import vectorstore
+
+
+class _FakeCountQuery:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def get(self):
+        self.calls.append(1)
+        return [[SimpleNamespace(value=42)]]
+
+
+@pytest.mark.asyncio
+async def test_count_reruns_only_after_writes(monkeypatch):
+    calls = []
+    collection = SimpleNamespace(count=lambda: _FakeCountQuery(calls))
+    monkeypatch.setattr(vectorstore, "_db", SimpleNamespace(collection=lambda name: collection))
+    monkeypatch.setattr(vectorstore, "_count_cache", None)
+
+    assert await vectorstore.count() == 42
+    assert await vectorstore.count() == 42
+    assert len(calls) == 1
+
+    monkeypatch.setattr(vectorstore, "_version", vectorstore.version())
+    vectorstore._bump()
+    assert await vectorstore.count() == 42
+    assert len(calls) == 2
+
+
+class _FakeQuery:
+    def __init__(self, docs, selected):
+        self.docs = docs
+        self.selected = selected
+
+    def select(self, fields):
+        self.selected.extend(fields)
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        return self
+
+    async def get(self):
+        return self.docs
+
+
+@pytest.mark.asyncio
+async def test_get_all_projects_away_embedding(monkeypatch):
+    doc = SimpleNamespace(
+        id="m1",
+        to_dict=lambda: {"content": "Drinks oolong", "embedding": [0.1] * 4},
+    )
+    selected = []
+    collection = _FakeQuery([doc], selected)
+    monkeypatch.setattr(vectorstore, "_db", SimpleNamespace(collection=lambda name: collection))
+
+    assert await vectorstore.get_all() == [{"content": "Drinks oolong", "id": "m1"}]
+    assert "embedding" not in selected and "content" in selected
@@ -3,6 +3,7 @@
 import logging
 import os
 import time
+from collections.abc import Sequence
 
 from google.cloud.firestore import AsyncClient
 from google.cloud.firestore_v1.base_query import FieldFilter
@@ -18,6 +19,28 @@ _available = False
 
 COLLECTION = "memories"
 
+# Fields a memory record carries back to callers. Plain queries project onto
+# these so the 768-float embedding is never sent over the wire or decoded.
+_RECORD_FIELDS = (
+    "category", "content", "importance", "source_conversation",
+    "created_at", "last_accessed", "access_count",
+)
+
+# Bumped on every write so callers can cache views derived from the collection
+_version = 0
+# (version, count) from the last aggregation query
+_count_cache: tuple[int, int] | None = None
+
+
+def version() -> int:
+    """Write counter for this process; changes whenever a memory is modified."""
+    return _version
+
+
+def _bump():
+    global _version
+    _version += 1
+
 
 async def init() -> bool:
     """Create AsyncClient and verify connection. Returns True if successful."""
@@ -48,13 +71,21 @@ async def close():
         _available = False
 
 
+def _record(doc) -> dict:
+    """Flatten a snapshot into the dict shape callers use, minus the vector."""
+    data = doc.to_dict()
+    data["id"] = doc.id
+    data.pop("embedding", None)
+    return data
+
+
 def is_available() -> bool:
     """Check if Firestore is reachable."""
     return _available and _db is not None
 
 
 async def upsert_memory(doc_id: str, category: str, content: str,
-                        embedding: list[float], importance: int,
+                        embedding: Sequence[float], importance: int,
                         source_conversation: str | None = None,
                         created_at: float | None = None):
     """Create or update a memory document."""
@@ -71,13 +102,14 @@ async def upsert_memory(doc_id: str, category: str, content: str,
         "last_accessed": None,
         "access_count": 0,
     })
+    _bump()
 
     # Write-through to BM25 index
     from . import memory_index
-    memory_index.upsert(doc_id, content, category)
+    await memory_index.upsert(doc_id, content, category)
 
 
-async def vector_search(query_embedding: list[float],
+async def vector_search(query_embedding: Sequence[float],
                         top_k: int | None = None) -> list[dict]:
     """KNN vector search. Returns top-K most similar memories."""
     if not _db:
@@ -94,10 +126,7 @@ async def vector_search(query_embedding: list[float],
         docs = await query.get()
         results = []
         for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)  # Don't return the vector
-            results.append(data)
+            results.append(_record(doc))
         return results
     except Exception as e:
         log.error("Vector search failed: %s", e)
@@ -110,12 +139,9 @@ async def get_by_id(doc_id: str) -> dict | None:
         return None
     try:
         doc_ref = _db.collection(COLLECTION).document(doc_id)
-        doc = await doc_ref.get()
+        doc = await doc_ref.get(field_paths=_RECORD_FIELDS)
         if doc.exists:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)
-            return data
+            return _record(doc)
         return None
     except Exception as e:
         log.debug("get_by_id failed for %s: %s", doc_id, e)
@@ -131,16 +157,14 @@ async def get_high_importance(floor: int | None = None,
     try:
         collection = _db.collection(COLLECTION)
         query = (collection
+                 .select(_RECORD_FIELDS)
                  .where(filter=FieldFilter("importance", ">=", floor))
                  .order_by("importance", direction="DESCENDING")
                  .limit(limit))
         docs = await query.get()
         results = []
         for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)
-            results.append(data)
+            results.append(_record(doc))
         return results
     except Exception as e:
         log.error("High importance query failed: %s", e)
@@ -162,6 +186,7 @@ async def get_high_importance_recent(floor: int | None = None,
         collection = _db.collection(COLLECTION)
         # Fetch more than needed so we can re-rank
         query = (collection
+                 .select(_RECORD_FIELDS)
                  .where(filter=FieldFilter("importance", ">=", floor))
                  .order_by("importance", direction="DESCENDING")
                  .limit(limit * 4))
@@ -170,10 +195,7 @@ async def get_high_importance_recent(floor: int | None = None,
         now = time.time()
         scored = []
         for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)
-
+            data = _record(doc)
             importance = data.get("importance", 5)
             # Use last_accessed if available, otherwise created_at
             ts = data.get("last_accessed") or data.get("created_at") or 0
@@ -202,22 +224,20 @@ async def get_all(limit: int = 500) -> list[dict]:
     try:
         collection = _db.collection(COLLECTION)
         query = (collection
+                 .select(_RECORD_FIELDS)
                  .order_by("importance", direction="DESCENDING")
                  .limit(limit))
         docs = await query.get()
         results = []
         for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)
-            results.append(data)
+            results.append(_record(doc))
         return results
     except Exception as e:
         log.error("Get all memories failed: %s", e)
         return []
 
 
-async def find_similar(embedding: list[float],
+async def find_similar(embedding: Sequence[float],
                        threshold: float | None = None) -> dict | None:
     """Find the most similar memory above threshold. Returns it or None."""
     if not _db:
@@ -279,6 +299,7 @@ async def reinforce(doc_id: str, importance: int):
             "access_count": transforms.Increment(1),
             "importance": importance,
         })
+        _bump()
     except Exception as e:
         log.debug("Reinforce failed for %s: %s", doc_id, e)
 
@@ -292,6 +313,7 @@ async def decay(doc_id: str, new_importance: int):
         await doc_ref.update({
             "importance": new_importance,
         })
+        _bump()
     except Exception as e:
         log.debug("Decay failed for %s: %s", doc_id, e)
 
@@ -302,11 +324,12 @@ async def update_fields(doc_id: str, fields: dict):
         return
     try:
         from google.cloud.firestore_v1.vector import Vector
-        # Convert raw embedding lists to Vector objects
-        if "embedding" in fields and isinstance(fields["embedding"], list):
+        # Convert raw embedding lists/arrays to Vector objects
+        if "embedding" in fields and not isinstance(fields["embedding"], Vector):
             fields["embedding"] = Vector(fields["embedding"])
         doc_ref = _db.collection(COLLECTION).document(doc_id)
         await doc_ref.update(fields)
+        _bump()
     except Exception as e:
         log.error("Update fields failed for %s: %s", doc_id, e)
 
@@ -326,29 +349,25 @@ async def get_stale_memories(days: int = 14, limit: int = 50) -> list[dict]:
         # Firestore doesn't support OR queries well, so we do two passes
         # Pass 1: memories with last_accessed < cutoff
         query = (collection
+                 .select(_RECORD_FIELDS)
                  .where(filter=FieldFilter("last_accessed", "<", cutoff))
                  .order_by("last_accessed")
                  .limit(limit))
         docs = await query.get()
         for doc in docs:
-            data = doc.to_dict()
-            data["id"] = doc.id
-            data.pop("embedding", None)
-            results.append(data)
+            results.append(_record(doc))
 
         # Pass 2: memories with last_accessed == None (never accessed)
         # and created_at < cutoff
         if len(results) < limit:
             query2 = (collection
+                      .select(_RECORD_FIELDS)
                       .where(filter=FieldFilter("last_accessed", "==", None))
                       .where(filter=FieldFilter("created_at", "<", cutoff))
                       .limit(limit - len(results)))
             docs2 = await query2.get()
             for doc in docs2:
-                data = doc.to_dict()
-                data["id"] = doc.id
-                data.pop("embedding", None)
-                results.append(data)
+                results.append(_record(doc))
 
         return results
 
@@ -364,23 +383,33 @@ async def delete(doc_id: str):
     try:
         doc_ref = _db.collection(COLLECTION).document(doc_id)
         await doc_ref.delete()
+        _bump()
 
         # Delete from BM25 index
         from . import memory_index
-        memory_index.delete(doc_id)
+        await memory_index.delete(doc_id)
     except Exception as e:
         log.error("Delete failed for %s: %s", doc_id, e)
 
 
 async def count() -> int:
-    """Count total memories."""
+    """Count total memories.
+
+    The aggregation query only reruns after a write (see version()).
+    """
+    global _count_cache
     if not _db:
         return 0
+    if _count_cache and _count_cache[0] == _version:
+        return _count_cache[1]
     try:
+        seen_version = _version
         collection = _db.collection(COLLECTION)
         query = collection.count()
         result = await query.get()
-        return result[0][0].value if result and result[0] else 0
+        total = result[0][0].value if result and result[0] else 0
+        _count_cache = (seen_version, total)
+        return total
     except Exception as e:
         log.error("Count failed: %s", e)
         return 0
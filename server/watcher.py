@@ -248,7 +248,7 @@ async def _notify_all(title: str, body: str, tags: list[str] | None = None, prio
     """Push notification to WS, ntfy, and Telegram."""
     if _manager:
         await _manager.push(content=f"**{title}**\n{body}", title=title)
-    await ntfy.push(title=title, body=body, tags=tags or ["file_folder"], priority=priority)
+    ntfy.push_nowait(title=title, body=body, tags=tags or ["file_folder"], priority=priority)
     await tg_module.push(title=title, body=body)
 
 
@@ -9,6 +9,7 @@ Worker state lives in JSON files under data/worker/, separate from main memory.
 
 import json
 import logging
+import re
 import time
 from pathlib import Path
 
@@ -29,6 +30,9 @@ PRESENTING = "PRESENTING"
 _WAITING_STATES = {PROPOSING, PLAN_REVIEW, PRESENTING}
 _ALL_STATES = {IDLE, SCOUTING, IDEATING, PROPOSING, PLANNING, PLAN_REVIEW, BUILDING, PRESENTING}
 
+# Opening fence line (with any language tag) and closing fence of a reply
+_FENCE_RE = re.compile(r"\A```[^\n]*\n?|```\Z")
+
 # --- State persistence ---
 
 def _data_dir() -> Path:
@@ -370,12 +374,7 @@ async def _ideate(state: dict, manager) -> dict:
         await db.log_usage(provider.name, provider.model, usage.input_tokens, usage.output_tokens)
 
         # Parse ideas
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
+        text = _FENCE_RE.sub("", response.strip()).strip()
 
         raw_ideas = json.loads(text)
         if not isinstance(raw_ideas, list):
@@ -441,7 +440,7 @@ async def _propose(state: dict, manager) -> None:
 
     # Push via ntfy
     from . import ntfy
-    await ntfy.push(title="Worker Proposal", body=body, tags=["bulb", "worker"], priority=3)
+    ntfy.push_nowait(title="Worker Proposal", body=body, tags=["bulb", "worker"], priority=3)
 
     # Push via Telegram if available
     try:
@@ -512,7 +511,7 @@ async def _plan(state: dict, manager) -> dict:
     body = f"Plan ready for **{name}**:\n\n{summary}\n\nReply: approve / needs changes / reject"
 
     from . import ntfy
-    await ntfy.push(title="Worker Plan Review", body=body[:500], tags=["clipboard", "worker"], priority=3)
+    ntfy.push_nowait(title="Worker Plan Review", body=body[:500], tags=["clipboard", "worker"], priority=3)
 
     try:
         from . import telegram
@@ -598,7 +597,7 @@ async def _build(state: dict, manager) -> dict:
     )
 
     from . import ntfy
-    await ntfy.push(title="Worker: Feature Ready", body=body[:500], tags=["rocket", "worker"], priority=4)
+    ntfy.push_nowait(title="Worker: Feature Ready", body=body[:500], tags=["rocket", "worker"], priority=4)
 
     try:
         from . import telegram
@@ -753,7 +752,7 @@ def _add_to_history(idea: dict) -> None:
 async def _notify(title: str, body: str, tags: list[str] | None = None) -> None:
     """Push a notification via ntfy + Telegram."""
     from . import ntfy
-    await ntfy.push(title=title, body=body, tags=tags or [], priority=3)
+    ntfy.push_nowait(title=title, body=body, tags=tags or [], priority=3)
     try:
         from . import telegram
         await telegram.push(title=title, body=body)